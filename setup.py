@@ -35,10 +35,14 @@ setup(
             "pytest>=7.4.0",
             "hypothesis>=6.82.0",
             "pytest-cov>=4.1.0",
+            "pytest-xdist>=3.3.0",
         ],
         "llm": [
             "ollama>=0.1.0",  # Optional: Quality evaluation (scoring only, no auto-correction)
         ],
+        "cchardet": [
+            "faust-cchardet>=2.1.19",  # Optional: Faster byte-level encoding detection
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -56,6 +56,8 @@ class ConversionConfig:
         log_file: Log file path
         max_file_size_mb: Maximum file size in MB
         batch_mode: Batch conversion mode
+        enable_parse_cache: Reuse parse results for unchanged input files
+        legacy_serializer: Serialize and pretty-print in separate passes
         enable_proofread: Enable proofreading
         proofread_mode: Proofreading mode (auto/interactive/dry-run)
         proofread_model: LLM model for proofreading
@@ -94,6 +96,8 @@ class ConversionConfig:
     # Performance options
     max_file_size_mb: int = 100
     batch_mode: bool = False
+    enable_parse_cache: bool = False
+    legacy_serializer: bool = False
 
     # Proofreading options
     enable_proofread: bool = False
@@ -345,3 +349,5 @@ class ConfigManager:
             f.write("# Performance options\n")
             f.write("max_file_size_mb: 100  # Maximum file size in MB\n")
             f.write("batch_mode: false  # Batch conversion mode\n")
+            f.write("enable_parse_cache: false  # Reuse parse results for unchanged inputs\n")
+            f.write("legacy_serializer: false  # Serialize and pretty-print in separate passes\n")
@@ -5,10 +5,11 @@ the entire conversion process including validation, parsing, serialization,
 and output writing.
 """
 
+import io
 import os
 import time
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from src.config import ConversionConfig
 from src.file_validator import FileValidator, ValidationResult, ErrorType
@@ -18,6 +19,7 @@ from src.markdown_serializer import MarkdownSerializer
 from src.markdown_validator import MarkdownValidator
 from src.pretty_printer import PrettyPrinter
 from src.output_writer import OutputWriter
+from src.render import MarkdownRenderer
 
 
 @dataclass
@@ -88,12 +90,21 @@ class ConversionOrchestrator:
         
         # Initialize components
         self.validator = FileValidator(max_size_mb=config.max_file_size_mb)
-        self.router = FormatRouter(logger=logger.logger)  # Pass the underlying logger
+        parse_cache_options = None
+        if config.enable_parse_cache:
+            from src.parser_cache import cache_options
+            parse_cache_options = cache_options(config)
+        self.router = FormatRouter(
+            logger=logger.logger,  # Pass the underlying logger
+            enable_cache=config.enable_parse_cache,
+            cache_options=parse_cache_options
+        )
         self.serializer = MarkdownSerializer(
             heading_offset=config.heading_offset,
             include_metadata=config.include_metadata
         )
         self.pretty_printer = PrettyPrinter()
+        self.renderer = MarkdownRenderer(self.serializer, self.pretty_printer)
         self.output_writer = OutputWriter()
         
         # Initialize markdown validator if validation is enabled
@@ -102,18 +113,19 @@ class ConversionOrchestrator:
             try:
                 self.markdown_validator = MarkdownValidator()
             except ImportError as e:
-                logger.warning(f"Markdown validation disabled: {str(e)}")
+                logger.warning("Markdown validation disabled: %s", e)
                 self.markdown_validator = None
     
-    def convert(self, input_path: str) -> ConversionResult:
+    def convert(self, input_path: Union[str, os.PathLike]) -> ConversionResult:
         """Convert a document to Markdown format.
         
         Args:
-            input_path: Path to the input document
+            input_path: Path to the input document (str or path-like)
             
         Returns:
             ConversionResult with conversion status and details
         """
+        input_path = os.fspath(input_path)
         start_time = time.time()
         result = ConversionResult(
             success=False,
@@ -136,7 +148,7 @@ class ConversionOrchestrator:
                 self.logger.error(error_msg)
                 return result
             
-            self.logger.info(f"File validated successfully: {validation_result.file_format.value}")
+            self.logger.info("File validated successfully: %s", validation_result.file_format.value)
             
             # Step 2: Get appropriate parser
             self.logger.debug("Selecting parser for file format")
@@ -159,8 +171,8 @@ class ConversionOrchestrator:
                 )
                 result.stats.total_images = len(internal_doc.images)
                 
-                self.logger.debug(f"Document has {len(internal_doc.images)} images")
-                self.logger.debug(f"Config extract_images: {self.config.extract_images}")
+                self.logger.debug("Document has %d images", len(internal_doc.images))
+                self.logger.debug("Config extract_images: %s", self.config.extract_images)
                 
                 # Count tables
                 from src.internal_representation import Table
@@ -171,7 +183,7 @@ class ConversionOrchestrator:
                 
                 # Step 3.5: Extract images if enabled
                 if self.config.extract_images and internal_doc.images:
-                    self.logger.info(f"Extracting {len(internal_doc.images)} images")
+                    self.logger.info("Extracting %d images", len(internal_doc.images))
                     try:
                         from src.image_extractor import ImageExtractor
                         from pathlib import Path
@@ -188,7 +200,7 @@ class ConversionOrchestrator:
                             try:
                                 from src.diagram_converter import DiagramConverter
                                 diagram_converter = DiagramConverter(model=self.config.diagram_model)
-                                self.logger.info(f"Diagram conversion enabled with model: {self.config.diagram_model}")
+                                self.logger.info("Diagram conversion enabled with model: %s", self.config.diagram_model)
                             except Exception as e:
                                 warning_msg = f"Failed to initialize diagram converter: {str(e)}"
                                 result.warnings.append(warning_msg)
@@ -217,7 +229,7 @@ class ConversionOrchestrator:
                         )
                         
                         result.stats.images_extracted = len(extracted_images)
-                        self.logger.info(f"Extracted {len(extracted_images)} images")
+                        self.logger.info("Extracted %d images", len(extracted_images))
                         
                     except Exception as e:
                         warning_msg = f"Image extraction failed: {str(e)}"
@@ -245,24 +257,38 @@ class ConversionOrchestrator:
             
             # Step 4: Serialize to Markdown
             self.logger.info("Serializing to Markdown")
-            try:
-                markdown_content = self.serializer.serialize(internal_doc)
-                self.logger.debug(f"Serialized {len(markdown_content)} characters")
-            except Exception as e:
-                error_msg = f"Failed to serialize to Markdown: {str(e)}"
-                result.errors.append(error_msg)
-                self.logger.error(error_msg, exception=e)
-                return result
-            
-            # Step 5: Pretty print
-            self.logger.debug("Formatting Markdown output")
-            try:
-                markdown_content = self.pretty_printer.format(markdown_content)
-            except Exception as e:
-                # Pretty printing failure is not critical
-                warning_msg = f"Pretty printing failed, using unformatted output: {str(e)}"
-                result.warnings.append(warning_msg)
-                self.logger.warning(warning_msg)
+            if self.config.legacy_serializer:
+                try:
+                    markdown_content = self.serializer.serialize(internal_doc)
+                    self.logger.debug("Serialized %d characters", len(markdown_content))
+                except Exception as e:
+                    error_msg = f"Failed to serialize to Markdown: {str(e)}"
+                    result.errors.append(error_msg)
+                    self.logger.error(error_msg, exception=e)
+                    return result
+                
+                # Step 5: Pretty print
+                self.logger.debug("Formatting Markdown output")
+                try:
+                    markdown_content = self.pretty_printer.format(markdown_content)
+                except Exception as e:
+                    # Pretty printing failure is not critical
+                    warning_msg = f"Pretty printing failed, using unformatted output: {str(e)}"
+                    result.warnings.append(warning_msg)
+                    self.logger.warning(warning_msg)
+            else:
+                # Steps 4-5 fused: serialize and format in a single pass into
+                # an in-memory sink; only step 7 ever touches the output file
+                try:
+                    sink = io.StringIO()
+                    self.renderer.render(internal_doc, sink)
+                    markdown_content = sink.getvalue()
+                    self.logger.debug("Serialized %d characters", len(markdown_content))
+                except Exception as e:
+                    error_msg = f"Failed to serialize to Markdown: {str(e)}"
+                    result.errors.append(error_msg)
+                    self.logger.error(error_msg, exception=e)
+                    return result
             
             # Step 6: Validate output (if enabled)
             if self.config.validate_output and self.markdown_validator:
@@ -271,8 +297,8 @@ class ConversionOrchestrator:
                 
                 if not validation_result.valid:
                     self.logger.warning(
-                        f"Markdown validation found {validation_result.error_count} errors "
-                        f"and {validation_result.warning_count} warnings"
+                        "Markdown validation found %d errors and %d warnings",
+                        validation_result.error_count, validation_result.warning_count
                     )
                 
                 # Add validation issues to result
@@ -280,10 +306,10 @@ class ConversionOrchestrator:
                     issue_str = str(issue)
                     if issue.severity.value == "error":
                         result.warnings.append(f"Validation error: {issue_str}")
-                        self.logger.warning(f"Validation error: {issue_str}")
+                        self.logger.warning("Validation error: %s", issue_str)
                     else:
                         result.warnings.append(f"Validation {issue.severity.value}: {issue_str}")
-                        self.logger.debug(f"Validation {issue.severity.value}: {issue_str}")
+                        self.logger.debug("Validation %s: %s", issue.severity.value, issue_str)
                 
                 if validation_result.valid:
                     self.logger.info("Markdown validation passed")
@@ -333,11 +359,15 @@ class ConversionOrchestrator:
         Returns:
             List of ConversionResult objects
         """
-        self.logger.info(f"Starting batch conversion of {len(input_paths)} files")
+        self.logger.info("Starting batch conversion of %d files", len(input_paths))
         results = []
         
+        # Let the OS read upcoming inputs while earlier files are converted
+        from src.io_backend import prefetch
+        prefetch(input_paths)
+        
         for i, input_path in enumerate(input_paths, 1):
-            self.logger.info(f"Processing file {i}/{len(input_paths)}: {input_path}")
+            self.logger.info("Processing file %d/%d: %s", i, len(input_paths), input_path)
             
             # Create a new config for this file
             file_config = ConversionConfig(
@@ -353,13 +383,13 @@ class ConversionOrchestrator:
             results.append(result)
             
             if result.success:
-                self.logger.info(f"Successfully converted: {input_path}")
+                self.logger.info("Successfully converted: %s", input_path)
             else:
                 self.logger.error(f"Failed to convert: {input_path}")
         
         # Summary
         successful = sum(1 for r in results if r.success)
-        self.logger.info(f"Batch conversion complete: {successful}/{len(input_paths)} successful")
+        self.logger.info("Batch conversion complete: %d/%d successful", successful, len(input_paths))
         
         return results
     
@@ -410,7 +440,7 @@ class ConversionOrchestrator:
             try:
                 encoding = self.config.output_encoding
                 self.output_writer.write_to_file(content, output_path, encoding=encoding)
-                self.logger.info(f"Output written to: {output_path} (encoding: {encoding})")
+                self.logger.info("Output written to: %s (encoding: %s)", output_path, encoding)
             except Exception as e:
                 raise Exception(f"Failed to write output file: {str(e)}")
         else:
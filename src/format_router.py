@@ -4,8 +4,20 @@ This module provides the FormatRouter class which selects the appropriate
 parser based on the file format.
 """
 
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
 from src.file_validator import FileFormat
-from src.parsers import DocumentParser, WordParser, ExcelParser, PDFParser
+
+if TYPE_CHECKING:
+    from src.parsers import DocumentParser
+
+
+# Parser class names in src.parsers, resolved on first use of each format
+PARSER_CLASSES = {
+    FileFormat.DOCX: "WordParser",
+    FileFormat.XLSX: "ExcelParser",
+    FileFormat.PDF: "PDFParser",
+}
 
 
 class FormatRouter:
@@ -16,20 +28,26 @@ class FormatRouter:
     parser for a given file format.
     """
     
-    def __init__(self, logger=None):
+    def __init__(
+        self,
+        logger=None,
+        enable_cache: bool = False,
+        cache_options: Optional[Dict[str, Any]] = None
+    ):
         """Initialize FormatRouter with parser mappings.
         
         Args:
             logger: Optional logger to pass to parsers for encoding warnings
+            enable_cache: Wrap parsers so unchanged inputs reuse cached parse results
+            cache_options: Configuration values included in parse cache keys
         """
         self.logger = logger
-        self._parsers = {
-            FileFormat.DOCX: WordParser(logger=logger),
-            FileFormat.XLSX: ExcelParser(logger=logger),
-            FileFormat.PDF: PDFParser(logger=logger)
-        }
+        self.enable_cache = enable_cache
+        self.cache_options = cache_options
+        # Parsers are created on first request so unused formats cost nothing
+        self._parsers = {}
     
-    def get_parser(self, file_format: FileFormat) -> DocumentParser:
+    def get_parser(self, file_format: FileFormat) -> "DocumentParser":
         """Get the appropriate parser for a file format.
         
         Args:
@@ -41,10 +59,33 @@ class FormatRouter:
         Raises:
             ValueError: If the file format is not supported
         """
-        if file_format not in self._parsers:
-            raise ValueError(
-                f"Unsupported file format: {file_format}. "
-                f"Supported formats: {', '.join(f.value for f in self._parsers.keys())}"
-            )
+        parser = self._parsers.get(file_format)
+        if parser is None:
+            if file_format not in PARSER_CLASSES:
+                raise ValueError(
+                    f"Unsupported file format: {file_format}. "
+                    f"Supported formats: {', '.join(f.value for f in PARSER_CLASSES.keys())}"
+                )
+            parser = self._create_parser(file_format)
+            self._parsers[file_format] = parser
+        
+        return parser
+    
+    def _create_parser(self, file_format: FileFormat) -> "DocumentParser":
+        """Instantiate the parser for a supported file format.
+        
+        Args:
+            file_format: The file format to create a parser for
+            
+        Returns:
+            DocumentParser instance, wrapped for caching if enabled
+        """
+        from src import parsers
+        
+        parser = getattr(parsers, PARSER_CLASSES[file_format])(logger=self.logger)
+        
+        if self.enable_cache:
+            from src.parser_cache import CachingParser
+            parser = CachingParser(parser, logger=self.logger, options=self.cache_options)
         
-        return self._parsers[file_format]
+        return parser
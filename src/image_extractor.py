@@ -89,6 +89,9 @@ class ImageExtractor:
         
         # If we have actual image data, save it
         if image_data_list:
+            # (reference, bytes, filename) for each image written to disk
+            saved_images = []
+            
             for idx, (img_ref, img_bytes) in enumerate(image_data_list, start=1):
                 # Determine filename
                 if self.preserve_filenames and img_ref.source_path:
@@ -107,16 +110,7 @@ class ImageExtractor:
                     # Update image reference with relative path
                     relative_path = f"{base_name}/images/{filename}"
                     img_ref.extracted_path = relative_path
-                    
-                    # Apply OCR if enabled and OCR engine is available
-                    if self.enable_ocr and self.ocr_engine and not img_ref.ocr_text:
-                        try:
-                            ocr_text = self.ocr_engine.extract_text_from_bytes(img_bytes)
-                            if ocr_text:  # Only set if text was found
-                                img_ref.ocr_text = ocr_text
-                        except Exception as e:
-                            # OCR failure is not critical, just log and continue
-                            print(f"Warning: OCR failed for image {filename}: {e}")
+                    saved_images.append((img_ref, img_bytes, filename))
                     
                     # Convert diagram to Mermaid if enabled
                     if self.enable_diagram_conversion and self.diagram_converter:
@@ -147,6 +141,10 @@ class ImageExtractor:
                     # If save fails, keep original reference without extracted_path
                     print(f"Warning: Failed to save image {filename}: {e}")
                     extracted_images.append(img_ref)
+            
+            # Apply OCR if enabled and OCR engine is available
+            if self.enable_ocr and self.ocr_engine:
+                self._apply_batch_ocr(saved_images)
         else:
             # No image data provided, just update paths for existing references
             for idx, img_ref in enumerate(document.images, start=1):
@@ -161,6 +159,38 @@ class ImageExtractor:
         
         return extracted_images
     
+    def _apply_batch_ocr(self, saved_images: List[tuple]) -> None:
+        """Run OCR on saved images that have no OCR text yet.
+        
+        All images are passed to the OCR engine in one batch so they can be
+        processed in parallel. Failures are handled per image.
+        
+        Args:
+            saved_images: (ImageReference, bytes, filename) tuples for the
+                         images that were written to disk
+        """
+        pending = [entry for entry in saved_images if not entry[0].ocr_text]
+        if not pending:
+            return
+        
+        try:
+            results = self.ocr_engine.batch_ocr([img_bytes for _, img_bytes, _ in pending])
+        except Exception:
+            # The batch as a whole failed (e.g. no worker pool); retry one by one
+            results = []
+            for _, img_bytes, _ in pending:
+                try:
+                    results.append(self.ocr_engine.extract_text_from_bytes(img_bytes))
+                except Exception as e:
+                    results.append(e)
+        
+        for (img_ref, _, filename), result in zip(pending, results):
+            if isinstance(result, Exception):
+                # OCR failure is not critical, just log and continue
+                print(f"Warning: OCR failed for image {filename}: {result}")
+            elif result:  # Only set if text was found
+                img_ref.ocr_text = result
+    
     def _extract_filename(self, source_path: str, fallback_index: int) -> str:
         """Extract a filename from source path or generate a fallback.
         
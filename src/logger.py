@@ -15,6 +15,12 @@ class LogLevel(Enum):
     ERROR = logging.ERROR
 
 
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Shared logger for all Logger instances; handlers are replaced on configure()
+_root = logging.getLogger("doc2md")
+
+
 class Logger:
     """Logger class for conversion operations."""
     
@@ -25,52 +31,91 @@ class Logger:
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
             output_path: Optional path to log file. If None, logs to stderr only.
         """
-        self.logger = logging.getLogger("doc2md")
-        self.logger.setLevel(log_level.value)
-        self.logger.handlers.clear()
+        self.logger = self.configure(log_level, output_path)
+    
+    @classmethod
+    def configure(
+        cls,
+        log_level: LogLevel = LogLevel.INFO,
+        output_path: Optional[str] = None
+    ) -> logging.Logger:
+        """Configure the shared "doc2md" logger.
+        
+        Previously attached handlers are removed and closed before the new
+        ones are added, so repeated configuration never accumulates handlers
+        or leaves log files open.
+        
+        Args:
+            log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
+            output_path: Optional path to log file. If None, logs to stderr only.
+            
+        Returns:
+            The configured logging.Logger
+        """
+        _root.setLevel(log_level.value)
+        cls.close()
+        
+        formatter = logging.Formatter(LOG_FORMAT)
         
         # Console handler (stderr)
         console_handler = logging.StreamHandler(sys.stderr)
         console_handler.setLevel(log_level.value)
-        console_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
+        console_handler.setFormatter(formatter)
+        _root.addHandler(console_handler)
         
         # File handler (if output_path specified)
         if output_path:
             file_handler = logging.FileHandler(output_path, encoding='utf-8')
             file_handler.setLevel(log_level.value)
-            file_formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            file_handler.setFormatter(file_formatter)
-            self.logger.addHandler(file_handler)
+            file_handler.setFormatter(formatter)
+            _root.addHandler(file_handler)
+        
+        return _root
     
-    def debug(self, message: str) -> None:
-        """Log debug message."""
-        self.logger.debug(message)
+    @classmethod
+    def close(cls) -> None:
+        """Detach and close all handlers of the shared logger.
+        
+        Call this when logging is finished so log files are flushed and
+        released immediately rather than at interpreter exit. Console
+        handlers are not flushed explicitly, since their stream may already
+        have been closed by its owner.
+        """
+        for handler in list(_root.handlers):
+            _root.removeHandler(handler)
+            handler.close()
     
-    def info(self, message: str) -> None:
+    def debug(self, message: str, *args) -> None:
+        """Log debug message.
+        
+        Extra args are %-formatted into the message only if the record is
+        emitted, so disabled debug logging costs no string formatting.
+        """
+        self.logger.debug(message, *args)
+    
+    def info(self, message: str, *args) -> None:
         """Log info message."""
-        self.logger.info(message)
+        self.logger.info(message, *args)
     
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args) -> None:
         """Log warning message."""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
     
     def error(self, message: str, exception: Optional[Exception] = None) -> None:
-        """Log error message with optional exception details."""
+        """Log error message with optional exception details.
+        
+        The message and exception are passed as %-args, so '%' in either
+        is logged verbatim.
+        """
         if exception:
-            self.logger.error(f"{message}: {str(exception)}", exc_info=True)
+            self.logger.error("%s: %s", message, exception, exc_info=True)
         else:
             self.logger.error(message)
     
     def log_conversion_start(self, file_path: str, file_size: int) -> None:
         """Log conversion start with file details."""
-        self.info(f"Starting conversion - File: {file_path}, Size: {file_size} bytes")
+        self.info("Starting conversion - File: %s, Size: %d bytes", file_path, file_size)
     
     def log_conversion_complete(self, output_path: str, duration: float) -> None:
         """Log conversion completion with output details."""
-        self.info(f"Conversion complete - Output: {output_path}, Duration: {duration:.2f}s")
+        self.info("Conversion complete - Output: %s, Duration: %.2fs", output_path, duration)
@@ -5,7 +5,21 @@ This module provides functions to properly escape special characters
 in Markdown text to ensure valid Markdown output.
 """
 
-import re
+
+# Single-pass translation for normal text. Periods are not escaped as
+# they're commonly used in normal text.
+_NORMAL_TRANSLATE = str.maketrans({
+    char: "\\" + char for char in "\\`*_{}[]()#+-!|<>"
+})
+
+# Single-pass translation for table cells: backslashes, column pipes and
+# embedded newlines are rewritten simultaneously, so no replacement can be
+# re-escaped by a later one.
+_TABLE_TRANSLATE = str.maketrans({
+    "\\": "\\\\",
+    "|": "\\|",
+    "\n": "<br>",
+})
 
 
 class MarkdownEscaper:
@@ -54,19 +68,9 @@ class MarkdownEscaper:
         Returns:
             Escaped text
         """
-        # Escape backslashes first to avoid double-escaping
-        text = text.replace("\\", "\\\\")
-        
-        # Escape other special characters
-        # Note: We don't escape periods (.) as they're commonly used in normal text
-        special_chars = ['`', '*', '_', '{', '}', '[', ']', '(', ')', 
-                        '#', '+', '-', '!', '|', '<', '>']
-        
-        for char in special_chars:
-            # Only escape if not already escaped
-            text = re.sub(f'(?<!\\\\){re.escape(char)}', f'\\{char}', text)
-        
-        return text
+        # Backslashes and Markdown special characters are escaped in one
+        # pass, so a literal backslash never swallows the escape that follows
+        return text.translate(_NORMAL_TRANSLATE)
     
     @staticmethod
     def _escape_table_text(text: str) -> str:
@@ -81,16 +85,9 @@ class MarkdownEscaper:
         Returns:
             Escaped text
         """
-        # Escape backslashes first
-        text = text.replace("\\", "\\\\")
-        
-        # Escape pipe character (critical for tables)
-        text = text.replace("|", "\\|")
-        
-        # Escape newlines in table cells (replace with <br>)
-        text = text.replace("\n", "<br>")
-        
-        return text
+        # Escape backslashes and pipes (critical for tables) and replace
+        # newlines with <br>, all in one C-level pass
+        return text.translate(_TABLE_TRANSLATE)
     
     @staticmethod
     def _escape_link_text(text: str) -> str:
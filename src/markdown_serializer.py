@@ -5,8 +5,7 @@ This module provides the MarkdownSerializer class that converts InternalDocument
 structures into valid Markdown syntax.
 """
 
-import re
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from src.internal_representation import (
     InternalDocument,
     Section,
@@ -44,6 +43,12 @@ class MarkdownSerializer:
         """
         self.heading_offset = heading_offset
         self.include_metadata = include_metadata
+        # The offset is fixed per conversion, so map each valid heading level
+        # to its shifted level once; None means levels pass through unchanged
+        self._level_map = (
+            tuple(max(1, min(6, level + heading_offset)) for level in range(7))
+            if heading_offset else None
+        )
     
     def serialize(self, document: InternalDocument) -> str:
         """Serialize an internal document to Markdown format.
@@ -58,7 +63,7 @@ class MarkdownSerializer:
         
         # Add metadata if requested
         if self.include_metadata and document.metadata:
-            metadata_md = self._serialize_metadata(document.metadata)
+            metadata_md = self.serialize_metadata(document.metadata)
             if metadata_md:
                 parts.append(metadata_md)
                 parts.append("")  # Blank line after metadata
@@ -71,7 +76,7 @@ class MarkdownSerializer:
         
         return "\n".join(parts)
     
-    def _serialize_metadata(self, metadata) -> str:
+    def serialize_metadata(self, metadata) -> str:
         """Serialize document metadata to Markdown frontmatter.
         
         Args:
@@ -119,7 +124,7 @@ class MarkdownSerializer:
         
         # Add content blocks
         for content in section.content:
-            content_md = self._serialize_content_block(content)
+            content_md = self.serialize_content_block(content)
             if content_md:
                 parts.append(content_md)
                 parts.append("")  # Blank line after content block
@@ -130,7 +135,7 @@ class MarkdownSerializer:
         
         return "\n".join(parts)
     
-    def _serialize_content_block(self, content: ContentBlock) -> str:
+    def serialize_content_block(self, content: ContentBlock) -> str:
         """Serialize a content block to Markdown.
         
         Args:
@@ -164,7 +169,10 @@ class MarkdownSerializer:
             Markdown heading string (e.g., "## Heading Text")
         """
         # Apply heading offset and ensure level stays within valid range (1-6)
-        level = max(1, min(6, heading.level + self.heading_offset))
+        # (Heading validates its level, so it always indexes the map)
+        level = heading.level
+        if self._level_map is not None:
+            level = self._level_map[level]
         prefix = "#" * level
         # Escape special characters in heading text
         escaped_text = MarkdownEscaper.escape_text(heading.text, context="heading")
@@ -207,37 +215,46 @@ class MarkdownSerializer:
         Returns:
             Markdown table string
         """
+        return "\n".join(
+            "| " + " | ".join(cells) + " |" for cells in self.table_cells(table)
+        )
+    
+    def table_cells(self, table: Table) -> Iterator[List[str]]:
+        """Yield the escaped cells of each Markdown table row.
+        
+        Rows are the header, the separator and the data rows, with data rows
+        padded or truncated to the header width. A table without headers or
+        rows yields nothing.
+        
+        Args:
+            table: Table object to serialize
+            
+        Yields:
+            List of escaped cell strings for each table row
+        """
         if not table.headers and not table.rows:
-            return ""
+            return
         
-        lines = []
+        escape = MarkdownEscaper.escape_text
         
         # Add headers
         if table.headers:
+            num_columns = len(table.headers)
             # Escape special characters in header cells
-            escaped_headers = [MarkdownEscaper.escape_text(h, context="table") for h in table.headers]
-            header_row = "| " + " | ".join(escaped_headers) + " |"
-            lines.append(header_row)
+            yield [escape(h, context="table") for h in table.headers]
             
             # Add separator row
-            separator = "| " + " | ".join(["---"] * len(table.headers)) + " |"
-            lines.append(separator)
-        
-        # Add data rows
-        for row in table.rows:
-            # Ensure row has same number of columns as headers
-            if table.headers:
-                row_data = row + [""] * (len(table.headers) - len(row))
-                row_data = row_data[:len(table.headers)]
-            else:
-                row_data = row
+            yield ["---"] * num_columns
             
-            # Escape special characters in cells
-            escaped_cells = [MarkdownEscaper.escape_text(str(cell), context="table") for cell in row_data]
-            row_str = "| " + " | ".join(escaped_cells) + " |"
-            lines.append(row_str)
+            # Pad or truncate rows to the header width
+            padding = [""] * num_columns
+            rows = ((row + padding)[:num_columns] for row in table.rows)
+        else:
+            rows = table.rows
         
-        return "\n".join(lines)
+        # Add data rows, escaping special characters in cells
+        for row in rows:
+            yield [escape(str(cell), context="table") for cell in row]
     
     def serialize_list(self, doc_list: DocumentList) -> str:
         """Serialize a list to Markdown format.
@@ -9,6 +9,7 @@ Requirements:
     - 11.4: Report Markdown syntax errors or warnings when validation is performed
 """
 
+import re
 from dataclasses import dataclass
 from typing import List, Optional
 from enum import Enum
@@ -21,6 +22,12 @@ except ImportError:
     MARKDOWN_IT_AVAILABLE = False
 
 
+# Patterns used by the per-line checks
+_LINK_PATTERN = re.compile(r'\[([^\]]*)\]\(([^\)]*)\)')
+_ORDERED_ITEM_PATTERN = re.compile(r'^\d+\.')
+_ORDERED_ITEM_SPACED_PATTERN = re.compile(r'^(\d+\.)\s')
+
+
 class ValidationSeverity(Enum):
     """Severity levels for validation issues."""
     ERROR = "error"
@@ -122,12 +129,14 @@ class MarkdownValidator:
             # Parse the markdown content
             tokens = self.md.parse(markdown_content)
             
-            # Perform various validation checks
-            issues.extend(self._check_code_blocks(markdown_content))
-            issues.extend(self._check_tables(markdown_content))
-            issues.extend(self._check_headings(markdown_content))
-            issues.extend(self._check_links(markdown_content))
-            issues.extend(self._check_lists(markdown_content))
+            # Perform various validation checks over a single line split
+            lines = markdown_content.split('\n')
+            code_block_issues, heading_issues, link_issues, list_issues = self._check_lines(lines)
+            issues.extend(code_block_issues)
+            issues.extend(self._check_tables(lines))
+            issues.extend(heading_issues)
+            issues.extend(link_issues)
+            issues.extend(list_issues)
             
             # Check if parsing produced any errors
             issues.extend(self._check_parsing_tokens(tokens))
@@ -150,47 +159,109 @@ class MarkdownValidator:
             issues=issues
         )
     
-    def _check_code_blocks(self, content: str) -> List[ValidationIssue]:
-        """Check for unclosed code blocks.
+    def _check_lines(self, lines: List[str]) -> tuple:
+        """Run the per-line checks in a single pass.
+        
+        Checks for unclosed code blocks, heading issues, malformed links and
+        list formatting issues.
         
         Args:
-            content: Markdown content
+            lines: Markdown content split into lines
             
         Returns:
-            List of validation issues
+            Tuple of (code block, heading, link, list) issue lists
         """
-        issues = []
-        lines = content.split('\n')
-        
         code_block_markers = []
+        heading_issues = []
+        link_issues = []
+        list_issues = []
+        
         for i, line in enumerate(lines, 1):
             stripped = line.strip()
-            if stripped.startswith('```'):
+            if not stripped:
+                continue
+            
+            first_char = stripped[0]
+            
+            # Code block fences
+            if first_char == '`' and stripped.startswith('```'):
                 code_block_markers.append((i, line))
+            
+            # ATX-style headings (# Heading)
+            elif first_char == '#':
+                level = len(stripped) - len(stripped.lstrip('#'))
+                
+                # Check if there's a space after the hashes
+                if level < len(stripped) and stripped[level] != ' ':
+                    heading_issues.append(ValidationIssue(
+                        severity=ValidationSeverity.WARNING,
+                        message=f"Heading should have a space after '#' markers",
+                        line_number=i,
+                        context=stripped[:50]
+                    ))
+                
+                # Check for excessive heading level
+                if level > 6:
+                    heading_issues.append(ValidationIssue(
+                        severity=ValidationSeverity.WARNING,
+                        message=f"Heading level {level} exceeds maximum of 6",
+                        line_number=i,
+                        context=stripped[:50]
+                    ))
+            
+            # Ordered lists should have a space after the period
+            elif first_char.isdigit():
+                if _ORDERED_ITEM_PATTERN.match(stripped) and not _ORDERED_ITEM_SPACED_PATTERN.match(stripped):
+                    list_issues.append(ValidationIssue(
+                        severity=ValidationSeverity.WARNING,
+                        message="Ordered list item should have space after period",
+                        line_number=i,
+                        context=stripped[:50]
+                    ))
+            
+            # Links of the form [text](url) with empty text or URL
+            if '[' in line and ']' in line:
+                for match in _LINK_PATTERN.finditer(line):
+                    if not match.group(1).strip():
+                        link_issues.append(ValidationIssue(
+                            severity=ValidationSeverity.WARNING,
+                            message="Link has empty text",
+                            line_number=i,
+                            context=match.group(0)
+                        ))
+                    
+                    if not match.group(2).strip():
+                        link_issues.append(ValidationIssue(
+                            severity=ValidationSeverity.WARNING,
+                            message="Link has empty URL",
+                            line_number=i,
+                            context=match.group(0)
+                        ))
+        
+        code_block_issues = []
         
         # Check if code blocks are balanced
         if len(code_block_markers) % 2 != 0:
-            last_marker = code_block_markers[-1] if code_block_markers else (0, "")
-            issues.append(ValidationIssue(
+            last_marker = code_block_markers[-1]
+            code_block_issues.append(ValidationIssue(
                 severity=ValidationSeverity.ERROR,
                 message="Unclosed code block detected",
                 line_number=last_marker[0],
                 context=last_marker[1][:50]
             ))
         
-        return issues
+        return code_block_issues, heading_issues, link_issues, list_issues
     
-    def _check_tables(self, content: str) -> List[ValidationIssue]:
+    def _check_tables(self, lines: List[str]) -> List[ValidationIssue]:
         """Check for malformed tables.
         
         Args:
-            content: Markdown content
+            lines: Markdown content split into lines
             
         Returns:
             List of validation issues
         """
         issues = []
-        lines = content.split('\n')
         
         i = 0
         while i < len(lines):
@@ -248,141 +319,6 @@ class MarkdownValidator:
         
         return issues
     
-    def _check_headings(self, content: str) -> List[ValidationIssue]:
-        """Check for heading issues.
-        
-        Args:
-            content: Markdown content
-            
-        Returns:
-            List of validation issues
-        """
-        issues = []
-        lines = content.split('\n')
-        
-        for i, line in enumerate(lines, 1):
-            stripped = line.strip()
-            
-            # Check for ATX-style headings (# Heading)
-            if stripped.startswith('#'):
-                # Count heading level
-                level = 0
-                for char in stripped:
-                    if char == '#':
-                        level += 1
-                    else:
-                        break
-                
-                # Check if there's a space after the hashes
-                if level < len(stripped) and stripped[level] != ' ':
-                    issues.append(ValidationIssue(
-                        severity=ValidationSeverity.WARNING,
-                        message=f"Heading should have a space after '#' markers",
-                        line_number=i,
-                        context=stripped[:50]
-                    ))
-                
-                # Check for excessive heading level
-                if level > 6:
-                    issues.append(ValidationIssue(
-                        severity=ValidationSeverity.WARNING,
-                        message=f"Heading level {level} exceeds maximum of 6",
-                        line_number=i,
-                        context=stripped[:50]
-                    ))
-        
-        return issues
-    
-    def _check_links(self, content: str) -> List[ValidationIssue]:
-        """Check for malformed links.
-        
-        Args:
-            content: Markdown content
-            
-        Returns:
-            List of validation issues
-        """
-        issues = []
-        lines = content.split('\n')
-        
-        for i, line in enumerate(lines, 1):
-            # Check for unmatched brackets in links
-            # Simple check: count [ and ] and ( and )
-            open_square = line.count('[')
-            close_square = line.count(']')
-            open_paren = line.count('(')
-            close_paren = line.count(')')
-            
-            # Check for potential link syntax issues
-            if '[' in line and ']' in line:
-                # Look for pattern [text](url)
-                import re
-                # Find all potential links
-                link_pattern = r'\[([^\]]*)\]\(([^\)]*)\)'
-                matches = re.finditer(link_pattern, line)
-                
-                for match in matches:
-                    text = match.group(1)
-                    url = match.group(2)
-                    
-                    # Check for empty link text
-                    if not text.strip():
-                        issues.append(ValidationIssue(
-                            severity=ValidationSeverity.WARNING,
-                            message="Link has empty text",
-                            line_number=i,
-                            context=match.group(0)
-                        ))
-                    
-                    # Check for empty URL
-                    if not url.strip():
-                        issues.append(ValidationIssue(
-                            severity=ValidationSeverity.WARNING,
-                            message="Link has empty URL",
-                            line_number=i,
-                            context=match.group(0)
-                        ))
-        
-        return issues
-    
-    def _check_lists(self, content: str) -> List[ValidationIssue]:
-        """Check for list formatting issues.
-        
-        Args:
-            content: Markdown content
-            
-        Returns:
-            List of validation issues
-        """
-        issues = []
-        lines = content.split('\n')
-        
-        for i, line in enumerate(lines, 1):
-            stripped = line.strip()
-            
-            # Check unordered lists
-            if stripped.startswith(('- ', '* ', '+ ')):
-                # Check if there's proper spacing
-                if len(line) > 0 and line[0] not in (' ', '-', '*', '+'):
-                    # List item should be indented or at start
-                    pass
-            
-            # Check ordered lists
-            if stripped and stripped[0].isdigit():
-                import re
-                if re.match(r'^\d+\.', stripped):
-                    # Check if there's a space after the period
-                    match = re.match(r'^(\d+\.)\s', stripped)
-                    if not match:
-                        issues.append(ValidationIssue(
-                            severity=ValidationSeverity.WARNING,
-                            message="Ordered list item should have space after period",
-                            line_number=i,
-                            context=stripped[:50]
-                        ))
-        
-        return issues
-    
     def _check_parsing_tokens(self, tokens: List[Token]) -> List[ValidationIssue]:
         """Check parsed tokens for issues.
         
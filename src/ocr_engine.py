@@ -6,8 +6,53 @@ using Tesseract OCR with multi-language support.
 """
 
 from pathlib import Path
-from typing import Optional, Union
+from typing import List, Optional, Union
 import io
+import os
+
+
+# Recycle worker processes after this many images to bound memory growth
+WORKER_MAX_TASKS = 32
+
+# Language used by the current worker process (set by _init_worker)
+_worker_language: Optional[str] = None
+
+
+def _init_worker(language: str) -> None:
+    """Initialize an OCR worker process.
+    
+    Args:
+        language: OCR language setting for this worker
+    """
+    global _worker_language
+    _worker_language = language
+    # Import once per worker instead of once per image
+    import pytesseract  # noqa: F401
+    from PIL import Image  # noqa: F401
+
+
+def _ocr_one(image_bytes: bytes) -> Union[str, Exception]:
+    """Run OCR on a single image inside a worker process.
+    
+    Args:
+        image_bytes: Raw image data as bytes
+    
+    Returns:
+        Extracted text, or an IOError describing why extraction failed.
+        Errors are returned rather than raised so one bad image does not
+        abort the whole Pool.map.
+    """
+    import pytesseract
+    from PIL import Image
+    
+    if not image_bytes:
+        return ""
+    
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as img:
+            return pytesseract.image_to_string(img, lang=_worker_language).strip()
+    except Exception as e:
+        return IOError(f"Failed to extract text from image bytes: {e}")
 
 
 class OCREngine:
@@ -20,17 +65,25 @@ class OCREngine:
     
     Attributes:
         language: OCR language setting (e.g., 'eng', 'jpn', 'eng+jpn')
+        max_workers: Number of worker processes used by batch_ocr
     """
     
-    def __init__(self, language: str = "eng+jpn"):
+    def __init__(
+        self,
+        language: str = "eng+jpn",
+        max_workers: Optional[int] = None
+    ):
         """Initialize the OCR engine.
         
         Args:
             language: Language(s) for OCR recognition. Can be a single language
                      (e.g., 'eng', 'jpn') or multiple languages separated by '+'
                      (e.g., 'eng+jpn'). Default is 'eng+jpn'.
+            max_workers: Number of worker processes for batch_ocr
+                        (default: number of CPUs)
         """
         self.language = language
+        self.max_workers = max_workers or os.cpu_count() or 1
         self._validate_tesseract()
     
     def _validate_tesseract(self) -> None:
@@ -112,6 +165,43 @@ class OCREngine:
         except Exception as e:
             raise IOError(f"Failed to extract text from image bytes: {e}")
     
+    def batch_ocr(self, images: List[bytes]) -> List[Union[str, Exception]]:
+        """Extract text from several images in parallel.
+        
+        Images are processed by a pool of worker processes, since each
+        Tesseract call is CPU-bound. A single image is processed in-process
+        without a pool. Failures are reported per image, so one bad image
+        does not affect the others.
+        
+        Args:
+            images: Raw image data for each image
+        
+        Returns:
+            One entry per image, in input order: the extracted text, or the
+            exception that made extraction fail for that image
+        """
+        if not images:
+            return []
+        
+        if len(images) == 1 or self.max_workers == 1:
+            results = []
+            for image_bytes in images:
+                try:
+                    results.append(self.extract_text_from_bytes(image_bytes))
+                except Exception as e:
+                    results.append(e)
+            return results
+        
+        import multiprocessing
+        
+        with multiprocessing.Pool(
+            processes=min(self.max_workers, len(images)),
+            initializer=_init_worker,
+            initargs=(self.language,),
+            maxtasksperchild=WORKER_MAX_TASKS
+        ) as pool:
+            return pool.map(_ocr_one, images)
+    
     def set_language(self, language: str) -> None:
         """Set the OCR language.
         
@@ -5,6 +5,10 @@ from pathlib import Path
 from typing import Optional
 
 
+# Large buffer so big documents reach the OS in a few write() calls
+WRITE_BUFFER_SIZE = 1 << 20
+
+
 class OutputWriter:
     """Handles writing conversion output to various destinations."""
     
@@ -24,17 +28,39 @@ class OutputWriter:
             output_file.parent.mkdir(parents=True, exist_ok=True)
             # Handle encoding errors gracefully
             try:
-                output_file.write_text(content, encoding=encoding)
+                self._write_buffered(output_file, content, encoding)
             except (LookupError, UnicodeEncodeError) as enc_error:
                 # If encoding fails, fall back to UTF-8 with error handling
                 if encoding != 'utf-8':
                     # Try with error replacement
-                    output_file.write_text(content, encoding=encoding, errors='replace')
+                    self._write_buffered(output_file, content, encoding, errors='replace')
                 else:
                     raise enc_error
         except Exception as e:
             raise IOError(f"Failed to write to file {output_path}: {str(e)}") from e
     
+    def _write_buffered(
+        self,
+        output_file: Path,
+        content: str,
+        encoding: str,
+        errors: Optional[str] = None
+    ) -> None:
+        """Write content through a single large buffer.
+        
+        The file is flushed once when the context manager exits. Newlines
+        are written as-is so output is identical across platforms.
+        
+        Args:
+            output_file: Destination file
+            content: Text to write
+            encoding: Character encoding for the output file
+            errors: Encoding error handler (None for strict)
+        """
+        with open(output_file, 'w', encoding=encoding, errors=errors,
+                  buffering=WRITE_BUFFER_SIZE, newline='\n') as f:
+            f.write(content)
+    
     def write_to_stdout(self, content: str) -> None:
         """Write content to standard output.
         
@@ -51,16 +77,17 @@ class OutputWriter:
             content: The Markdown content to preview
             lines: Number of lines to display (default: 50)
         """
-        content_lines = content.split('\n')
-        preview_lines = content_lines[:lines]
+        # Only split off the lines being shown; the rest are just counted
+        preview_lines = content.split('\n', lines)[:lines]
+        total_lines = content.count('\n') + 1
         
         print("=" * 80)
         print(f"PREVIEW (showing first {lines} lines)")
         print("=" * 80)
         print('\n'.join(preview_lines))
         
-        if len(content_lines) > lines:
-            remaining = len(content_lines) - lines
+        if total_lines > lines:
+            remaining = total_lines - lines
             print("=" * 80)
             print(f"... {remaining} more lines not shown ...")
             print("=" * 80)
@@ -0,0 +1,248 @@
+"""Parse result caching for the Document to Markdown Converter.
+
+This module provides the CachingParser class which wraps a DocumentParser
+and reuses previously parsed InternalDocument trees for unchanged inputs.
+Results are keyed by a hash of the file contents, kept in a bounded
+in-memory LRU and persisted as pickles in a private per-user cache
+directory ($XDG_CACHE_HOME or ~/.cache).
+"""
+
+import copy
+import hashlib
+import mmap
+import os
+import pickle
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.internal_representation import InternalDocument
+from src.parsers import DocumentParser
+
+
+# Bump when the internal representation changes so stale pickles are ignored
+CACHE_FORMAT_VERSION = "1"
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "doc2md" / "ast-cache"
+DEFAULT_MEMORY_SIZE = 128
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# ConversionConfig fields that select which parse result (document tree and
+# image data) a conversion needs; they are mixed into every cache key
+CACHE_CONFIG_FIELDS = ("extract_images", "image_format", "enable_ocr", "ocr_language")
+
+# In-memory layer shared by all CachingParser instances in this process
+_memory_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+
+def default_cache_dir() -> Path:
+    """Resolve the directory used for on-disk parse results.
+
+    The cache lives under the user's own cache directory, never a shared
+    location such as the system temp directory, because entries are
+    unpickled on load.
+
+    Returns:
+        Cache directory path
+    """
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    if xdg_cache_home:
+        return Path(xdg_cache_home) / "doc2md" / "ast-cache"
+    return DEFAULT_CACHE_DIR
+
+
+def cache_options(config) -> Dict[str, Any]:
+    """Collect the configuration values that belong in the cache key.
+
+    Args:
+        config: ConversionConfig of the conversion using the cache
+
+    Returns:
+        Mapping of each field in CACHE_CONFIG_FIELDS to its value
+    """
+    return {field: getattr(config, field) for field in CACHE_CONFIG_FIELDS}
+
+
+def clear_memory_cache() -> None:
+    """Drop all entries from the in-process parse cache."""
+    _memory_cache.clear()
+
+
+class CachingParser(DocumentParser):
+    """DocumentParser decorator that caches parse results by content hash.
+
+    Lookups check the in-process LRU first, then the on-disk pickle cache.
+    On a miss the wrapped parser is invoked and its result stored in both
+    layers. The disk layer is only used while the cache directory is owned
+    by the current user and closed to group and other access.
+
+    Callers receive deep copies of cached documents and image data, since
+    image extraction updates image references in place. Attributes not
+    defined here (such as the PDF parser's ``_image_data``) are delegated
+    to the wrapped parser.
+
+    Attributes:
+        parser: The wrapped DocumentParser
+        options: Configuration values mixed into every cache key
+        cache_dir: Directory holding pickled parse results (None disables disk cache)
+        memory_size: Maximum number of entries kept in memory
+        ttl_seconds: Maximum age of on-disk entries before they are ignored
+    """
+
+    def __init__(
+        self,
+        parser: DocumentParser,
+        cache_dir: Optional[str] = None,
+        memory_size: int = DEFAULT_MEMORY_SIZE,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        logger=None,
+        options: Optional[Dict[str, Any]] = None
+    ):
+        """Initialize the caching parser.
+
+        Args:
+            parser: Parser to delegate to on cache misses
+            cache_dir: Directory for pickled results (default: default_cache_dir())
+            memory_size: Maximum number of in-memory entries
+            ttl_seconds: Maximum age of on-disk entries in seconds
+            logger: Optional logger for cache diagnostics
+            options: Configuration values that must match for a cached
+                result to be reused (see cache_options())
+        """
+        self.parser = parser
+        self.options = options or {}
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.memory_size = memory_size
+        self.ttl_seconds = ttl_seconds
+        self.logger = logger
+
+    def __getattr__(self, name):
+        # Only called when normal lookup fails; forward to the wrapped parser
+        if name == "parser":
+            raise AttributeError(name)
+        return getattr(self.parser, name)
+
+    def parse(self, file_path: str) -> InternalDocument:
+        """Parse a document, reusing a cached result when available.
+
+        Args:
+            file_path: Path to the document file
+
+        Returns:
+            InternalDocument representation of the parsed document
+        """
+        key = self.cache_key(file_path)
+
+        entry = self._memory_get(key)
+        if entry is None:
+            entry = self._disk_get(key)
+            if entry is not None:
+                self._memory_put(key, entry)
+
+        if entry is not None:
+            if self.logger:
+                self.logger.debug("Parse cache hit for %s", file_path)
+            # Copy so in-place updates by one conversion never reach the cache.
+            # Always overwrite so images from a previously parsed file never leak.
+            document, self.parser._image_data = copy.deepcopy(entry)
+            return document
+
+        document = self.parser.parse(file_path)
+        entry = (document, getattr(self.parser, "_image_data", None))
+        # Store a copy; the caller is about to mutate the returned objects
+        self._memory_put(key, copy.deepcopy(entry))
+        self._disk_put(key, entry)
+
+        return document
+
+    def cache_key(self, file_path: str) -> str:
+        """Compute the cache key for a document file.
+
+        Args:
+            file_path: Path to the document file
+
+        Returns:
+            Hex digest identifying the file contents, parser and options
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(CACHE_FORMAT_VERSION.encode("ascii"))
+        hasher.update(type(self.parser).__name__.encode("ascii"))
+        hasher.update(repr(sorted(self.options.items())).encode("utf-8"))
+        with open(file_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size and sys.platform != "win32":
+                # Hash straight from the page cache without copying into bytes
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    hasher.update(mapped)
+            else:
+                # Windows locks mapped files; empty files cannot be mapped
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def _memory_get(self, key: str) -> Optional[tuple]:
+        entry = _memory_cache.get(key)
+        if entry is not None:
+            _memory_cache.move_to_end(key)
+        return entry
+
+    def _memory_put(self, key: str, entry: tuple) -> None:
+        _memory_cache[key] = entry
+        _memory_cache.move_to_end(key)
+        while len(_memory_cache) > self.memory_size:
+            _memory_cache.popitem(last=False)
+
+    def _cache_dir_is_private(self) -> bool:
+        """Check that the cache directory cannot be written by other users.
+
+        Returns:
+            True if the directory exists, is owned by the current user and
+            grants no group or other permissions
+        """
+        try:
+            st = self.cache_dir.stat()
+        except OSError:
+            return False
+        if not hasattr(os, "getuid"):
+            # No POSIX ownership model (Windows); rely on the profile ACLs
+            return True
+        if st.st_uid != os.getuid() or st.st_mode & 0o077:
+            if self.logger:
+                self.logger.debug("Ignoring parse cache at %s: directory is not private", self.cache_dir)
+            return False
+        return True
+
+    def _disk_get(self, key: str) -> Optional[tuple]:
+        cache_file = self.cache_dir / f"{key}.pkl"
+        if not self._cache_dir_is_private():
+            return None
+        try:
+            if time.time() - cache_file.stat().st_mtime > self.ttl_seconds:
+                return None
+            with open(cache_file, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            # Missing, expired or unreadable entries are treated as misses
+            return None
+
+    def _disk_put(self, key: str, entry: tuple) -> None:
+        cache_file = self.cache_dir / f"{key}.pkl"
+        try:
+            self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not self._cache_dir_is_private():
+                return
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            # Caching is best effort; a failed write must not fail the conversion
+            if self.logger:
+                self.logger.debug("Failed to write parse cache entry: %s", e)
@@ -4,10 +4,53 @@ This module defines the abstract base class for document parsers
 and will contain concrete implementations for Word, Excel, and PDF parsers.
 """
 
+import io
+import os
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Iterator, Optional, Union
 from src.internal_representation import InternalDocument
 
 
+# Run content elements that contribute text, as in python-docx ``Run.text``
+_RUN_TEXT_TAGS = ("t", "tab", "ptab", "br", "cr", "noBreakHyphen")
+
+# Excel cell values up to this length are memoized after encoding processing;
+# short labels repeat across many cells, long free text rarely does
+SHORT_CELL_TEXT_LENGTH = 64
+
+# Bound on memoized short cell values per ExcelParser
+SHORT_CELL_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=1)
+def _cell_text_query():
+    """Compile the XPath query used to read Word table cell text.
+
+    The query returns each direct ``<w:p>`` of a ``<w:tc>`` followed by the
+    text-bearing run elements inside it, in document order, so a cell's text
+    is collected with a single lxml evaluation.
+
+    Returns:
+        Tuple of (compiled XPath, mapping of fixed-text tags to their text)
+    """
+    from lxml import etree
+    from docx.oxml.ns import nsmap, qn
+
+    inline = " or ".join(f"self::w:{tag}" for tag in _RUN_TEXT_TAGS)
+    query = etree.XPath(
+        f"./w:p | ./w:p/w:r/*[{inline}] | ./w:p/w:hyperlink/w:r/*[{inline}]",
+        namespaces={"w": nsmap["w"]}
+    )
+    fixed_text = {
+        qn("w:tab"): "\t",
+        qn("w:ptab"): "\t",
+        qn("w:cr"): "\n",
+        qn("w:noBreakHyphen"): "-",
+    }
+    return query, fixed_text
+
+
 class DocumentParser(ABC):
     """Abstract base class for document parsers.
     
@@ -44,14 +87,14 @@ class WordParser(DocumentParser):
         Args:
             logger: Optional logger for encoding warnings
         """
-        from src.encoding_detector import EncodingDetector
-        self.encoding_detector = EncodingDetector(logger=logger)
+        from src.encoding_detector import get_detector
+        self.encoding_detector = get_detector(logger)
 
-    def parse(self, file_path: str) -> InternalDocument:
+    def parse(self, file_path: Union[str, os.PathLike]) -> InternalDocument:
         """Parse a Word document into internal representation.
 
         Args:
-            file_path: Path to the .docx file
+            file_path: Path to the .docx file (str or path-like)
 
         Returns:
             InternalDocument representation with extracted content
@@ -60,6 +103,34 @@ class WordParser(DocumentParser):
             FileNotFoundError: If the file does not exist
             Exception: If the file cannot be parsed
         """
+        return self._parse_source(os.fspath(file_path))
+
+    def parse_stream(self, stream) -> InternalDocument:
+        """Parse a Word document from a binary file-like object.
+
+        Useful when the document is already in memory, as it avoids a
+        round-trip through the filesystem.
+
+        Args:
+            stream: Seekable binary stream positioned at the start of the .docx data
+
+        Returns:
+            InternalDocument representation with extracted content
+
+        Raises:
+            Exception: If the stream cannot be parsed
+        """
+        return self._parse_source(stream)
+
+    def _parse_source(self, source) -> InternalDocument:
+        """Parse a Word document from a path or binary stream.
+
+        Args:
+            source: Path to the .docx file or a binary file-like object
+
+        Returns:
+            InternalDocument representation with extracted content
+        """
         from docx import Document
         from src.internal_representation import (
             InternalDocument, DocumentMetadata, Section, Paragraph,
@@ -68,12 +139,12 @@ class WordParser(DocumentParser):
         )
 
         try:
-            doc = Document(file_path)
+            doc = Document(source)
         except Exception as e:
             raise Exception(f"Failed to parse Word document: {str(e)}")
 
         # Extract metadata
-        metadata = self._extract_metadata(doc, file_path)
+        metadata = self._extract_metadata(doc)
 
         # Create internal document
         internal_doc = InternalDocument(metadata=metadata)
@@ -81,15 +152,32 @@ class WordParser(DocumentParser):
         # Create a single section for basic text extraction
         section = Section()
 
+        # Resolve paragraph style names once instead of per paragraph
+        style_names, default_style_name = self._build_style_map(doc)
+
+        paragraphs = doc.paragraphs
+        texts = [para.text for para in paragraphs]
+
+        # Check the whole body in one pass; when it is clean, no paragraph
+        # has anything to report or normalize and the per-paragraph
+        # processing can be skipped
+        body_is_clean = self.encoding_detector.is_clean("\n".join(texts))
+
         # Extract text content from paragraphs
-        for para in doc.paragraphs:
-            if para.text.strip():  # Only add non-empty paragraphs
+        for para, para_text in zip(paragraphs, texts):
+            if para_text.strip():  # Only add non-empty paragraphs
                 # Validate and normalize text encoding
-                normalized_text = self._process_text_encoding(para.text)
+                if body_is_clean:
+                    normalized_text = para_text
+                else:
+                    normalized_text = self._process_text_encoding(para_text)
+
+                # Read the style id straight from the w:pStyle element
+                style_name = style_names.get(para._p.style, default_style_name)
 
                 # Check if this is a heading
-                if para.style.name.startswith('Heading'):
-                    heading = self._extract_heading(para, normalized_text)
+                if style_name.startswith('Heading'):
+                    heading = self._extract_heading(para, normalized_text, style_name)
                     if heading:
                         # Start a new section with this heading
                         if section.content or section.heading:
@@ -97,7 +185,7 @@ class WordParser(DocumentParser):
                         section = Section(heading=heading)
                 else:
                     # Check if this is a list item
-                    list_item = self._extract_list_item(para, normalized_text)
+                    list_item = self._extract_list_item(para, normalized_text, style_name)
                     if list_item:
                         # Group consecutive list items into DocumentList
                         # Check if the last content item is a list
@@ -107,7 +195,7 @@ class WordParser(DocumentParser):
                         else:
                             # Create new list
                             # Determine if ordered or unordered based on style
-                            is_ordered = 'List Number' in para.style.name or 'Ordered' in para.style.name
+                            is_ordered = 'List Number' in style_name or 'Ordered' in style_name
                             doc_list = DocumentList(ordered=is_ordered, items=[list_item])
                             section.content.append(doc_list)
                     else:
@@ -150,6 +238,12 @@ class WordParser(DocumentParser):
         Returns:
             Normalized text with encoding issues resolved
         """
+        # Table cells (and paragraphs of a body that failed the document-level
+        # check) are mostly clean; one cheap check skips validation and
+        # normalization for them
+        if self.encoding_detector.is_clean(text):
+            return text
+
         # Validate text encoding and detect issues
         validation_result = self.encoding_detector.validate_text_encoding(text)
 
@@ -166,12 +260,37 @@ class WordParser(DocumentParser):
 
         return normalized_text
 
-    def _extract_metadata(self, doc, file_path: str) -> 'DocumentMetadata':
+    def _build_style_map(self, doc) -> tuple:
+        """Build a lookup of paragraph style ids to style names.
+
+        python-docx resolves ``Paragraph.style`` with an XPath query over
+        styles.xml on every access, which dominates parse time for long
+        documents. Resolving all paragraph styles once lets the parse loop
+        map the raw ``w:pStyle`` value with a dict lookup.
+
+        Args:
+            doc: python-docx Document object
+
+        Returns:
+            Tuple of (style id to name mapping, default paragraph style name)
+        """
+        from docx.enum.style import WD_STYLE_TYPE
+
+        style_names = {
+            style.style_id: style.name
+            for style in doc.styles
+            if style.type == WD_STYLE_TYPE.PARAGRAPH
+        }
+        default_style = doc.styles.default(WD_STYLE_TYPE.PARAGRAPH)
+        default_style_name = default_style.name if default_style is not None else ""
+
+        return style_names, default_style_name
+
+    def _extract_metadata(self, doc) -> 'DocumentMetadata':
         """Extract metadata from Word document.
 
         Args:
             doc: python-docx Document object
-            file_path: Path to the source file
 
         Returns:
             DocumentMetadata object
@@ -188,19 +307,21 @@ class WordParser(DocumentParser):
             source_format="docx"
         )
 
-    def _extract_heading(self, para, text: str = None) -> 'Heading':
+    def _extract_heading(self, para, text: str = None, style_name: str = None) -> 'Heading':
         """Extract heading from a paragraph with heading style.
 
         Args:
             para: python-docx Paragraph object with heading style
             text: Optional pre-processed text (if None, uses para.text)
+            style_name: Optional pre-resolved style name (if None, uses para.style.name)
 
         Returns:
             Heading object or None if not a valid heading
         """
         from src.internal_representation import Heading
 
-        style_name = para.style.name
+        if style_name is None:
+            style_name = para.style.name
         heading_text = text if text is not None else para.text
 
         # Extract heading level from style name (e.g., "Heading 1" -> 1)
@@ -335,19 +456,21 @@ class WordParser(DocumentParser):
 
         return images
 
-    def _extract_list_item(self, para, text: str = None) -> 'ListItem':
+    def _extract_list_item(self, para, text: str = None, style_name: str = None) -> 'ListItem':
         """Extract list item from a paragraph with list style.
 
         Args:
             para: python-docx Paragraph object
             text: Optional pre-processed text (if None, uses para.text)
+            style_name: Optional pre-resolved style name (if None, uses para.style.name)
 
         Returns:
             ListItem object or None if not a list item
         """
         from src.internal_representation import ListItem
 
-        style_name = para.style.name
+        if style_name is None:
+            style_name = para.style.name
         list_text = text if text is not None else para.text
 
         # Check if this is a list style
@@ -377,26 +500,21 @@ class WordParser(DocumentParser):
         """
         from src.internal_representation import Table
 
-        if not table.rows:
+        # Walk the underlying <w:tbl> element directly instead of building
+        # python-docx row and cell proxies for every cell
+        tr_lst = table._tbl.tr_lst
+        if not tr_lst:
             return None
 
-        # Extract headers from first row
-        headers = []
-        if table.rows:
-            first_row = table.rows[0]
-            headers = [
-                self._process_text_encoding(cell.text.strip())
-                for cell in first_row.cells
-            ]
+        all_rows = []
+        above = {}
+        for tr in tr_lst:
+            row_texts, above = self._extract_row_texts(tr, above)
+            all_rows.append(row_texts)
 
-        # Extract data rows (skip first row if it's the header)
-        rows = []
-        for row in table.rows[1:]:
-            row_data = [
-                self._process_text_encoding(cell.text.strip())
-                for cell in row.cells
-            ]
-            rows.append(row_data)
+        # Extract headers from first row, remaining rows are data
+        headers = all_rows[0]
+        rows = all_rows[1:]
 
         # If no data rows, treat first row as data
         if not rows and headers:
@@ -405,6 +523,67 @@ class WordParser(DocumentParser):
 
         return Table(headers=headers, rows=rows)
 
+    def _extract_row_texts(self, tr, above: dict) -> tuple:
+        """Extract cell texts from a <w:tr> element.
+
+        Mirrors python-docx ``_Row.cells``: a horizontally merged cell is
+        repeated once per grid column it spans, and a vertically merged
+        continuation cell takes the text of the cell above it.
+
+        Args:
+            tr: CT_Row element of the row
+            above: Texts of the previous row keyed by layout-grid offset
+
+        Returns:
+            Tuple of (cell texts, texts keyed by grid offset)
+        """
+        texts = []
+        by_offset = {}
+        offset = getattr(tr, "grid_before", 0)
+
+        for tc in tr.tc_lst:
+            span = tc.grid_span
+            if tc.vMerge == "continue" and offset in above:
+                text = above[offset]
+            else:
+                text = self._process_text_encoding(self._cell_text(tc).strip())
+            for i in range(span):
+                by_offset[offset + i] = text
+            texts.extend([text] * span)
+            offset += span
+
+        return texts, by_offset
+
+    def _cell_text(self, tc) -> str:
+        """Get the text of a <w:tc> element, equivalent to ``_Cell.text``.
+
+        Args:
+            tc: CT_Tc element of the cell
+
+        Returns:
+            Paragraph texts of the cell joined with newlines
+        """
+        from docx.oxml.ns import qn
+
+        query, fixed_text = _cell_text_query()
+        p_tag, t_tag, br_tag = qn("w:p"), qn("w:t"), qn("w:br")
+
+        paragraphs = []
+        for element in query(tc):
+            tag = element.tag
+            if tag == p_tag:
+                paragraphs.append([])
+            elif tag == t_tag:
+                paragraphs[-1].append(element.text or "")
+            elif tag == br_tag:
+                # Only text-wrapping breaks are line breaks; page and column
+                # breaks contribute no text
+                if element.get(qn("w:type"), "textWrapping") == "textWrapping":
+                    paragraphs[-1].append("\n")
+            else:
+                paragraphs[-1].append(fixed_text[tag])
+
+        return "\n".join("".join(parts) for parts in paragraphs)
 
 
 class ExcelParser(DocumentParser):
@@ -420,8 +599,9 @@ class ExcelParser(DocumentParser):
         Args:
             logger: Optional logger for encoding warnings
         """
-        from src.encoding_detector import EncodingDetector
-        self.encoding_detector = EncodingDetector(logger=logger)
+        from src.encoding_detector import get_detector
+        self.encoding_detector = get_detector(logger)
+        self._short_cell_cache = {}
 
     def parse(self, file_path: str) -> InternalDocument:
         """Parse an Excel document.
@@ -439,26 +619,39 @@ class ExcelParser(DocumentParser):
         except ImportError:
             raise ImportError("openpyxl is required for Excel parsing. Install it with: pip install openpyxl")
 
+        # Encoding issues are reported once per document, not once per parser
+        self._short_cell_cache.clear()
+
         try:
-            # Load workbook with formulas
-            workbook = openpyxl.load_workbook(file_path, data_only=False)
-            # Load workbook with calculated values for formula evaluation
-            workbook_data = openpyxl.load_workbook(file_path, data_only=True)
+            # Both workbook views are loaded from one read of the file
+            with open(file_path, 'rb') as f:
+                raw_bytes = f.read()
+            # Load workbook with formulas. This one cannot be read-only:
+            # read-only worksheets expose neither merged cell ranges nor
+            # hyperlinks, both of which are rendered
+            workbook = openpyxl.load_workbook(io.BytesIO(raw_bytes), data_only=False)
+            # Load calculated values in read-only mode; only the cached formula
+            # results are needed, so skip building Cell objects for them
+            workbook_data = openpyxl.load_workbook(io.BytesIO(raw_bytes), read_only=True, data_only=True)
         except InvalidFileException as e:
             raise ValueError(f"Invalid Excel file: {e}")
         except Exception as e:
             raise ValueError(f"Failed to load Excel file: {e}")
 
-        # Extract metadata
-        metadata = self._extract_metadata(workbook, file_path)
-
-        # Extract all sheets
-        sections = []
-        for sheet_name in workbook.sheetnames:
-            sheet = workbook[sheet_name]
-            sheet_data = workbook_data[sheet_name]
-            section = self._extract_sheet(sheet, sheet_data)
-            sections.append(section)
+        try:
+            # Extract metadata
+            metadata = self._extract_metadata(workbook, file_path)
+
+            # Extract all sheets
+            sections = []
+            for sheet_name in workbook.sheetnames:
+                sheet = workbook[sheet_name]
+                cached_values = list(workbook_data[sheet_name].iter_rows(values_only=True))
+                section = self._extract_sheet(sheet, cached_values)
+                sections.append(section)
+        finally:
+            # Read-only workbooks keep the archive open until closed
+            workbook_data.close()
 
         return InternalDocument(
             metadata=metadata,
@@ -489,12 +682,12 @@ class ExcelParser(DocumentParser):
             source_format="xlsx"
         )
 
-    def _extract_sheet(self, sheet, sheet_data) -> 'Section':
+    def _extract_sheet(self, sheet, cached_values) -> 'Section':
         """Extract a single sheet as a Section.
 
         Args:
             sheet: openpyxl Worksheet object (with formulas)
-            sheet_data: openpyxl Worksheet object (with calculated values)
+            cached_values: Rows of calculated cell values (tuples, 1-indexed by position)
 
         Returns:
             Section object containing the sheet data
@@ -528,7 +721,7 @@ class ExcelParser(DocumentParser):
             )
 
         # Extract table data from sheet
-        table = self._extract_table_from_sheet(sheet, sheet_data)
+        table = self._extract_table_from_sheet(sheet, cached_values)
 
         # If table has no structure at all, indicate empty
         if not table.headers and not table.rows:
@@ -542,7 +735,7 @@ class ExcelParser(DocumentParser):
             content=[table]
         )
 
-    def _extract_table_from_sheet(self, sheet, sheet_data) -> 'Table':
+    def _extract_table_from_sheet(self, sheet, cached_values) -> 'Table':
         """Extract table data from a worksheet.
 
         Handles:
@@ -555,7 +748,7 @@ class ExcelParser(DocumentParser):
 
         Args:
             sheet: openpyxl Worksheet object (with formulas)
-            sheet_data: openpyxl Worksheet object (with calculated values)
+            cached_values: Rows of calculated cell values (tuples, 1-indexed by position)
 
         Returns:
             Table object
@@ -572,8 +765,8 @@ class ExcelParser(DocumentParser):
             # Get the top-left cell value
             min_row, min_col = merged_range.min_row, merged_range.min_col
             top_left_cell = sheet.cell(min_row, min_col)
-            top_left_cell_data = sheet_data.cell(min_row, min_col)
-            value = self._get_cell_value(top_left_cell, top_left_cell_data)
+            calculated_value = self._get_cached_value(cached_values, min_row, min_col)
+            value = self._get_cell_value(top_left_cell, calculated_value)
 
             # Map all cells in the merged range to this value
             for row in range(merged_range.min_row, merged_range.max_row + 1):
@@ -588,8 +781,8 @@ class ExcelParser(DocumentParser):
                 if (row_idx, col_idx) in merged_cells_map:
                     value = merged_cells_map[(row_idx, col_idx)]
                 else:
-                    cell_data = sheet_data.cell(row_idx, col_idx)
-                    value = self._get_cell_value(cell, cell_data)
+                    calculated_value = self._get_cached_value(cached_values, row_idx, col_idx)
+                    value = self._get_cell_value(cell, calculated_value)
 
                 row_data.append(value)
 
@@ -623,6 +816,31 @@ class ExcelParser(DocumentParser):
     def _process_text_encoding(self, text: str) -> str:
         """Process and validate text encoding.
 
+        Short values are memoized, so labels repeated across many cells are
+        validated (and any issues logged) only the first time they are seen.
+
+        Args:
+            text: Extracted text to process
+
+        Returns:
+            Normalized text with encoding issues resolved
+        """
+        if self.encoding_detector.is_short_ascii(text):
+            return text
+
+        if len(text) > SHORT_CELL_TEXT_LENGTH:
+            return self._validate_and_normalize(text)
+
+        normalized_text = self._short_cell_cache.get(text)
+        if normalized_text is None:
+            normalized_text = self._validate_and_normalize(text)
+            if len(self._short_cell_cache) < SHORT_CELL_CACHE_SIZE:
+                self._short_cell_cache[text] = normalized_text
+        return normalized_text
+
+    def _validate_and_normalize(self, text: str) -> str:
+        """Validate text encoding, log serious issues and normalize the text.
+
         Args:
             text: Extracted text to process
 
@@ -650,12 +868,30 @@ class ExcelParser(DocumentParser):
 
         return normalized_text
 
-    def _get_cell_value(self, cell, cell_data):
+    def _get_cached_value(self, cached_values, row: int, col: int):
+        """Look up a calculated value from read-only row data.
+
+        Args:
+            cached_values: Rows of calculated cell values
+            row: 1-indexed row number
+            col: 1-indexed column number
+
+        Returns:
+            Calculated value, or None if the cell is outside the cached range
+        """
+        if row > len(cached_values):
+            return None
+        row_values = cached_values[row - 1]
+        if col > len(row_values):
+            return None
+        return row_values[col - 1]
+
+    def _get_cell_value(self, cell, calculated_value=None):
         """Get the value from a cell, handling formulas, errors, dates, and hyperlinks.
 
         Args:
             cell: openpyxl Cell object (with formulas)
-            cell_data: openpyxl Cell object (with calculated values)
+            calculated_value: Cached result of the cell's formula, if any
 
         Returns:
             Cell value as string, with special handling for formulas, errors, dates, and hyperlinks
@@ -669,10 +905,9 @@ class ExcelParser(DocumentParser):
             # Return Markdown link format
             return f"[{link_text}]({link_url})"
 
-        # Handle formulas - use the calculated value from cell_data
+        # Handle formulas - use the cached calculated value
         if cell.data_type == 'f':  # Formula
-            # Get the calculated value from the data_only workbook
-            calculated_value = cell_data.value
+            # Use the calculated value from the data_only workbook
             if calculated_value is not None:
                 return self._format_value(calculated_value)
             else:
@@ -850,9 +1085,9 @@ class PDFParser(DocumentParser):
         Args:
             logger: Optional logger for encoding warnings
         """
-        from src.encoding_detector import EncodingDetector
+        from src.encoding_detector import get_detector
         from src.text_cleaner import TextCleaner
-        self.encoding_detector = EncodingDetector(logger=logger)
+        self.encoding_detector = get_detector(logger)
         self.text_cleaner = TextCleaner()
 
     def parse(self, file_path: str) -> InternalDocument:
@@ -865,10 +1100,8 @@ class PDFParser(DocumentParser):
             InternalDocument representation
         """
         import PyPDF2
-        import pdfplumber
         from pathlib import Path
         from src.internal_representation import Section, Heading, ImageReference
-        from tqdm import tqdm
 
         # Extract metadata
         metadata = self._extract_metadata(file_path)
@@ -885,49 +1118,7 @@ class PDFParser(DocumentParser):
 
         try:
             # Use pdfplumber for better text extraction and table detection
-            with pdfplumber.open(file_path) as pdf:
-                total_pages = len(pdf.pages)
-                
-                # 進捗バーを表示
-                with tqdm(total=total_pages, desc="PDFページ処理中", unit="ページ") as pbar:
-                    for page_num, page in enumerate(pdf.pages, start=1):
-                        # Get images for this page
-                        page_images = [img for img in images if img.page_number == page_num]
-
-                        # Extract tables from page
-                        tables = self._extract_tables(page)
-
-                        # Extract text from page
-                        text = page.extract_text()
-
-                        content_blocks = []
-
-                        if text and text.strip():
-                            # Validate and normalize text encoding
-                            text = self._process_text_encoding(text)
-                            
-                            # Clean text (remove orphan lines, fix line breaks)
-                            text = self.text_cleaner.clean_text(text)
-
-                            # Detect structure in text
-                            content_blocks = self._detect_structure(text, page)
-
-                            # Add tables to content blocks
-                            content_blocks.extend(tables)
-
-                        # Add image references to content blocks (even if no text)
-                        for img in page_images:
-                            content_blocks.append(img)
-
-                        # Create section for this page if there's any content (text or images)
-                        if content_blocks:
-                            section = Section(
-                                heading=Heading(level=2, text=f"Page {page_num}"),
-                                content=content_blocks
-                            )
-                            sections.append(section)
-                        
-                        pbar.update(1)
+            sections.extend(self.iter_pages(file_path, images))
 
         except Exception as e:
             # If pdfplumber fails, try PyPDF2 as fallback
@@ -976,6 +1167,71 @@ class PDFParser(DocumentParser):
             images=images
         )
 
+    def iter_pages(self, file_path: str, images: Optional[list] = None) -> Iterator['Section']:
+        """Yield a section for each PDF page that has content.
+
+        Pages are converted one at a time and pdfplumber's per-page layout
+        caches are released as soon as a page is done, so memory does not
+        grow with every page object parsed so far.
+
+        Args:
+            file_path: Path to the .pdf file
+            images: Image references to attach to their pages
+
+        Yields:
+            Section for each page with text, tables or images
+        """
+        import pdfplumber
+        from src.internal_representation import Section, Heading
+        from tqdm import tqdm
+
+        images_by_page = {}
+        for img in images or []:
+            images_by_page.setdefault(img.page_number, []).append(img)
+
+        with pdfplumber.open(file_path) as pdf:
+            total_pages = len(pdf.pages)
+
+            # 進捗バーを表示
+            with tqdm(total=total_pages, desc="PDFページ処理中", unit="ページ") as pbar:
+                for page_num, page in enumerate(pdf.pages, start=1):
+                    try:
+                        # Extract tables from page
+                        tables = self._extract_tables(page)
+
+                        # Extract text from page
+                        text = page.extract_text()
+
+                        content_blocks = []
+
+                        if text and text.strip():
+                            # Validate and normalize text encoding
+                            text = self._process_text_encoding(text)
+
+                            # Clean text (remove orphan lines, fix line breaks)
+                            text = self.text_cleaner.clean_text(text)
+
+                            # Detect structure in text
+                            content_blocks = self._detect_structure(text, page)
+
+                            # Add tables to content blocks
+                            content_blocks.extend(tables)
+                    finally:
+                        # Drop cached chars/objects for this page
+                        page.close()
+
+                    # Add image references to content blocks (even if no text)
+                    content_blocks.extend(images_by_page.get(page_num, ()))
+
+                    # Create section for this page if there's any content (text or images)
+                    if content_blocks:
+                        yield Section(
+                            heading=Heading(level=2, text=f"Page {page_num}"),
+                            content=content_blocks
+                        )
+
+                    pbar.update(1)
+
     def _process_text_encoding(self, text: str) -> str:
         """Process and validate text encoding.
 
@@ -985,6 +1241,9 @@ class PDFParser(DocumentParser):
         Returns:
             Normalized text with encoding issues resolved
         """
+        if self.encoding_detector.is_short_ascii(text):
+            return text
+
         # Validate text encoding and detect issues
         validation_result = self.encoding_detector.validate_text_encoding(text)
 
@@ -9,6 +9,13 @@ import re
 from typing import List
 
 
+# Lines starting with -, *, or number.
+_LIST_ITEM_RE = re.compile(r'^\s*[-*]|\d+\.')
+
+# Table separator cells (dashes with optional alignment colons)
+_SEPARATOR_CELL_RE = re.compile(r'^:?-+:?$')
+
+
 class PrettyPrinter:
     """Formats Markdown text for improved readability.
     
@@ -94,10 +101,10 @@ class PrettyPrinter:
             line = lines[i]
             
             # Check if this line is a table row
-            if self._is_table_row(line):
+            if self.is_table_row(line):
                 # Collect all consecutive table rows
                 table_lines = []
-                while i < len(lines) and self._is_table_row(lines[i]):
+                while i < len(lines) and self.is_table_row(lines[i]):
                     table_lines.append(lines[i])
                     i += 1
                 
@@ -110,7 +117,7 @@ class PrettyPrinter:
         
         return "\n".join(result_lines)
     
-    def _is_table_row(self, line: str) -> bool:
+    def is_table_row(self, line: str) -> bool:
         """Check if a line is a table row.
         
         Args:
@@ -137,9 +144,23 @@ class PrettyPrinter:
         # Parse each row into cells
         rows = []
         for line in table_lines:
-            cells = self._parse_table_row(line)
+            cells = self.parse_table_row(line)
             rows.append(cells)
         
+        return self.align_rows(rows)
+    
+    def align_rows(self, rows: List[List[str]]) -> List[str]:
+        """Align pre-split table rows into Markdown table lines.
+        
+        Args:
+            rows: Table rows as lists of stripped cell strings
+            
+        Returns:
+            List of aligned table row strings
+        """
+        if not rows:
+            return []
+        
         # Calculate maximum width for each column
         num_columns = max(len(row) for row in rows) if rows else 0
         column_widths = [0] * num_columns
@@ -173,7 +194,7 @@ class PrettyPrinter:
         
         return aligned_lines
     
-    def _parse_table_row(self, line: str) -> List[str]:
+    def parse_table_row(self, line: str) -> List[str]:
         """Parse a table row into individual cells.
         
         Args:
@@ -203,7 +224,7 @@ class PrettyPrinter:
         Returns:
             True if the cell is a separator, False otherwise
         """
-        return bool(re.match(r'^:?-+:?$', cell))
+        return _SEPARATOR_CELL_RE.match(cell) is not None
     
     def ensure_blank_lines(self, markdown: str) -> str:
         """Ensure proper blank lines around block elements.
@@ -225,7 +246,7 @@ class PrettyPrinter:
         
         for i, line in enumerate(lines):
             # Check if we need a blank line before this line
-            if i > 0 and self._needs_blank_before(line, lines[i-1]):
+            if i > 0 and self.needs_blank_before(line, lines[i-1]):
                 # Add blank line if previous line is not already blank
                 if result_lines and result_lines[-1] != "":
                     result_lines.append("")
@@ -233,14 +254,14 @@ class PrettyPrinter:
             result_lines.append(line)
             
             # Check if we need a blank line after this line
-            if i < len(lines) - 1 and self._needs_blank_after(line, lines[i+1]):
+            if i < len(lines) - 1 and self.needs_blank_after(line, lines[i+1]):
                 # Add blank line if next line is not already blank
                 if lines[i+1] != "":
                     result_lines.append("")
         
         return "\n".join(result_lines)
     
-    def _needs_blank_before(self, current_line: str, previous_line: str) -> bool:
+    def needs_blank_before(self, current_line: str, previous_line: str) -> bool:
         """Check if a blank line is needed before the current line.
         
         Args:
@@ -259,16 +280,16 @@ class PrettyPrinter:
             return True
         
         # Blank line before tables
-        if self._is_table_row(current_line) and not self._is_table_row(previous_line):
+        if self.is_table_row(current_line) and not self.is_table_row(previous_line):
             return True
         
         # Blank line before lists (starting with -, *, or number.)
-        if re.match(r'^\s*[-*]|\d+\.', current_line) and not re.match(r'^\s*[-*]|\d+\.', previous_line):
+        if _LIST_ITEM_RE.match(current_line) and not _LIST_ITEM_RE.match(previous_line):
             return True
         
         return False
     
-    def _needs_blank_after(self, current_line: str, next_line: str) -> bool:
+    def needs_blank_after(self, current_line: str, next_line: str) -> bool:
         """Check if a blank line is needed after the current line.
         
         Args:
@@ -283,11 +304,11 @@ class PrettyPrinter:
             return True
         
         # Blank line after tables
-        if self._is_table_row(current_line) and not self._is_table_row(next_line):
+        if self.is_table_row(current_line) and not self.is_table_row(next_line):
             return True
         
         # Blank line after lists
-        if re.match(r'^\s*[-*]|\d+\.', current_line) and not re.match(r'^\s*[-*]|\d+\.', next_line):
+        if _LIST_ITEM_RE.match(current_line) and not _LIST_ITEM_RE.match(next_line):
             return True
         
         return False
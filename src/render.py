@@ -0,0 +1,171 @@
+"""
+Single-pass Markdown renderer.
+
+This module provides the MarkdownRenderer class which walks an
+InternalDocument once and writes formatted Markdown directly to a text
+stream. It produces the same layout as running MarkdownSerializer followed
+by PrettyPrinter, without building the intermediate Markdown string and
+re-splitting it into lines for each formatting pass. The one difference is
+in table cells containing an escaped pipe (``\\|``): the renderer keeps the
+pipe inside the cell, while the two-stage path splits the cell there.
+"""
+
+from typing import List, Optional, TextIO
+
+from src.internal_representation import InternalDocument, Table
+from src.markdown_serializer import MarkdownSerializer
+from src.pretty_printer import PrettyPrinter
+
+
+class _LineEmitter:
+    """Applies PrettyPrinter layout rules to a stream of Markdown lines.
+
+    Lines pass through the same three stages as PrettyPrinter.format
+    (whitespace normalization, table alignment, blank line insertion), but
+    incrementally, so only the current table run is ever buffered.
+    """
+
+    def __init__(self, out: TextIO, printer: PrettyPrinter):
+        self.out = out
+        self.printer = printer
+        self._pending_blank = False
+        self._table_rows: List[List[str]] = []
+        self._previous: Optional[str] = None
+        self._last_written: Optional[str] = None
+
+    def emit_text(self, text: str) -> None:
+        """Emit a (possibly multi-line) block of Markdown text."""
+        for line in text.split("\n"):
+            self.emit_line(line)
+
+    def emit_line(self, line: str) -> None:
+        """Emit a single Markdown line."""
+        # Stage 1: strip trailing whitespace and collapse blank runs. Blank
+        # lines are held back so trailing blanks can be dropped at the end.
+        line = line.rstrip()
+        if line == "":
+            self._pending_blank = True
+            return
+        self._release_blank()
+
+        # Stage 2: collect runs of table rows for alignment
+        if self.printer.is_table_row(line):
+            self._table_rows.append(self.printer.parse_table_row(line))
+        else:
+            self._flush_table()
+            self._layout(line)
+
+    def emit_table_row(self, cells: List[str]) -> None:
+        """Emit a table row from already escaped cells, skipping the reparse."""
+        self._release_blank()
+        # An empty row still renders as one empty cell ("|  |")
+        self._table_rows.append([cell.strip() for cell in cells] or [""])
+
+    def close(self) -> None:
+        """Flush buffered output and terminate the document with a newline."""
+        self._pending_blank = False
+        self._flush_table()
+        if self._last_written is None:
+            # Matches PrettyPrinter output for a document with no content
+            self._write("")
+        self._write("")
+
+    def _release_blank(self) -> None:
+        if self._pending_blank:
+            self._pending_blank = False
+            self._flush_table()
+            self._layout("")
+
+    def _flush_table(self) -> None:
+        if self._table_rows:
+            rows, self._table_rows = self._table_rows, []
+            for aligned in self.printer.align_rows(rows):
+                self._layout(aligned)
+
+    def _layout(self, line: str) -> None:
+        # Stage 3: blank lines around block elements
+        previous = self._previous
+        if previous is not None:
+            if line != "" and self.printer.needs_blank_after(previous, line):
+                self._write("")
+            if self.printer.needs_blank_before(line, previous) and self._last_written != "":
+                self._write("")
+        self._write(line)
+        self._previous = line
+
+    def _write(self, line: str) -> None:
+        if self._last_written is not None:
+            self.out.write("\n")
+        self.out.write(line)
+        self._last_written = line
+
+
+class MarkdownRenderer:
+    """Renders internal documents to formatted Markdown in a single pass.
+
+    Block-level Markdown is produced by the MarkdownSerializer's per-block
+    methods and laid out by PrettyPrinter's rules as it is emitted. Table
+    cells are fed to the aligner straight from the document tree instead of
+    being serialized and parsed back out of the Markdown text, so a cell
+    containing an escaped pipe stays one cell. That is the only way the
+    output differs from MarkdownSerializer followed by PrettyPrinter.
+
+    Attributes:
+        serializer: Serializer used for individual content blocks
+        pretty_printer: Pretty printer providing layout rules
+    """
+
+    def __init__(
+        self,
+        serializer: MarkdownSerializer,
+        pretty_printer: Optional[PrettyPrinter] = None
+    ):
+        """Initialize the renderer.
+
+        Args:
+            serializer: Serializer used for individual content blocks
+            pretty_printer: Pretty printer providing layout rules
+        """
+        self.serializer = serializer
+        self.pretty_printer = pretty_printer or PrettyPrinter()
+
+    def render(self, document: InternalDocument, out: TextIO) -> None:
+        """Render a document as formatted Markdown.
+
+        Args:
+            document: The internal document to render
+            out: Text stream receiving the Markdown output
+        """
+        emitter = _LineEmitter(out, self.pretty_printer)
+        serializer = self.serializer
+
+        if serializer.include_metadata and document.metadata:
+            metadata_md = serializer.serialize_metadata(document.metadata)
+            if metadata_md:
+                emitter.emit_text(metadata_md)
+                emitter.emit_line("")
+
+        for section in document.sections:
+            # Sections are joined without separators, as in serialize()
+            blocks = []
+            if section.heading:
+                blocks.append(serializer.serialize_heading(section.heading))
+            for content in section.content:
+                if isinstance(content, Table):
+                    if content.headers or content.rows:
+                        blocks.append(content)
+                else:
+                    content_md = serializer.serialize_content_block(content)
+                    if content_md:
+                        blocks.append(content_md)
+
+            for i, block in enumerate(blocks):
+                if i > 0:
+                    emitter.emit_line("")
+                if isinstance(block, Table):
+                    for cells in serializer.table_cells(block):
+                        emitter.emit_table_row(cells)
+                else:
+                    emitter.emit_text(block)
+
+        emitter.close()
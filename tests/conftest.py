@@ -1,16 +1,353 @@
 """Pytest configuration and shared fixtures."""
 
+import hashlib
+import os
+import shutil
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+
 import pytest
 from hypothesis import settings, Verbosity
+from hypothesis.database import DirectoryBasedExampleDatabase
 
-# Configure Hypothesis
+# Configure Hypothesis. The ci profile is deterministic and skips the
+# example database, so runs do no .hypothesis/ disk I/O; select it with
+# HYPOTHESIS_PROFILE=ci. The ci-replay profile instead keeps the example
+# database (HYPOTHESIS_DATABASE_DIR, default .hypothesis/examples) so a CI
+# cache of that directory replays previously failing inputs first. Neither
+# sets max_examples: every property test fixes its own count in @settings,
+# which takes precedence over the loaded profile
 settings.register_profile("default", max_examples=100, deadline=None)
-settings.register_profile("ci", max_examples=1000, deadline=None)
+settings.register_profile("ci", deadline=None, derandomize=True, database=None)
+settings.register_profile(
+    "ci-replay",
+    deadline=None,
+    database=DirectoryBasedExampleDatabase(
+        os.environ.get("HYPOTHESIS_DATABASE_DIR", ".hypothesis/examples")
+    ),
+)
 settings.register_profile("dev", max_examples=10, verbosity=Verbosity.verbose)
-settings.load_profile("default")
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "default"))
+
+
+@pytest.fixture(autouse=True)
+def _reset_module_caches():
+    """Start every test with empty process-wide caches.
+
+    Keeps tests independent of execution order, so they give the same
+    results whether run serially or spread across pytest-xdist workers.
+    """
+    from src.encoding_detector import get_detector
+    from src.parser_cache import clear_memory_cache
+
+    clear_memory_cache()
+    get_detector.cache_clear()
+    yield
 
 
 @pytest.fixture
 def temp_dir(tmp_path):
     """Provide a temporary directory for test files."""
     return tmp_path
+
+
+@pytest.fixture(scope="session")
+def shared_docs_dir(tmp_path_factory):
+    """Provide a session-wide directory for prebuilt test documents."""
+    return tmp_path_factory.mktemp("shared_docs")
+
+
+@pytest.fixture(scope="session")
+def simple_docx_path(shared_docs_dir):
+    """Build a simple Word document (heading + paragraph) once per session."""
+    from docx import Document
+
+    doc = Document()
+    doc.add_heading("Word Document", level=1)
+    doc.add_paragraph("This is a Word document.")
+
+    path = shared_docs_dir / "simple.docx"
+    doc.save(str(path))
+    return path
+
+
+@pytest.fixture(scope="session")
+def simple_xlsx_path(shared_docs_dir):
+    """Build a simple Excel workbook (one small table) once per session."""
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Name", "Value"])
+    ws.append(["Item 1", 100])
+    ws.append(["Item 2", 200])
+
+    path = shared_docs_dir / "simple.xlsx"
+    wb.save(str(path))
+    return path
+
+
+@pytest.fixture(scope="session")
+def complete_docx_path(shared_docs_dir):
+    """Build a Word document with headings, a list, formatting and a table once per session."""
+    from docx import Document
+
+    doc = Document()
+    doc.add_heading("Test Document", level=1)
+    doc.add_paragraph("This is a test document with various elements.")
+
+    doc.add_heading("Section 1", level=2)
+    doc.add_paragraph("This section contains a list:")
+    doc.add_paragraph("Item 1", style='List Bullet')
+    doc.add_paragraph("Item 2", style='List Bullet')
+    doc.add_paragraph("Item 3", style='List Bullet')
+
+    doc.add_heading("Section 2", level=2)
+    para = doc.add_paragraph()
+    para.add_run("This text is ")
+    para.add_run("bold").bold = True
+    para.add_run(" and this is ")
+    para.add_run("italic").italic = True
+    para.add_run(".")
+
+    doc.add_heading("Section 3: Table", level=2)
+    table = doc.add_table(rows=3, cols=3)
+    for row, values in zip(table.rows, [
+        ("Name", "Age", "City"),
+        ("Alice", "30", "New York"),
+        ("Bob", "25", "London"),
+    ]):
+        for cell, value in zip(row.cells, values):
+            cell.text = value
+
+    path = shared_docs_dir / "complete.docx"
+    doc.save(str(path))
+    return path
+
+
+# Smallest package Word readers accept: content types, the package
+# relationship and a main document part with an empty body
+_EMPTY_DOCX_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" '
+        'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        '</Types>'
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Target="word/document.xml" Type="http://schemas.'
+        'openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+        '</Relationships>'
+    ),
+    "word/document.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        '<w:body/></w:document>'
+    ),
+}
+
+
+def _empty_docx(path):
+    """Write a minimal Word document with no content."""
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as package:
+        for name, xml in _EMPTY_DOCX_PARTS.items():
+            package.writestr(name, xml)
+    return path
+
+
+def _whitespace_docx(path):
+    """Write a Word document whose paragraphs contain only whitespace."""
+    from docx import Document
+
+    doc = Document()
+    doc.add_paragraph("   ")  # Only spaces
+    doc.add_paragraph("\n\n")  # Only newlines
+    doc.add_paragraph("\t\t")  # Only tabs
+    doc.save(str(path))
+    return path
+
+
+def _empty_xlsx(path, titles):
+    """Write an Excel workbook made of empty sheets."""
+    from openpyxl import Workbook
+
+    # Write-only workbooks stream sheet XML straight to the archive
+    wb = Workbook(write_only=True)
+    for title in titles:
+        wb.create_sheet(title)
+    wb.save(str(path))
+    return path
+
+
+def _write_pdf(path, objects):
+    """Write numbered PDF objects (catalog first) with a cross-reference table."""
+    data = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(data))
+        data += b"%d 0 obj%sendobj\n" % (number, body)
+
+    xref_offset = len(data)
+    data += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    data += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    data += b"trailer<</Size %d/Root 1 0 R>>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, xref_offset
+    )
+
+    path.write_bytes(bytes(data))
+    return path
+
+
+def _blank_pdf(path, pages):
+    """Write a minimal PDF made of blank letter-size pages."""
+    objects = [
+        b"<</Type/Catalog/Pages 2 0 R>>",
+        b"<</Type/Pages/Count %d/Kids[%s]>>" % (
+            pages, b" ".join(b"%d 0 R" % (3 + i) for i in range(pages))
+        ),
+    ]
+    objects += [b"<</Type/Page/Parent 2 0 R/MediaBox[0 0 612 792]>>"] * pages
+    return _write_pdf(path, objects)
+
+
+def _text_pdf(path, lines):
+    """Write a one-page PDF showing ASCII lines in Helvetica, 20pt apart."""
+    content = b"BT /F1 12 Tf 100 750 Td" + b"".join(
+        b" 0 %d Td (%s) Tj" % (-20 if i else 0, line.encode("ascii"))
+        for i, line in enumerate(lines)
+    ) + b" ET"
+    objects = [
+        b"<</Type/Catalog/Pages 2 0 R>>",
+        b"<</Type/Pages/Count 1/Kids[3 0 R]>>",
+        b"<</Type/Page/Parent 2 0 R/MediaBox[0 0 612 792]"
+        b"/Resources<</Font<</F1 4 0 R>>>>/Contents 5 0 R>>",
+        b"<</Type/Font/Subtype/Type1/BaseFont/Helvetica>>",
+        b"<</Length %d>>stream\n%s\nendstream\n" % (len(content), content),
+    ]
+    return _write_pdf(path, objects)
+
+
+@pytest.fixture(scope="session")
+def text_pdf_path(shared_docs_dir):
+    """Build a one-page text PDF once per session, without reportlab."""
+    return _text_pdf(
+        shared_docs_dir / "text.pdf", ["Test Document", "Normal text content"]
+    )
+
+
+# Edge-case inputs: file name -> builder taking the destination path
+EDGE_CASE_FILES = {
+    "empty.docx": _empty_docx,
+    "whitespace.docx": _whitespace_docx,
+    "empty.xlsx": partial(_empty_xlsx, titles=("Sheet1",)),
+    "all_empty.xlsx": partial(_empty_xlsx, titles=("Empty1", "Empty2", "Empty3")),
+    "empty.pdf": partial(_blank_pdf, pages=1),
+    "blank_pages.pdf": partial(_blank_pdf, pages=3),
+}
+
+
+@pytest.fixture(scope="session")
+def edge_case_files(shared_docs_dir):
+    """Write all edge-case input files concurrently once per session.
+
+    The saves are independent and spend much of their time in zlib and
+    file I/O, so running them on a thread pool overlaps their cost.
+
+    Returns:
+        Mapping of file name to path
+    """
+    with ThreadPoolExecutor() as executor:
+        futures = {
+            name: executor.submit(build, shared_docs_dir / name)
+            for name, build in EDGE_CASE_FILES.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+
+@pytest.fixture(scope="session")
+def empty_docx_path(edge_case_files):
+    """Word document with no content."""
+    return edge_case_files["empty.docx"]
+
+
+@pytest.fixture(scope="session")
+def whitespace_docx_path(edge_case_files):
+    """Word document whose paragraphs contain only whitespace."""
+    return edge_case_files["whitespace.docx"]
+
+
+@pytest.fixture(scope="session")
+def empty_xlsx_path(edge_case_files):
+    """Excel workbook with a single empty sheet."""
+    return edge_case_files["empty.xlsx"]
+
+
+@pytest.fixture(scope="session")
+def all_empty_xlsx_path(edge_case_files):
+    """Excel workbook with three empty sheets."""
+    return edge_case_files["all_empty.xlsx"]
+
+
+@pytest.fixture(scope="session")
+def empty_pdf_path(edge_case_files):
+    """PDF with one blank page."""
+    return edge_case_files["empty.pdf"]
+
+
+@pytest.fixture(scope="session")
+def blank_pages_pdf_path(edge_case_files):
+    """PDF with three blank pages."""
+    return edge_case_files["blank_pages.pdf"]
+
+
+@pytest.fixture
+def copy_shared_doc(tmp_path):
+    """Copy a shared document into the test's tmp_path.
+
+    Use this when the conversion writes files next to its input, so the
+    shared session copy is never modified.
+    """
+    def _copy(source, name=None):
+        destination = tmp_path / (name or source.name)
+        shutil.copy(source, destination)
+        return destination
+
+    return _copy
+
+
+@pytest.fixture(scope="session")
+def cached_word_parse():
+    """Parse Word documents once per distinct file content for the session.
+
+    Returns a callable taking a document path. Repeat calls for an unchanged
+    file (same path, mtime and size) are answered without reading it again;
+    otherwise results are keyed by a hash of the file bytes, so tests that
+    parse identical documents share one InternalDocument. Callers must treat
+    the returned document as read-only.
+    """
+    from src.parsers import WordParser
+
+    parser = WordParser()
+    parsed = {}
+
+    @lru_cache(maxsize=64)
+    def _parse_file(path, mtime_ns, size):
+        with open(path, "rb") as f:
+            key = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+        if key not in parsed:
+            parsed[key] = parser.parse(path)
+        return parsed[key]
+
+    def _parse(path):
+        path = str(path)
+        stat = os.stat(path)
+        return _parse_file(path, stat.st_mtime_ns, stat.st_size)
+
+    return _parse
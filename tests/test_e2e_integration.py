@@ -24,11 +24,6 @@ from openpyxl import Workbook
 from src.config import ConversionConfig, LogLevel, TableStyle, ImageFormat
 from src.logger import Logger
 from src.conversion_orchestrator import ConversionOrchestrator
-from src.parsers import WordParser, ExcelParser, PDFParser
-from src.markdown_serializer import MarkdownSerializer
-from src.pretty_printer import PrettyPrinter
-from src.image_extractor import ImageExtractor
-from src.ocr_engine import OCREngine
 
 
 class TestEndToEndWordConversion:
@@ -412,31 +407,18 @@ class TestEndToEndPDFConversion:
 class TestEndToEndBatchConversion:
     """End-to-end tests for batch conversion."""
     
-    def test_batch_conversion_multiple_formats(self, tmp_path):
+    def test_batch_conversion_multiple_formats(
+        self, tmp_path, simple_docx_path, simple_xlsx_path, copy_shared_doc
+    ):
         """Test batch conversion of multiple file formats.
         
         Validates: Requirements 6.5, 4.5
         """
-        # Create multiple test files
-        files = []
-        
-        # Word document
-        doc = Document()
-        doc.add_heading("Word Document", level=1)
-        doc.add_paragraph("This is a Word document.")
-        word_path = tmp_path / "test1.docx"
-        doc.save(str(word_path))
-        files.append(str(word_path))
-        
-        # Excel spreadsheet
-        wb = Workbook()
-        ws = wb.active
-        ws.append(["Name", "Value"])
-        ws.append(["Item 1", 100])
-        ws.append(["Item 2", 200])
-        excel_path = tmp_path / "test2.xlsx"
-        wb.save(str(excel_path))
-        files.append(str(excel_path))
+        # Batch conversion writes .md files next to the inputs, so work on copies
+        files = [
+            str(copy_shared_doc(simple_docx_path, "test1.docx")),
+            str(copy_shared_doc(simple_xlsx_path, "test2.xlsx")),
+        ]
         
         # Another Word document
         doc2 = Document()
@@ -598,18 +580,12 @@ class TestEndToEndErrorHandling:
 class TestEndToEndPreviewAndDryRun:
     """End-to-end tests for preview and dry-run modes."""
     
-    def test_preview_mode(self, tmp_path):
+    def test_preview_mode(self, tmp_path, simple_docx_path):
         """Test preview mode without file output.
         
         Validates: Requirements 11.1, 11.2
         """
-        # Create test document
-        doc = Document()
-        doc.add_heading("Preview Test", level=1)
-        doc.add_paragraph("This is a preview test.")
-        
-        file_path = tmp_path / "preview.docx"
-        doc.save(str(file_path))
+        file_path = simple_docx_path
         
         output_path = tmp_path / "preview.md"
         config = ConversionConfig(
@@ -629,18 +605,12 @@ class TestEndToEndPreviewAndDryRun:
         # Verify file was NOT created in preview mode
         assert not output_path.exists()
     
-    def test_dry_run_mode(self, tmp_path):
+    def test_dry_run_mode(self, tmp_path, simple_docx_path):
         """Test dry-run mode without file output.
         
         Validates: Requirements 11.5
         """
-        # Create test document
-        doc = Document()
-        doc.add_heading("Dry Run Test", level=1)
-        doc.add_paragraph("This is a dry run test.")
-        
-        file_path = tmp_path / "dryrun.docx"
-        doc.save(str(file_path))
+        file_path = simple_docx_path
         
         output_path = tmp_path / "dryrun.md"
         config = ConversionConfig(
@@ -664,18 +634,12 @@ class TestEndToEndPreviewAndDryRun:
 class TestEndToEndLogging:
     """End-to-end tests for logging functionality."""
     
-    def test_logging_during_conversion(self, tmp_path):
+    def test_logging_during_conversion(self, tmp_path, simple_docx_path, copy_shared_doc):
         """Test that logging works correctly during conversion.
         
         Validates: Requirements 10.1-10.4
         """
-        # Create test document
-        doc = Document()
-        doc.add_heading("Logging Test", level=1)
-        doc.add_paragraph("Testing logging functionality.")
-        
-        file_path = tmp_path / "logging_test.docx"
-        doc.save(str(file_path))
+        file_path = copy_shared_doc(simple_docx_path, "logging_test.docx")
         
         output_path = tmp_path / "logging_test.md"
         log_file = tmp_path / "conversion.log"
@@ -10,48 +10,53 @@ Tests cover:
 Requirements: 4.3
 """
 
+import logging
+
 import pytest
 import os
 from pathlib import Path
-from src.logger import LogLevel
+from src.config import ConversionConfig
+from src.conversion_orchestrator import ConversionOrchestrator
+from src.logger import Logger, LogLevel
 
 
-class TestEmptyFileEdgeCases:
-    """Test empty file handling across all supported formats."""
+@pytest.fixture
+def convert():
+    """Convert files with a fresh orchestrator per call, logging errors only.
     
-    def test_empty_word_document(self, tmp_path):
-        """Test that empty Word documents are handled correctly.
-        
-        Validates: Requirements 4.3 - Empty file handling for Word documents
-        """
-        from src.conversion_orchestrator import ConversionOrchestrator
-        from src.config import ConversionConfig
-        from src.logger import Logger
-        
-        try:
-            import docx
-        except ImportError:
-            pytest.skip("python-docx not installed")
-        
-        # Create an empty Word document
-        docx_path = tmp_path / "empty.docx"
-        doc = docx.Document()
-        # Don't add any content - leave it completely empty
-        doc.save(docx_path)
-        
-        # Configure conversion
+    The shared "doc2md" logger is configured for ERROR for the duration of
+    the test and its previous level is restored afterwards.
+    """
+    shared_logger = logging.getLogger("doc2md")
+    previous_level = shared_logger.level
+    # Results carry warnings and errors; log output is not inspected
+    logger = Logger(log_level=LogLevel.ERROR)
+    
+    def _convert(path):
         config = ConversionConfig(
-            input_path=str(docx_path),
+            input_path=str(path),
             output_path=None,  # Output to stdout
             preview_mode=False,
             dry_run=False
         )
+        return ConversionOrchestrator(config, logger).convert(path)
+    
+    yield _convert
+    
+    Logger.close()
+    shared_logger.setLevel(previous_level)
+
+
+class TestEmptyFileEdgeCases:
+    """Test empty file handling across all supported formats."""
+    
+    def test_empty_word_document(self, convert, empty_docx_path):
+        """Test that empty Word documents are handled correctly.
         
-        logger = Logger(log_level=LogLevel.INFO)
-        orchestrator = ConversionOrchestrator(config, logger)
-        
+        Validates: Requirements 4.3 - Empty file handling for Word documents
+        """
         # Convert the empty document
-        result = orchestrator.convert(str(docx_path))
+        result = convert(empty_docx_path)
         
         # Verify the result
         assert result.success is True, "Empty Word document conversion should succeed"
@@ -65,41 +70,13 @@ class TestEmptyFileEdgeCases:
         assert len(result.markdown_content.strip()) < 100, \
             "Empty document should produce minimal output"
     
-    def test_empty_excel_file(self, tmp_path):
+    def test_empty_excel_file(self, convert, empty_xlsx_path):
         """Test that empty Excel files are handled correctly.
         
         Validates: Requirements 4.3 - Empty file handling for Excel files
         """
-        from src.conversion_orchestrator import ConversionOrchestrator
-        from src.config import ConversionConfig
-        from src.logger import Logger
-        
-        try:
-            import openpyxl
-        except ImportError:
-            pytest.skip("openpyxl not installed")
-        
-        # Create an empty Excel file (with one empty sheet)
-        excel_path = tmp_path / "empty.xlsx"
-        workbook = openpyxl.Workbook()
-        sheet = workbook.active
-        sheet.title = "Sheet1"
-        # Don't add any data - leave it empty
-        workbook.save(excel_path)
-        
-        # Configure conversion
-        config = ConversionConfig(
-            input_path=str(excel_path),
-            output_path=None,
-            preview_mode=False,
-            dry_run=False
-        )
-        
-        logger = Logger(log_level=LogLevel.INFO)
-        orchestrator = ConversionOrchestrator(config, logger)
-        
         # Convert the empty Excel file
-        result = orchestrator.convert(str(excel_path))
+        result = convert(empty_xlsx_path)
         
         # Verify the result
         assert result.success is True, "Empty Excel file conversion should succeed"
@@ -110,41 +87,13 @@ class TestEmptyFileEdgeCases:
                len(result.markdown_content.strip()) < 100, \
             "Should indicate empty sheet or produce minimal output"
     
-    def test_empty_pdf_file(self, tmp_path):
+    def test_empty_pdf_file(self, convert, empty_pdf_path):
         """Test that empty PDF files are handled correctly.
         
         Validates: Requirements 4.3 - Empty file handling for PDF files
         """
-        from src.conversion_orchestrator import ConversionOrchestrator
-        from src.config import ConversionConfig
-        from src.logger import Logger
-        
-        try:
-            from reportlab.pdfgen import canvas
-            from reportlab.lib.pagesizes import letter
-        except ImportError:
-            pytest.skip("reportlab not installed")
-        
-        # Create an empty PDF file (with one blank page)
-        pdf_path = tmp_path / "empty.pdf"
-        c = canvas.Canvas(str(pdf_path), pagesize=letter)
-        # Add a blank page with no content
-        c.showPage()
-        c.save()
-        
-        # Configure conversion
-        config = ConversionConfig(
-            input_path=str(pdf_path),
-            output_path=None,
-            preview_mode=False,
-            dry_run=False
-        )
-        
-        logger = Logger(log_level=LogLevel.INFO)
-        orchestrator = ConversionOrchestrator(config, logger)
-        
         # Convert the empty PDF
-        result = orchestrator.convert(str(pdf_path))
+        result = convert(empty_pdf_path)
         
         # Verify the result
         assert result.success is True, "Empty PDF conversion should succeed"
@@ -154,32 +103,18 @@ class TestEmptyFileEdgeCases:
         assert len(result.markdown_content.strip()) < 100, \
             "Empty PDF should produce minimal output"
     
-    def test_zero_byte_file_word(self, tmp_path):
-        """Test that zero-byte Word files are handled with appropriate error.
+    @pytest.mark.parametrize("ext", ["docx", "xlsx", "pdf"])
+    def test_zero_byte_file(self, convert, tmp_path, ext):
+        """Test that zero-byte files are handled with appropriate error.
         
         Validates: Requirements 4.3 - Zero-byte file handling
         """
-        from src.conversion_orchestrator import ConversionOrchestrator
-        from src.config import ConversionConfig
-        from src.logger import Logger
-        
-        # Create a zero-byte file with .docx extension
-        docx_path = tmp_path / "zero_byte.docx"
-        docx_path.touch()  # Creates empty file
-        
-        # Configure conversion
-        config = ConversionConfig(
-            input_path=str(docx_path),
-            output_path=None,
-            preview_mode=False,
-            dry_run=False
-        )
-        
-        logger = Logger(log_level=LogLevel.INFO)
-        orchestrator = ConversionOrchestrator(config, logger)
+        # Create a zero-byte file with the format's extension
+        file_path = tmp_path / f"zero_byte.{ext}"
+        file_path.touch()
         
         # Convert the zero-byte file
-        result = orchestrator.convert(str(docx_path))
+        result = convert(file_path)
         
         # Zero-byte files are corrupted and should fail or warn
         # The behavior depends on the parser implementation
@@ -189,109 +124,13 @@ class TestEmptyFileEdgeCases:
         if not result.success:
             assert len(result.errors) > 0, "Should have error messages"
     
-    def test_zero_byte_file_excel(self, tmp_path):
-        """Test that zero-byte Excel files are handled with appropriate error.
-        
-        Validates: Requirements 4.3 - Zero-byte file handling
-        """
-        from src.conversion_orchestrator import ConversionOrchestrator
-        from src.config import ConversionConfig
-        from src.logger import Logger
-        
-        # Create a zero-byte file with .xlsx extension
-        excel_path = tmp_path / "zero_byte.xlsx"
-        excel_path.touch()
-        
-        # Configure conversion
-        config = ConversionConfig(
-            input_path=str(excel_path),
-            output_path=None,
-            preview_mode=False,
-            dry_run=False
-        )
-        
-        logger = Logger(log_level=LogLevel.INFO)
-        orchestrator = ConversionOrchestrator(config, logger)
-        
-        # Convert the zero-byte file
-        result = orchestrator.convert(str(excel_path))
-        
-        # Zero-byte files should fail or warn
-        assert result.success is False or len(result.warnings) > 0, \
-            "Zero-byte file should fail or produce warnings"
-        
-        if not result.success:
-            assert len(result.errors) > 0, "Should have error messages"
-    
-    def test_zero_byte_file_pdf(self, tmp_path):
-        """Test that zero-byte PDF files are handled with appropriate error.
-        
-        Validates: Requirements 4.3 - Zero-byte file handling
-        """
-        from src.conversion_orchestrator import ConversionOrchestrator
-        from src.config import ConversionConfig
-        from src.logger import Logger
-        
-        # Create a zero-byte file with .pdf extension
-        pdf_path = tmp_path / "zero_byte.pdf"
-        pdf_path.touch()
-        
-        # Configure conversion
-        config = ConversionConfig(
-            input_path=str(pdf_path),
-            output_path=None,
-            preview_mode=False,
-            dry_run=False
-        )
-        
-        logger = Logger(log_level=LogLevel.INFO)
-        orchestrator = ConversionOrchestrator(config, logger)
-        
-        # Convert the zero-byte file
-        result = orchestrator.convert(str(pdf_path))
-        
-        # Zero-byte files should fail or warn
-        assert result.success is False or len(result.warnings) > 0, \
-            "Zero-byte file should fail or produce warnings"
-        
-        if not result.success:
-            assert len(result.errors) > 0, "Should have error messages"
-    
-    def test_word_document_with_only_whitespace(self, tmp_path):
+    def test_word_document_with_only_whitespace(self, convert, whitespace_docx_path):
         """Test Word document containing only whitespace.
         
         Validates: Requirements 4.3 - Empty content handling
         """
-        from src.conversion_orchestrator import ConversionOrchestrator
-        from src.config import ConversionConfig
-        from src.logger import Logger
-        
-        try:
-            import docx
-        except ImportError:
-            pytest.skip("python-docx not installed")
-        
-        # Create a Word document with only whitespace
-        docx_path = tmp_path / "whitespace.docx"
-        doc = docx.Document()
-        doc.add_paragraph("   ")  # Only spaces
-        doc.add_paragraph("\n\n")  # Only newlines
-        doc.add_paragraph("\t\t")  # Only tabs
-        doc.save(docx_path)
-        
-        # Configure conversion
-        config = ConversionConfig(
-            input_path=str(docx_path),
-            output_path=None,
-            preview_mode=False,
-            dry_run=False
-        )
-        
-        logger = Logger(log_level=LogLevel.INFO)
-        orchestrator = ConversionOrchestrator(config, logger)
-        
         # Convert the document
-        result = orchestrator.convert(str(docx_path))
+        result = convert(whitespace_docx_path)
         
         # Should succeed but produce minimal output
         assert result.success is True, "Whitespace-only document should succeed"
@@ -301,45 +140,13 @@ class TestEmptyFileEdgeCases:
         assert len(result.markdown_content.strip()) < 50, \
             "Whitespace-only document should produce minimal output"
     
-    def test_excel_with_all_empty_sheets(self, tmp_path):
+    def test_excel_with_all_empty_sheets(self, convert, all_empty_xlsx_path):
         """Test Excel file with multiple empty sheets.
         
         Validates: Requirements 4.3 - Multiple empty sheets handling
         """
-        from src.conversion_orchestrator import ConversionOrchestrator
-        from src.config import ConversionConfig
-        from src.logger import Logger
-        
-        try:
-            import openpyxl
-        except ImportError:
-            pytest.skip("openpyxl not installed")
-        
-        # Create Excel file with multiple empty sheets
-        excel_path = tmp_path / "all_empty.xlsx"
-        workbook = openpyxl.Workbook()
-        
-        sheet1 = workbook.active
-        sheet1.title = "Empty1"
-        
-        workbook.create_sheet("Empty2")
-        workbook.create_sheet("Empty3")
-        
-        workbook.save(excel_path)
-        
-        # Configure conversion
-        config = ConversionConfig(
-            input_path=str(excel_path),
-            output_path=None,
-            preview_mode=False,
-            dry_run=False
-        )
-        
-        logger = Logger(log_level=LogLevel.INFO)
-        orchestrator = ConversionOrchestrator(config, logger)
-        
         # Convert the Excel file
-        result = orchestrator.convert(str(excel_path))
+        result = convert(all_empty_xlsx_path)
         
         # Should succeed
         assert result.success is True, "Excel with all empty sheets should succeed"
@@ -350,44 +157,13 @@ class TestEmptyFileEdgeCases:
                len(result.markdown_content.strip()) < 200, \
             "Should indicate all sheets are empty"
     
-    def test_pdf_with_only_blank_pages(self, tmp_path):
+    def test_pdf_with_only_blank_pages(self, convert, blank_pages_pdf_path):
         """Test PDF with multiple blank pages.
         
         Validates: Requirements 4.3 - Blank pages handling
         """
-        from src.conversion_orchestrator import ConversionOrchestrator
-        from src.config import ConversionConfig
-        from src.logger import Logger
-        
-        try:
-            from reportlab.pdfgen import canvas
-            from reportlab.lib.pagesizes import letter
-        except ImportError:
-            pytest.skip("reportlab not installed")
-        
-        # Create PDF with multiple blank pages
-        pdf_path = tmp_path / "blank_pages.pdf"
-        c = canvas.Canvas(str(pdf_path), pagesize=letter)
-        
-        # Add 3 blank pages
-        c.showPage()
-        c.showPage()
-        c.showPage()
-        c.save()
-        
-        # Configure conversion
-        config = ConversionConfig(
-            input_path=str(pdf_path),
-            output_path=None,
-            preview_mode=False,
-            dry_run=False
-        )
-        
-        logger = Logger(log_level=LogLevel.INFO)
-        orchestrator = ConversionOrchestrator(config, logger)
-        
         # Convert the PDF
-        result = orchestrator.convert(str(pdf_path))
+        result = convert(blank_pages_pdf_path)
         
         # Should succeed
         assert result.success is True, "PDF with blank pages should succeed"
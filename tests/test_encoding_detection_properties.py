@@ -8,10 +8,12 @@ Property: 40
 Validates: Requirements 9.1
 """
 
+import re
+from functools import lru_cache
+
 import pytest
-from hypothesis import given, strategies as st, settings, assume
+from hypothesis import given, strategies as st, settings
 from src.encoding_detector import EncodingDetector, EncodingDetectionResult
-from src.logger import Logger, LogLevel
 import logging
 
 
@@ -26,28 +28,211 @@ text_content_strategy = st.text(
     max_size=500
 )
 
-# Strategy for generating multilingual text
+# Strategy for generating multilingual text; surrogates (category Cs) are
+# excluded at generation time rather than rejected afterwards
 multilingual_text_strategy = st.text(
     alphabet=st.characters(
+        blacklist_categories=('Cs',),
         whitelist_categories=('Lu', 'Ll', 'Nd', 'Zs'),
         whitelist_characters='日本語テスト中文测试한국어',
         min_codepoint=32,
         max_codepoint=0xFFFF
-    ).filter(lambda c: ord(c) < 0xD800 or ord(c) > 0xDFFF),  # Exclude surrogates
+    ),
     min_size=10,
     max_size=500
 )
 
-# Common encodings to test
-encoding_strategy = st.sampled_from([
-    'utf-8',
-    'utf-16',
-    'utf-16-le',
-    'utf-16-be',
-    'latin-1',
-    'cp1252',  # Windows-1252
-    'iso-8859-1',
-])
+# Unicode replacement character, appended to examples to provoke an issue
+_REPL = '\ufffd'
+
+# Matches issue messages that mention replacement characters
+_REPLACEMENT_RE = re.compile(r"replacement", re.IGNORECASE)
+
+# Logger that discards every record; isEnabledFor() rejects all levels, so
+# warnings raised for replacement characters never build a LogRecord
+_silent_logger = logging.getLogger("doc2md.tests.encoding_silent")
+_silent_logger.addHandler(logging.NullHandler())
+_silent_logger.setLevel(logging.CRITICAL + 1)
+_silent_logger.propagate = False
+
+
+@pytest.fixture(scope="module")
+def detector():
+    """Provide one EncodingDetector shared by all examples in this module."""
+    return EncodingDetector(logger=_silent_logger)
+
+
+@lru_cache(maxsize=1024)
+def _cached_detect(detector: EncodingDetector, data: bytes) -> EncodingDetectionResult:
+    """Detect the encoding of bytes, reusing results for bytes seen before."""
+    return detector.detect_encoding(data)
+
+
+# Encodings that can represent any text
+UNICODE_ENCODINGS = ['utf-8', 'utf-16', 'utf-16-le', 'utf-16-be']
+
+# Single-byte encodings mapped to the first code point they cannot encode
+SINGLE_BYTE_LIMITS = {
+    'latin-1': 0x100,
+    'cp1252': 0x100,  # Windows-1252
+    'iso-8859-1': 0x100,
+}
+
+
+@st.composite
+def encoded_sample(draw):
+    """Draw text, an encoding that can represent it, and the encoded bytes.
+    
+    Pairing text and encoding at generation time avoids drawing an encoding
+    only to reject the example when the text cannot be encoded, and the
+    bytes are produced once for all checks run on the example.
+    """
+    text = draw(text_content_strategy)
+    max_codepoint = max(map(ord, text), default=0)
+    compatible = [
+        encoding for encoding, limit in SINGLE_BYTE_LIMITS.items()
+        if max_codepoint < limit
+    ]
+    encoding = draw(st.sampled_from(UNICODE_ENCODINGS + compatible))
+    return text, encoding, text.encode(encoding)
+
+
+def _check_detection(detector, encoded_bytes):
+    """Check detect_encoding on bytes and decoding with its answer."""
+    result = _cached_detect(detector, encoded_bytes)
+    
+    # Property: Result should be an EncodingDetectionResult
+    assert isinstance(result, EncodingDetectionResult), \
+        "detect_encoding should return EncodingDetectionResult"
+    
+    # Property: Detected encoding should be a non-empty string
+    assert isinstance(result.detected_encoding, str), \
+        "Detected encoding should be a string"
+    assert len(result.detected_encoding) > 0, \
+        "Detected encoding should not be empty"
+    
+    # Property: Confidence should be between 0 and 1
+    assert 0.0 <= result.confidence <= 1.0
+    
+    # Property: Should be able to decode with detected encoding
+    try:
+        decoded_text = encoded_bytes.decode(result.detected_encoding)
+        assert isinstance(decoded_text, str), \
+            "Decoded text should be a string"
+    except (UnicodeDecodeError, LookupError) as e:
+        pytest.fail(
+            f"Failed to decode with detected encoding {result.detected_encoding}: {e}"
+        )
+
+
+def _check_consistent_detection(detector, encoded_bytes):
+    """Check that detecting the same bytes twice gives the same answer."""
+    # The first result may come from an earlier detection of the same
+    # bytes, the second is always computed afresh
+    result1 = _cached_detect(detector, encoded_bytes)
+    result2 = detector.detect_encoding(encoded_bytes)
+    
+    # Property: Results should be identical
+    assert result1.detected_encoding == result2.detected_encoding, \
+        "Detection should be consistent for the same content"
+    assert result1.confidence == result2.confidence, \
+        "Confidence should be consistent for the same content"
+
+
+def _check_decode_with_fallback(detector, text, encoding, encoded_bytes):
+    """Check decode_with_fallback with auto-detection and a given encoding."""
+    # Decode with fallback (auto-detect); this should never raise
+    try:
+        decoded_text, result = detector.decode_with_fallback(encoded_bytes)
+    except Exception as e:
+        pytest.fail(f"decode_with_fallback should never fail, but got: {e}")
+    
+    # Property: Should return a non-empty string
+    assert isinstance(decoded_text, str), \
+        "decode_with_fallback should return a string"
+    assert len(decoded_text) > 0, \
+        "Decoded text should not be empty"
+    
+    # Property: Result should carry a valid detected encoding
+    assert isinstance(result, EncodingDetectionResult), \
+        "decode_with_fallback should return EncodingDetectionResult"
+    assert isinstance(result.detected_encoding, str), \
+        "Detected encoding should be a string"
+    assert len(result.detected_encoding) > 0, \
+        "Detected encoding should not be empty"
+    
+    # Decode with specified encoding
+    decoded_text, result = detector.decode_with_fallback(
+        encoded_bytes, 
+        encoding=encoding
+    )
+    
+    # Property: Should successfully decode
+    assert isinstance(decoded_text, str), \
+        "decode_with_fallback should return a string"
+    assert len(decoded_text) > 0, \
+        "Decoded text should not be empty"
+    assert isinstance(result, EncodingDetectionResult), \
+        "Should return EncodingDetectionResult"
+    
+    # Property: Decoded text should be similar to original
+    # (may differ slightly due to normalization)
+    assert len(decoded_text) >= len(text.strip()) * 0.8, \
+        "Decoded text length should be reasonably close to original"
+
+
+def _check_validation(detector, text):
+    """Check the shape of validate_text_encoding results."""
+    result = detector.validate_text_encoding(text)
+    
+    # Property: Should return EncodingDetectionResult
+    assert isinstance(result, EncodingDetectionResult), \
+        "validate_text_encoding should return EncodingDetectionResult"
+    
+    # Property: Confidence should be between 0 and 1
+    assert 0.0 <= result.confidence <= 1.0
+    
+    # Property: has_issues should be a boolean and issues a list
+    assert isinstance(result.has_issues, bool), \
+        "has_issues should be a boolean"
+    assert isinstance(result.issues, list), \
+        "issues should be a list"
+    
+    # Property: If has_issues is True, issues list should not be empty
+    if result.has_issues:
+        assert len(result.issues) > 0, \
+            "If has_issues is True, issues list should not be empty"
+
+
+def _check_replacement_detection(detector, text):
+    """Check that an appended replacement character is reported."""
+    result = detector.validate_text_encoding(text + _REPL)
+    
+    # Property: Should detect issues
+    assert result.has_issues is True, \
+        "Should detect replacement character as an issue"
+    
+    # Property: Issues should mention replacement character
+    assert any(_REPLACEMENT_RE.search(issue) for issue in result.issues), \
+        "Issues should mention replacement character"
+
+
+def _check_normalization(detector, text):
+    """Check that normalize_text keeps content and drops null bytes."""
+    normalized = detector.normalize_text(text)
+    
+    # Property: Should return a string
+    assert isinstance(normalized, str), \
+        "normalize_text should return a string"
+    
+    # Property: Normalized text should not be significantly shorter
+    # (allowing for removal of control characters)
+    assert len(normalized) >= len(text) * 0.9, \
+        "Normalized text should preserve most content"
+    
+    # Property: Should not contain null bytes
+    assert '\x00' not in normalized, \
+        "Normalized text should not contain null bytes"
 
 
 class TestEncodingDetectionProperty:
@@ -59,171 +244,43 @@ class TestEncodingDetectionProperty:
     Validates: Requirements 9.1
     """
     
-    @given(
-        text=text_content_strategy,
-        encoding=encoding_strategy
-    )
+    # Checks that share the (text, encoding) strategy run together in one
+    # test so each generated example is encoded and exercised only once
+    
+    @given(sample=encoded_sample())
     @settings(max_examples=100, deadline=None)
-    def test_property_40_detect_encoding_from_bytes(self, text, encoding):
+    def test_property_40_all_in_one(self, sample, detector):
         """
         Feature: document-to-markdown-converter
         Property 40: Multi-encoding detection
         
         For any text content encoded with a specific encoding, the detector
-        should successfully detect the encoding.
+        should detect the encoding consistently, decode the content with and
+        without the encoding specified, validate and normalize the text, and
+        report replacement characters.
         
         **Validates: Requirements 9.1**
         """
-        # Skip empty or whitespace-only text
-        if not text.strip():
-            return
-        
-        # Try to encode the text with the specified encoding
-        try:
-            encoded_bytes = text.encode(encoding)
-        except (UnicodeEncodeError, LookupError):
-            # Some characters may not be encodable in certain encodings
-            assume(False)
-            return
-        
-        # Create detector
-        logger = Logger(log_level=LogLevel.ERROR)
-        detector = EncodingDetector(logger=logger.logger)
-        
-        # Detect encoding
-        result = detector.detect_encoding(encoded_bytes)
-        
-        # Property: Result should be an EncodingDetectionResult
-        assert isinstance(result, EncodingDetectionResult), \
-            "detect_encoding should return EncodingDetectionResult"
-        
-        # Property: Detected encoding should be a non-empty string
-        assert isinstance(result.detected_encoding, str), \
-            "Detected encoding should be a string"
-        assert len(result.detected_encoding) > 0, \
-            "Detected encoding should not be empty"
-        
-        # Property: Confidence should be between 0 and 1
-        assert 0.0 <= result.confidence <= 1.0, \
-            f"Confidence should be between 0 and 1, got {result.confidence}"
-        
-        # Property: Should be able to decode with detected encoding
-        try:
-            decoded_text = encoded_bytes.decode(result.detected_encoding)
-            assert isinstance(decoded_text, str), \
-                "Decoded text should be a string"
-        except (UnicodeDecodeError, LookupError) as e:
-            pytest.fail(
-                f"Failed to decode with detected encoding {result.detected_encoding}: {e}"
-            )
-    
-    @given(
-        text=text_content_strategy,
-        encoding=encoding_strategy
-    )
-    @settings(max_examples=100, deadline=None)
-    def test_property_40_decode_with_fallback(self, text, encoding):
-        """
-        Feature: document-to-markdown-converter
-        Property 40: Multi-encoding detection (decode with fallback)
+        text, encoding, encoded_bytes = sample
         
-        For any text content, decode_with_fallback should successfully decode
-        the content regardless of encoding.
+        # Text-level checks apply to whitespace-only text as well
+        _check_validation(detector, text)
+        _check_normalization(detector, text)
+        _check_replacement_detection(detector, text)
         
-        **Validates: Requirements 9.1**
-        """
         # Skip empty or whitespace-only text
-        if not text.strip():
+        if not text or text.isspace():
             return
         
-        # Try to encode the text
-        try:
-            encoded_bytes = text.encode(encoding)
-        except (UnicodeEncodeError, LookupError):
-            assume(False)
-            return
-        
-        # Create detector
-        logger = Logger(log_level=LogLevel.ERROR)
-        detector = EncodingDetector(logger=logger.logger)
-        
-        # Decode with fallback (auto-detect)
-        decoded_text, result = detector.decode_with_fallback(encoded_bytes)
-        
-        # Property: Should return a string
-        assert isinstance(decoded_text, str), \
-            "decode_with_fallback should return a string"
-        
-        # Property: Decoded text should not be empty
-        assert len(decoded_text) > 0, \
-            "Decoded text should not be empty"
-        
-        # Property: Result should be an EncodingDetectionResult
-        assert isinstance(result, EncodingDetectionResult), \
-            "decode_with_fallback should return EncodingDetectionResult"
-        
-        # Property: Detected encoding should be valid
-        assert isinstance(result.detected_encoding, str), \
-            "Detected encoding should be a string"
-        assert len(result.detected_encoding) > 0, \
-            "Detected encoding should not be empty"
-    
-    @given(
-        text=text_content_strategy,
-        encoding=encoding_strategy
-    )
-    @settings(max_examples=100, deadline=None)
-    def test_property_40_decode_with_specified_encoding(self, text, encoding):
-        """
-        Feature: document-to-markdown-converter
-        Property 40: Multi-encoding detection (specified encoding)
-        
-        For any text content, when encoding is specified, decode_with_fallback
-        should use the specified encoding.
-        
-        **Validates: Requirements 9.1**
-        """
-        # Skip empty or whitespace-only text
-        if not text.strip():
-            return
-        
-        # Try to encode the text
-        try:
-            encoded_bytes = text.encode(encoding)
-        except (UnicodeEncodeError, LookupError):
-            assume(False)
-            return
-        
-        # Create detector
-        logger = Logger(log_level=LogLevel.ERROR)
-        detector = EncodingDetector(logger=logger.logger)
-        
-        # Decode with specified encoding
-        decoded_text, result = detector.decode_with_fallback(
-            encoded_bytes, 
-            encoding=encoding
-        )
-        
-        # Property: Should successfully decode
-        assert isinstance(decoded_text, str), \
-            "decode_with_fallback should return a string"
-        assert len(decoded_text) > 0, \
-            "Decoded text should not be empty"
-        
-        # Property: Result should indicate the specified encoding
-        assert isinstance(result, EncodingDetectionResult), \
-            "Should return EncodingDetectionResult"
-        
-        # Property: Decoded text should be similar to original
-        # (may differ slightly due to normalization)
-        assert len(decoded_text) >= len(text.strip()) * 0.8, \
-            "Decoded text length should be reasonably close to original"
+        _check_detection(detector, encoded_bytes)
+        _check_consistent_detection(detector, encoded_bytes)
+        _check_decode_with_fallback(detector, text, encoding, encoded_bytes)
     
     @given(
         text=multilingual_text_strategy
     )
     @settings(max_examples=100, deadline=None)
-    def test_property_40_handle_multilingual_content(self, text):
+    def test_property_40_handle_multilingual_content(self, text, detector):
         """
         Feature: document-to-markdown-converter
         Property 40: Multi-encoding detection (multilingual)
@@ -234,16 +291,12 @@ class TestEncodingDetectionProperty:
         **Validates: Requirements 9.1**
         """
         # Skip empty or whitespace-only text
-        if not text.strip():
+        if not text or text.isspace():
             return
         
         # Encode as UTF-8 (supports all characters)
         encoded_bytes = text.encode('utf-8')
         
-        # Create detector
-        logger = Logger(log_level=LogLevel.ERROR)
-        detector = EncodingDetector(logger=logger.logger)
-        
         # Detect and decode
         decoded_text, result = detector.decode_with_fallback(encoded_bytes)
         
@@ -254,142 +307,11 @@ class TestEncodingDetectionProperty:
             "Decoded multilingual text should not be empty"
         
         # Property: Should detect UTF-8 or compatible encoding
-        assert result.detected_encoding.lower() in ['utf-8', 'utf8', 'ascii'], \
-            f"Should detect UTF-8 compatible encoding for multilingual text, got {result.detected_encoding}"
-    
-    @given(
-        text=text_content_strategy
-    )
-    @settings(max_examples=100, deadline=None)
-    def test_property_40_validate_text_encoding(self, text):
-        """
-        Feature: document-to-markdown-converter
-        Property 40: Multi-encoding detection (validation)
-        
-        For any text content, validate_text_encoding should check for
-        encoding issues.
-        
-        **Validates: Requirements 9.1**
-        """
-        # Skip empty text
-        if not text:
-            return
-        
-        # Create detector
-        logger = Logger(log_level=LogLevel.ERROR)
-        detector = EncodingDetector(logger=logger.logger)
-        
-        # Validate text encoding
-        result = detector.validate_text_encoding(text)
-        
-        # Property: Should return EncodingDetectionResult
-        assert isinstance(result, EncodingDetectionResult), \
-            "validate_text_encoding should return EncodingDetectionResult"
-        
-        # Property: Confidence should be between 0 and 1
-        assert 0.0 <= result.confidence <= 1.0, \
-            f"Confidence should be between 0 and 1, got {result.confidence}"
-        
-        # Property: has_issues should be a boolean
-        assert isinstance(result.has_issues, bool), \
-            "has_issues should be a boolean"
-        
-        # Property: issues should be a list
-        assert isinstance(result.issues, list), \
-            "issues should be a list"
-        
-        # Property: If has_issues is True, issues list should not be empty
-        if result.has_issues:
-            assert len(result.issues) > 0, \
-                "If has_issues is True, issues list should not be empty"
-    
-    @given(
-        text=text_content_strategy
-    )
-    @settings(max_examples=100, deadline=None)
-    def test_property_40_normalize_text_preserves_content(self, text):
-        """
-        Feature: document-to-markdown-converter
-        Property 40: Multi-encoding detection (normalization)
-        
-        For any text content, normalize_text should preserve the essential
-        content while cleaning up problematic characters.
-        
-        **Validates: Requirements 9.1**
-        """
-        # Skip empty text
-        if not text:
-            return
-        
-        # Create detector
-        logger = Logger(log_level=LogLevel.ERROR)
-        detector = EncodingDetector(logger=logger.logger)
-        
-        # Normalize text
-        normalized = detector.normalize_text(text)
-        
-        # Property: Should return a string
-        assert isinstance(normalized, str), \
-            "normalize_text should return a string"
-        
-        # Property: Normalized text should not be significantly shorter
-        # (allowing for removal of control characters)
-        assert len(normalized) >= len(text) * 0.9, \
-            "Normalized text should preserve most content"
-        
-        # Property: Should not contain null bytes
-        assert '\x00' not in normalized, \
-            "Normalized text should not contain null bytes"
-    
-    @given(
-        text=text_content_strategy,
-        encoding1=encoding_strategy,
-        encoding2=encoding_strategy
-    )
-    @settings(max_examples=100, deadline=None)
-    def test_property_40_consistent_detection_for_same_content(
-        self, text, encoding1, encoding2
-    ):
-        """
-        Feature: document-to-markdown-converter
-        Property 40: Multi-encoding detection (consistency)
-        
-        For the same text content encoded with the same encoding, detection
-        should be consistent across multiple calls.
-        
-        **Validates: Requirements 9.1**
-        """
-        # Skip empty or whitespace-only text
-        if not text.strip():
-            return
-        
-        # Try to encode with first encoding
-        try:
-            encoded_bytes = text.encode(encoding1)
-        except (UnicodeEncodeError, LookupError):
-            assume(False)
-            return
-        
-        # Create detector
-        logger = Logger(log_level=LogLevel.ERROR)
-        detector = EncodingDetector(logger=logger.logger)
-        
-        # Detect encoding twice
-        result1 = detector.detect_encoding(encoded_bytes)
-        result2 = detector.detect_encoding(encoded_bytes)
-        
-        # Property: Results should be identical
-        assert result1.detected_encoding == result2.detected_encoding, \
-            "Detection should be consistent for the same content"
-        assert result1.confidence == result2.confidence, \
-            "Confidence should be consistent for the same content"
+        assert result.detected_encoding.lower() in ['utf-8', 'utf8', 'ascii']
     
-    @given(
-        text=text_content_strategy,
-        encoding=encoding_strategy
-    )
-    @settings(max_examples=100, deadline=None)
-    def test_property_40_round_trip_encoding(self, text, encoding):
+    @given(sample=encoded_sample())
+    @settings(max_examples=40, deadline=None)
+    def test_property_40_round_trip_encoding(self, sample, detector):
         """
         Feature: document-to-markdown-converter
         Property 40: Multi-encoding detection (round-trip)
@@ -399,21 +321,12 @@ class TestEncodingDetectionProperty:
         
         **Validates: Requirements 9.1**
         """
-        # Skip empty or whitespace-only text
-        if not text.strip():
-            return
+        text, encoding, encoded_bytes = sample
         
-        # Try to encode the text
-        try:
-            encoded_bytes = text.encode(encoding)
-        except (UnicodeEncodeError, LookupError):
-            assume(False)
+        # Skip empty or whitespace-only text
+        if not text or text.isspace():
             return
         
-        # Create detector
-        logger = Logger(log_level=LogLevel.ERROR)
-        detector = EncodingDetector(logger=logger.logger)
-        
         # Decode with auto-detection
         decoded_text, result = detector.decode_with_fallback(encoded_bytes)
         
@@ -432,58 +345,20 @@ class TestEncodingDetectionProperty:
             assert '\ufffd' not in decoded_text or '\ufffd' in text, \
                 "Round-trip should not introduce replacement characters for Unicode encodings"
     
-    @given(
-        text=text_content_strategy
-    )
-    @settings(max_examples=100, deadline=None)
-    def test_property_40_detect_replacement_characters(self, text):
-        """
-        Feature: document-to-markdown-converter
-        Property 40: Multi-encoding detection (replacement character detection)
-        
-        For any text containing replacement characters, validation should
-        detect encoding issues.
-        
-        **Validates: Requirements 9.1**
-        """
-        # Add replacement character to text
-        text_with_replacement = text + '\ufffd'
-        
-        # Create detector
-        logger = Logger(log_level=LogLevel.ERROR)
-        detector = EncodingDetector(logger=logger.logger)
-        
-        # Validate text
-        result = detector.validate_text_encoding(text_with_replacement)
-        
-        # Property: Should detect issues
-        assert result.has_issues is True, \
-            "Should detect replacement character as an issue"
-        
-        # Property: Issues should mention replacement character
-        assert any('replacement' in issue.lower() for issue in result.issues), \
-            "Issues should mention replacement character"
-    
-    @given(
-        encoding=encoding_strategy
-    )
-    @settings(max_examples=50, deadline=None)
-    def test_property_40_handle_empty_content(self, encoding):
+    @pytest.mark.parametrize("encoding", UNICODE_ENCODINGS + list(SINGLE_BYTE_LIMITS))
+    def test_property_40_handle_empty_content(self, encoding, detector):
         """
         Feature: document-to-markdown-converter
         Property 40: Multi-encoding detection (empty content)
         
-        For empty content, the detector should handle it gracefully.
+        For empty content, the detector should handle it gracefully, and
+        decoding it with any supported encoding should yield empty text.
         
         **Validates: Requirements 9.1**
         """
         # Create empty bytes
         empty_bytes = b''
         
-        # Create detector
-        logger = Logger(log_level=LogLevel.ERROR)
-        detector = EncodingDetector(logger=logger.logger)
-        
         # Detect encoding
         result = detector.detect_encoding(empty_bytes)
         
@@ -496,55 +371,11 @@ class TestEncodingDetectionProperty:
             "Should provide a default encoding for empty content"
         assert len(result.detected_encoding) > 0, \
             "Default encoding should not be empty"
-    
-    @given(
-        text=text_content_strategy,
-        encoding=encoding_strategy
-    )
-    @settings(max_examples=100, deadline=None)
-    def test_property_40_fallback_never_fails(self, text, encoding):
-        """
-        Feature: document-to-markdown-converter
-        Property 40: Multi-encoding detection (fallback robustness)
-        
-        For any content, decode_with_fallback should never fail, even with
-        invalid or corrupted data.
-        
-        **Validates: Requirements 9.1**
-        """
-        # Skip empty text
-        if not text:
-            return
-        
-        # Try to encode the text
-        try:
-            encoded_bytes = text.encode(encoding)
-        except (UnicodeEncodeError, LookupError):
-            assume(False)
-            return
-        
-        # Create detector
-        logger = Logger(log_level=LogLevel.ERROR)
-        detector = EncodingDetector(logger=logger.logger)
-        
-        # Decode with fallback should never raise an exception
-        try:
-            decoded_text, result = detector.decode_with_fallback(encoded_bytes)
-            
-            # Property: Should always return something
-            assert decoded_text is not None, \
-                "decode_with_fallback should always return text"
-            assert result is not None, \
-                "decode_with_fallback should always return result"
-            
-            # Property: Result should be valid
-            assert isinstance(decoded_text, str), \
-                "Decoded text should be a string"
-            assert isinstance(result, EncodingDetectionResult), \
-                "Result should be EncodingDetectionResult"
         
-        except Exception as e:
-            pytest.fail(f"decode_with_fallback should never fail, but got: {e}")
+        # Property: Decoding with the given encoding yields empty text
+        text, decode_result = detector.decode_with_fallback(empty_bytes, encoding=encoding)
+        assert text == "", "Empty content should decode to empty text"
+        assert decode_result.detected_encoding == encoding
 
 
 # Run all property tests
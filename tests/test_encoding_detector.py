@@ -1,26 +1,106 @@
 """Unit tests for encoding detection functionality."""
 
+import re
+
 import pytest
-from src.encoding_detector import EncodingDetector, EncodingDetectionResult
+from src.encoding_detector import EncodingDetector, EncodingDetectionResult, get_detector
+
+
+# Matches issue messages that mention replacement characters
+_REPLACEMENT_RE = re.compile(r"replacement character", re.IGNORECASE)
+
+# Matches issue messages that mention null bytes
+_NULL_BYTE_RE = re.compile(r"null byte", re.IGNORECASE)
+
+# "café" spelled with a combining acute accent, and its NFC composed form
+_NFC_CAFE_INPUT = "cafe\u0301"
+_NFC_CAFE_EXPECTED = "caf\u00e9"
+
+
+@pytest.fixture(scope="session")
+def encoded_corpus():
+    """Encoded sample payloads shared by the tests in this module."""
+    return {
+        "utf8_mixed": "Hello, 世界! こんにちは".encode('utf-8'),
+        "utf8_hello_world": "Hello, 世界!".encode('utf-8'),
+        "utf8_cafe_world": "Café 世界".encode('utf-8'),
+        "ascii_hello": "Hello, world!".encode('utf-8'),
+        "latin1_cafe": "Café résumé naïve".encode('latin-1'),
+        "latin1_cafe_short": "Café".encode('latin-1'),
+    }
 
 
 class TestEncodingDetector:
     """Test suite for EncodingDetector class."""
     
-    def test_detect_encoding_utf8(self):
+    def test_detect_encoding_utf8(self, encoded_corpus):
         """Test detection of UTF-8 encoded content."""
         detector = EncodingDetector()
-        content = "Hello, 世界! こんにちは".encode('utf-8')
+        content = encoded_corpus["utf8_mixed"]
         
         result = detector.detect_encoding(content)
         
         assert result.detected_encoding in ['utf-8', 'UTF-8']
         assert result.confidence > 0.5
     
-    def test_detect_encoding_latin1(self):
+    def test_detect_encoding_valid_utf8_skips_charset_detection(self, encoded_corpus, monkeypatch):
+        """Test that well-formed UTF-8 is recognized without a detector backend."""
+        from src import encoding_detector
+        
+        def fail(content):
+            raise AssertionError("charset detection should not run")
+        
+        monkeypatch.setattr(encoding_detector, "_charset_detect", lambda: fail)
+        detector = EncodingDetector()
+        
+        for key in ("utf8_mixed", "ascii_hello"):
+            result = detector.detect_encoding(encoded_corpus[key])
+            assert result.detected_encoding == 'utf-8'
+            assert result.confidence == 1.0
+    
+    @pytest.mark.parametrize("content, expected", [
+        ("こんにちは".encode('iso-2022-jp'), 'ISO-2022-JP'),
+        ("Hello".encode('utf-16-le'), 'UTF-16LE'),
+    ])
+    def test_detect_encoding_escape_and_nul_bytes_use_charset_detection(
+        self, content, expected, monkeypatch
+    ):
+        """Test that ASCII-range ISO-2022-JP and UTF-16 are not taken for UTF-8."""
+        from src import encoding_detector
+        
+        monkeypatch.setattr(
+            encoding_detector, "_charset_detect",
+            lambda: lambda data: {'encoding': expected, 'confidence': 0.99}
+        )
+        
+        result = EncodingDetector().detect_encoding(content)
+        
+        assert result.detected_encoding == expected
+    
+    def test_detect_encoding_utf8_bom(self):
+        """Test that UTF-8 with a byte order mark decodes without U+FEFF."""
+        detector = EncodingDetector()
+        content = b"\xef\xbb\xbf" + "Café".encode('utf-8')
+        
+        assert detector.detect_encoding(content).detected_encoding == 'utf-8-sig'
+        
+        text, result = detector.decode_with_fallback(content)
+        
+        assert text == "Café"
+        assert result.detected_encoding == 'utf-8-sig'
+    
+    def test_is_valid_utf8(self, encoded_corpus):
+        """Test strict UTF-8 validation of byte content."""
+        detector = EncodingDetector()
+        
+        assert detector._is_valid_utf8(encoded_corpus["utf8_cafe_world"])
+        assert detector._is_valid_utf8(b"")
+        assert not detector._is_valid_utf8(encoded_corpus["latin1_cafe"])
+    
+    def test_detect_encoding_latin1(self, encoded_corpus):
         """Test detection of Latin-1 encoded content."""
         detector = EncodingDetector()
-        content = "Café résumé naïve".encode('latin-1')
+        content = encoded_corpus["latin1_cafe"]
         
         result = detector.detect_encoding(content)
         
@@ -47,7 +127,7 @@ class TestEncodingDetector:
         result = detector.validate_text_encoding(text)
         
         assert result.has_issues
-        assert any('replacement character' in issue.lower() for issue in result.issues)
+        assert any(_REPLACEMENT_RE.search(issue) for issue in result.issues)
         assert result.confidence < 1.0
     
     def test_validate_text_encoding_mojibake(self):
@@ -62,6 +142,19 @@ class TestEncodingDetector:
         assert result.has_issues
         assert len(result.issues) > 0
     
+    def test_validate_text_encoding_reports_each_mojibake_pattern_once(self):
+        """Test that repeated mojibake patterns yield one issue per pattern."""
+        detector = EncodingDetector()
+        text = "Â Ã© Ã¨ â€œquotesâ€ Â"
+        
+        result = detector.validate_text_encoding(text)
+        
+        assert result.issues == [
+            'Possible UTF-8 text decoded as Latin-1',
+            'Possible UTF-8 quotes decoded incorrectly',
+            'Possible encoding mismatch',
+        ]
+    
     def test_validate_text_encoding_null_bytes(self):
         """Test detection of null bytes."""
         detector = EncodingDetector()
@@ -70,7 +163,50 @@ class TestEncodingDetector:
         result = detector.validate_text_encoding(text)
         
         assert result.has_issues
-        assert any('null byte' in issue.lower() for issue in result.issues)
+        assert any(_NULL_BYTE_RE.search(issue) for issue in result.issues)
+    
+    def test_validate_text_encoding_counts_control_chars(self):
+        """Test that control characters are counted, excluding tab and newlines."""
+        detector = EncodingDetector()
+        text = "Text\t\n\r" + "\x01\x02\x1f" * 4
+        
+        result = detector.validate_text_encoding(text)
+        
+        assert "High number of control characters (12) detected" in result.issues
+    
+    @pytest.mark.parametrize("text, expected", [
+        ("Plain ASCII\twith\nnewlines\r", True),
+        ("Café 世界", True),
+        ("cafe\u0301", False),
+        ("Broken \ufffd", False),
+        ("Mojibake Ã©", False),
+        ("Control\x01char", False),
+        ("Null\x00byte", False),
+    ])
+    def test_is_clean(self, text, expected):
+        """Test that is_clean agrees with validation and normalization."""
+        detector = EncodingDetector()
+        
+        assert detector.is_clean(text) is expected
+        if expected:
+            assert not detector.validate_text_encoding(text).has_issues
+            assert detector.normalize_text(text) == text
+    
+    @pytest.mark.parametrize("text, expected", [
+        ("abc", True),
+        ("", True),
+        ("abcd", False),
+        ("é", False),
+        ("a\x00", False),
+        ("a\tb", False),
+    ])
+    def test_is_short_ascii(self, text, expected):
+        """Test that only short printable ASCII takes the shortcut."""
+        detector = EncodingDetector()
+        
+        assert detector.is_short_ascii(text) is expected
+        if expected:
+            assert detector.is_clean(text)
     
     def test_normalize_text_removes_null_bytes(self):
         """Test that normalize_text removes null bytes."""
@@ -107,22 +243,35 @@ class TestEncodingDetector:
         assert '\t' in normalized
         assert '\r' in normalized
     
+    def test_normalize_text_logs_removed_control_chars(self, caplog):
+        """Test that each removed control character is logged at debug level."""
+        import logging
+        
+        logger = logging.getLogger('test_normalize_control')
+        detector = EncodingDetector(logger=logger)
+        
+        with caplog.at_level(logging.DEBUG, logger='test_normalize_control'):
+            normalized = detector.normalize_text("a\x01b\tc\x1f")
+        
+        assert normalized == "ab\tc"
+        assert [record.getMessage() for record in caplog.records] == [
+            "Removed control character: U+0001",
+            "Removed control character: U+001F",
+        ]
+    
     def test_normalize_text_unicode_normalization(self):
         """Test Unicode normalization (NFC form)."""
         detector = EncodingDetector()
-        # Using combining characters that should be normalized
-        text = "café"  # This might be composed or decomposed
         
-        normalized = detector.normalize_text(text)
+        # Decomposed input should be composed into a single code point
+        normalized = detector.normalize_text(_NFC_CAFE_INPUT)
         
-        # Should be in NFC form
-        import unicodedata
-        assert normalized == unicodedata.normalize('NFC', text)
+        assert normalized == _NFC_CAFE_EXPECTED
     
-    def test_decode_with_fallback_utf8(self):
+    def test_decode_with_fallback_utf8(self, encoded_corpus):
         """Test decoding UTF-8 content."""
         detector = EncodingDetector()
-        content = "Hello, 世界!".encode('utf-8')
+        content = encoded_corpus["utf8_hello_world"]
         
         text, result = detector.decode_with_fallback(content)
         
@@ -130,21 +279,21 @@ class TestEncodingDetector:
         assert "世界" in text
         assert result.detected_encoding in ['utf-8', 'UTF-8']
     
-    def test_decode_with_fallback_specified_encoding(self):
+    def test_decode_with_fallback_specified_encoding(self, encoded_corpus):
         """Test decoding with specified encoding."""
         detector = EncodingDetector()
-        content = "Café".encode('latin-1')
+        content = encoded_corpus["latin1_cafe_short"]
         
         text, result = detector.decode_with_fallback(content, encoding='latin-1')
         
         assert "Café" in text
         assert result.detected_encoding == 'latin-1'
     
-    def test_decode_with_fallback_invalid_encoding(self):
+    def test_decode_with_fallback_invalid_encoding(self, encoded_corpus):
         """Test fallback when decoding fails."""
         detector = EncodingDetector()
-        # Create content that will fail to decode as ASCII
-        content = "Café 世界".encode('utf-8')
+        # Content that will fail to decode as ASCII
+        content = encoded_corpus["utf8_cafe_world"]
         
         # Try to decode as ASCII (will fail)
         text, result = detector.decode_with_fallback(content, encoding='ascii')
@@ -154,34 +303,50 @@ class TestEncodingDetector:
         assert result.has_issues
         assert len(result.issues) > 0
     
-    def test_encoding_detector_with_logger(self):
-        """Test that encoding detector logs warnings when logger is provided."""
+    def test_decode_with_fallback_counts_undecodable_bytes(self, caplog):
+        """Test that the UTF-8 fallback reports how many bytes were replaced."""
         import logging
-        import io
         
-        # Create a logger with string stream
-        log_stream = io.StringIO()
-        logger = logging.getLogger('test_encoding')
-        logger.setLevel(logging.WARNING)
-        handler = logging.StreamHandler(log_stream)
-        logger.addHandler(handler)
+        with caplog.at_level(logging.WARNING, logger='test_encoding'):
+            detector = EncodingDetector(logger=logging.getLogger('test_encoding'))
+            text, result = detector.decode_with_fallback(b"ok \xff\xfe done", encoding='utf-8')
         
-        detector = EncodingDetector(logger=logger)
+        assert text == "ok �� done"
+        assert result.detected_encoding == 'utf-8'
+        assert any("2 undecodable bytes" in record.getMessage() for record in caplog.records)
+    
+    def test_decode_with_fallback_replaces_each_invalid_sequence_once(self, caplog):
+        """Test that truncated multi-byte sequences yield one U+FFFD each."""
+        import logging
         
-        # Validate text with issues
-        text = "Text with replacement: \ufffd"
-        result = detector.validate_text_encoding(text)
+        with caplog.at_level(logging.WARNING, logger='test_encoding'):
+            detector = EncodingDetector(logger=logging.getLogger('test_encoding'))
+            text, _ = detector.decode_with_fallback(b"ab\xe6\x97cd \xf0\x9f\x98", encoding='ascii')
+        
+        assert text == "ab\ufffdcd \ufffd"
+        assert any("5 undecodable bytes" in record.getMessage() for record in caplog.records)
+    
+    def test_encoding_detector_with_logger(self, caplog):
+        """Test that encoding detector logs warnings when logger is provided."""
+        import logging
+        
+        # Capture records through caplog so no handler outlives the test
+        with caplog.at_level(logging.WARNING, logger='test_encoding'):
+            detector = EncodingDetector(logger=logging.getLogger('test_encoding'))
+            
+            # Validate text with issues
+            text = "Text with replacement: \ufffd"
+            detector.validate_text_encoding(text)
         
         # Check that warning was logged
-        log_output = log_stream.getvalue()
-        assert 'replacement character' in log_output.lower()
+        assert any(_REPLACEMENT_RE.search(record.getMessage()) for record in caplog.records)
     
-    def test_detect_encoding_fallback_without_chardet(self):
+    def test_detect_encoding_fallback_without_chardet(self, encoded_corpus):
         """Test fallback encoding detection when chardet is not available."""
         detector = EncodingDetector()
         
         # Test with UTF-8 content
-        content = "Hello, world!".encode('utf-8')
+        content = encoded_corpus["ascii_hello"]
         result = detector._detect_encoding_fallback(content)
         
         assert result.detected_encoding is not None
@@ -215,3 +380,26 @@ class TestEncodingDetector:
         
         assert text == ""
         assert result.detected_encoding is not None
+
+
+class TestGetDetector:
+    """Test suite for the shared detector factory."""
+    
+    def test_same_logger_returns_same_detector(self):
+        """Test that detectors are shared per logger."""
+        import logging
+        
+        logger = logging.getLogger('test_get_detector')
+        
+        assert get_detector(logger) is get_detector(logger)
+        assert get_detector(logger).logger is logger
+    
+    def test_different_loggers_get_different_detectors(self):
+        """Test that a detector never logs to another caller's logger."""
+        import logging
+        
+        first = get_detector(logging.getLogger('test_get_detector_a'))
+        second = get_detector(logging.getLogger('test_get_detector_b'))
+        
+        assert first is not second
+        assert get_detector() is not first
@@ -9,23 +9,36 @@ import logging
 import io
 from src.encoding_detector import EncodingDetector
 from src.parsers import WordParser, ExcelParser, PDFParser
-from docx import Document
-import tempfile
-from pathlib import Path
+
+
+# Formatter shared by every capturing handler in this module
+_LOG_FORMATTER = logging.Formatter('%(levelname)s: %(message)s')
+
+
+@pytest.fixture
+def log_capture():
+    """Provide a WARNING-level logger whose formatted output is captured.
+    
+    Yields:
+        Tuple of (logger, stream holding the formatted log output)
+    """
+    stream = io.StringIO()
+    logger = logging.getLogger('test_encoding_logging')
+    logger.handlers.clear()
+    logger.setLevel(logging.WARNING)
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(_LOG_FORMATTER)
+    logger.addHandler(handler)
+    yield logger, stream
+    logger.removeHandler(handler)
 
 
 class TestEncodingLogging:
     """Test suite for encoding issue logging (Requirement 9.5)."""
     
-    def test_encoding_detector_logs_replacement_characters(self):
+    def test_encoding_detector_logs_replacement_characters(self, log_capture):
         """Test that replacement characters trigger warning logs."""
-        # Create a logger with string stream to capture output
-        log_stream = io.StringIO()
-        logger = logging.getLogger('test_replacement_chars')
-        logger.setLevel(logging.WARNING)
-        handler = logging.StreamHandler(log_stream)
-        handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-        logger.addHandler(handler)
+        logger, log_stream = log_capture
         
         # Create detector with logger
         detector = EncodingDetector(logger=logger)
@@ -42,19 +55,10 @@ class TestEncodingLogging:
         log_output = log_stream.getvalue()
         assert 'WARNING' in log_output
         assert 'replacement character' in log_output.lower()
-        
-        # Clean up
-        logger.removeHandler(handler)
     
-    def test_encoding_detector_logs_mojibake(self):
+    def test_encoding_detector_logs_mojibake(self, log_capture):
         """Test that mojibake patterns trigger warning logs."""
-        # Create a logger with string stream
-        log_stream = io.StringIO()
-        logger = logging.getLogger('test_mojibake')
-        logger.setLevel(logging.WARNING)
-        handler = logging.StreamHandler(log_stream)
-        handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-        logger.addHandler(handler)
+        logger, log_stream = log_capture
         
         # Create detector with logger
         detector = EncodingDetector(logger=logger)
@@ -70,19 +74,10 @@ class TestEncodingLogging:
         log_output = log_stream.getvalue()
         assert 'WARNING' in log_output
         assert 'mojibake' in log_output.lower() or 'encoding' in log_output.lower()
-        
-        # Clean up
-        logger.removeHandler(handler)
     
-    def test_encoding_detector_logs_null_bytes(self):
+    def test_encoding_detector_logs_null_bytes(self, log_capture):
         """Test that null bytes trigger warning logs."""
-        # Create a logger with string stream
-        log_stream = io.StringIO()
-        logger = logging.getLogger('test_null_bytes')
-        logger.setLevel(logging.WARNING)
-        handler = logging.StreamHandler(log_stream)
-        handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-        logger.addHandler(handler)
+        logger, log_stream = log_capture
         
         # Create detector with logger
         detector = EncodingDetector(logger=logger)
@@ -99,19 +94,10 @@ class TestEncodingLogging:
         log_output = log_stream.getvalue()
         assert 'WARNING' in log_output
         assert 'null byte' in log_output.lower()
-        
-        # Clean up
-        logger.removeHandler(handler)
     
-    def test_encoding_detector_logs_control_characters(self):
+    def test_encoding_detector_logs_control_characters(self, log_capture):
         """Test that excessive control characters trigger warning logs."""
-        # Create a logger with string stream
-        log_stream = io.StringIO()
-        logger = logging.getLogger('test_control_chars')
-        logger.setLevel(logging.WARNING)
-        handler = logging.StreamHandler(log_stream)
-        handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-        logger.addHandler(handler)
+        logger, log_stream = log_capture
         
         # Create detector with logger
         detector = EncodingDetector(logger=logger)
@@ -127,19 +113,10 @@ class TestEncodingLogging:
         log_output = log_stream.getvalue()
         assert 'WARNING' in log_output
         assert 'control character' in log_output.lower()
-        
-        # Clean up
-        logger.removeHandler(handler)
     
-    def test_encoding_detector_logs_decode_failure(self):
+    def test_encoding_detector_logs_decode_failure(self, log_capture):
         """Test that decode failures trigger warning logs."""
-        # Create a logger with string stream
-        log_stream = io.StringIO()
-        logger = logging.getLogger('test_decode_failure')
-        logger.setLevel(logging.WARNING)
-        handler = logging.StreamHandler(log_stream)
-        handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-        logger.addHandler(handler)
+        logger, log_stream = log_capture
         
         # Create detector with logger
         detector = EncodingDetector(logger=logger)
@@ -157,19 +134,10 @@ class TestEncodingLogging:
         log_output = log_stream.getvalue()
         assert 'WARNING' in log_output
         assert 'failed' in log_output.lower() or 'fallback' in log_output.lower()
-        
-        # Clean up
-        logger.removeHandler(handler)
     
-    def test_word_parser_logs_encoding_issues(self, tmp_path):
+    def test_word_parser_logs_encoding_issues(self, tmp_path, log_capture):
         """Test that WordParser logs encoding issues during parsing."""
-        # Create a logger with string stream
-        log_stream = io.StringIO()
-        logger = logging.getLogger('test_word_parser')
-        logger.setLevel(logging.WARNING)
-        handler = logging.StreamHandler(log_stream)
-        handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-        logger.addHandler(handler)
+        logger, log_stream = log_capture
         
         # Create parser with logger
         parser = WordParser(logger=logger)
@@ -183,19 +151,10 @@ class TestEncodingLogging:
         assert 'WARNING' in log_output
         assert 'encoding issue' in log_output.lower()
         assert 'word document' in log_output.lower()
-        
-        # Clean up
-        logger.removeHandler(handler)
     
-    def test_excel_parser_logs_encoding_issues(self):
+    def test_excel_parser_logs_encoding_issues(self, log_capture):
         """Test that ExcelParser logs encoding issues during parsing."""
-        # Create a logger with string stream
-        log_stream = io.StringIO()
-        logger = logging.getLogger('test_excel_parser')
-        logger.setLevel(logging.WARNING)
-        handler = logging.StreamHandler(log_stream)
-        handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-        logger.addHandler(handler)
+        logger, log_stream = log_capture
         
         # Create parser with logger
         parser = ExcelParser(logger=logger)
@@ -209,19 +168,22 @@ class TestEncodingLogging:
         assert 'WARNING' in log_output
         assert 'encoding issue' in log_output.lower()
         assert 'excel cell' in log_output.lower()
+    
+    def test_excel_parser_logs_repeated_short_cell_once(self, caplog):
+        """Test that a repeated short cell value is processed and logged once."""
+        logger = logging.getLogger('test_excel_repeated_cell')
+        parser = ExcelParser(logger=logger)
         
-        # Clean up
-        logger.removeHandler(handler)
+        with caplog.at_level(logging.WARNING, logger='test_excel_repeated_cell'):
+            results = [parser._process_text_encoding("Label \ufffd") for _ in range(3)]
+        
+        assert results == ["Label \ufffd"] * 3
+        messages = [record.getMessage().lower() for record in caplog.records]
+        assert sum('excel cell' in message for message in messages) == 1
     
-    def test_pdf_parser_logs_encoding_issues(self):
+    def test_pdf_parser_logs_encoding_issues(self, log_capture):
         """Test that PDFParser logs encoding issues during parsing."""
-        # Create a logger with string stream
-        log_stream = io.StringIO()
-        logger = logging.getLogger('test_pdf_parser')
-        logger.setLevel(logging.WARNING)
-        handler = logging.StreamHandler(log_stream)
-        handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-        logger.addHandler(handler)
+        logger, log_stream = log_capture
         
         # Create parser with logger
         parser = PDFParser(logger=logger)
@@ -235,19 +197,10 @@ class TestEncodingLogging:
         assert 'WARNING' in log_output
         assert 'encoding issue' in log_output.lower()
         assert 'pdf text' in log_output.lower()
-        
-        # Clean up
-        logger.removeHandler(handler)
     
-    def test_no_warnings_for_clean_text(self):
+    def test_no_warnings_for_clean_text(self, log_capture):
         """Test that clean text does not trigger warnings."""
-        # Create a logger with string stream
-        log_stream = io.StringIO()
-        logger = logging.getLogger('test_clean_text')
-        logger.setLevel(logging.WARNING)
-        handler = logging.StreamHandler(log_stream)
-        handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-        logger.addHandler(handler)
+        logger, log_stream = log_capture
         
         # Create detector with logger
         detector = EncodingDetector(logger=logger)
@@ -262,19 +215,10 @@ class TestEncodingLogging:
         # Verify no warnings logged
         log_output = log_stream.getvalue()
         assert 'WARNING' not in log_output
-        
-        # Clean up
-        logger.removeHandler(handler)
     
-    def test_encoding_warning_includes_details(self):
+    def test_encoding_warning_includes_details(self, log_capture):
         """Test that encoding warnings include detailed information."""
-        # Create a logger with string stream
-        log_stream = io.StringIO()
-        logger = logging.getLogger('test_warning_details')
-        logger.setLevel(logging.WARNING)
-        handler = logging.StreamHandler(log_stream)
-        handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-        logger.addHandler(handler)
+        logger, log_stream = log_capture
         
         # Create detector with logger
         detector = EncodingDetector(logger=logger)
@@ -295,6 +239,3 @@ class TestEncodingLogging:
         # Verify counts are included
         assert '3' in log_output  # 3 replacement characters
         assert '2' in log_output  # 2 null bytes
-        
-        # Clean up
-        logger.removeHandler(handler)
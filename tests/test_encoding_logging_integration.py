@@ -4,10 +4,12 @@ This module tests that encoding issues are properly logged during
 end-to-end document conversion, validating Requirement 9.5.
 """
 
+import dataclasses
+import os
+import re
 import pytest
 import logging
-import io
-from pathlib import Path
+import logging.handlers
 from docx import Document
 import openpyxl
 from src.conversion_orchestrator import ConversionOrchestrator
@@ -15,157 +17,157 @@ from src.config import ConversionConfig
 from src.logger import Logger, LogLevel
 
 
+# Preview-mode settings shared by every conversion; only the input differs
+_PREVIEW_CONFIG = ConversionConfig(input_path="", output_path=None, preview_mode=True)
+
+
+def _convert_preview(path, logger):
+    """Convert a document in preview mode and return the ConversionResult."""
+    config = dataclasses.replace(_PREVIEW_CONFIG, input_path=os.fspath(path))
+    orchestrator = ConversionOrchestrator(config, logger)
+    return orchestrator.convert(config.input_path)
+
+
+def _assert_all_present(markdown, needles):
+    """Assert that every needle occurs in markdown, scanning it once."""
+    if not needles:
+        return
+    pattern = re.compile("|".join(map(re.escape, needles)))
+    # A needle can be hidden inside a longer overlapping match, so confirm
+    # any not found by the scan with a direct substring check
+    missing = {
+        needle for needle in set(needles) - set(pattern.findall(markdown))
+        if needle not in markdown
+    }
+    assert not missing, missing
+
+
+@pytest.fixture(scope="session")
+def cafe_docx(tmp_path_factory):
+    """Word document with a plain and an accented paragraph."""
+    doc_path = tmp_path_factory.mktemp("logging") / "test_encoding.docx"
+    doc = Document()
+    doc.add_paragraph("Normal text")
+    doc.add_paragraph("Text with special chars: café résumé")
+    doc.save(str(doc_path))
+    return doc_path
+
+
+@pytest.fixture(scope="session")
+def cafe_sentence_docx(tmp_path_factory):
+    """Word document with a single accented sentence."""
+    doc_path = tmp_path_factory.mktemp("logging") / "test_doc.docx"
+    doc = Document()
+    doc.add_paragraph("Test content with special characters: café")
+    doc.save(str(doc_path))
+    return doc_path
+
+
+@pytest.fixture(scope="session")
+def three_paragraph_docx(tmp_path_factory):
+    """Word document with three plain paragraphs."""
+    doc_path = tmp_path_factory.mktemp("logging") / "test_multiple.docx"
+    doc = Document()
+    doc.add_paragraph("First paragraph")
+    doc.add_paragraph("Second paragraph")
+    doc.add_paragraph("Third paragraph")
+    doc.save(str(doc_path))
+    return doc_path
+
+
+@pytest.fixture(scope="session")
+def multilingual_docx(tmp_path_factory):
+    """Word document with one paragraph per language."""
+    doc_path = tmp_path_factory.mktemp("logging") / "test_multilingual.docx"
+    doc = Document()
+    doc.add_paragraph("English text")
+    doc.add_paragraph("日本語テキスト")
+    doc.add_paragraph("中文文本")
+    doc.add_paragraph("한국어 텍스트")
+    doc.add_paragraph("Русский текст")
+    doc.add_paragraph("العربية")
+    doc.save(str(doc_path))
+    return doc_path
+
+
+@pytest.fixture(scope="session")
+def cafe_xlsx(tmp_path_factory):
+    """Excel workbook with a small table including an accented value."""
+    excel_path = tmp_path_factory.mktemp("logging") / "test_encoding.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Test Sheet"
+    
+    ws['A1'] = "Name"
+    ws['B1'] = "Value"
+    ws['A2'] = "Normal"
+    ws['B2'] = "Text"
+    ws['A3'] = "Special"
+    ws['B3'] = "café"
+    
+    wb.save(str(excel_path))
+    return excel_path
+
+
+@pytest.fixture(scope="module")
+def _shared_log_capture():
+    """Build the capturing logger and its handler once per module."""
+    # Instantiated directly rather than through getLogger, so the logger is
+    # never registered with (or kept alive by) the logging manager and has
+    # no parent to propagate to. None of these tests read DEBUG records, so
+    # skip creating them.
+    logger = logging.Logger(__name__, logging.WARNING)
+    # Buffer LogRecords as-is; nothing is formatted unless a test reads it
+    handler = logging.handlers.MemoryHandler(
+        capacity=10000, flushLevel=logging.CRITICAL + 1
+    )
+    logger.addHandler(handler)
+    
+    custom_logger = Logger(log_level=LogLevel.WARNING)
+    custom_logger.logger = logger  # Use our test logger
+    
+    yield custom_logger, handler
+    
+    handler.close()
+
+
+@pytest.fixture
+def capture_logger(_shared_log_capture):
+    """Provide the shared Logger and an emptied list of captured records."""
+    custom_logger, handler = _shared_log_capture
+    handler.buffer.clear()
+    return custom_logger, handler.buffer
+
+
 class TestEncodingLoggingIntegration:
     """Integration tests for encoding issue logging in conversion pipeline."""
     
-    def test_word_conversion_logs_encoding_issues(self, tmp_path):
-        """Test that Word conversion logs encoding issues when detected."""
-        # Create a Word document
-        doc_path = tmp_path / "test_encoding.docx"
-        doc = Document()
-        doc.add_paragraph("Normal text")
-        doc.add_paragraph("Text with special chars: café résumé")
-        doc.save(str(doc_path))
-        
-        # Create a logger with string stream to capture logs
-        log_stream = io.StringIO()
-        logger = logging.getLogger('test_word_conversion')
-        logger.setLevel(logging.DEBUG)
-        handler = logging.StreamHandler(log_stream)
-        handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-        logger.addHandler(handler)
-        
-        # Create config
-        config = ConversionConfig(
-            input_path=str(doc_path),
-            output_path=None,
-            preview_mode=True
-        )
-        
-        # Create orchestrator with custom logger
-        from src.logger import Logger as CustomLogger
-        custom_logger = CustomLogger(log_level=LogLevel.DEBUG)
-        custom_logger.logger = logger  # Use our test logger
-        
-        orchestrator = ConversionOrchestrator(config, custom_logger)
-        result = orchestrator.convert(str(doc_path))
+    @pytest.mark.parametrize("doc_fixture, needles", [
+        pytest.param("cafe_docx", ["Normal text", "café"], id="word"),
+        pytest.param("cafe_xlsx", ["Normal", "café"], id="excel"),
+        pytest.param("text_pdf_path", [], id="pdf"),
+        pytest.param("three_paragraph_docx", [], id="word-multiple-paragraphs"),
+        pytest.param("multilingual_docx", ["English", "日本語", "中文"], id="word-multilingual"),
+    ])
+    def test_conversion_with_encoding_logging(self, request, capture_logger, doc_fixture, needles):
+        """Test that conversion with encoding logging enabled preserves text."""
+        doc_path = request.getfixturevalue(doc_fixture)
+        custom_logger, log_records = capture_logger
+        result = _convert_preview(doc_path, custom_logger)
         
         # Verify conversion succeeded
         assert result.success
         assert result.markdown_content is not None
         
         # Verify text is in output
-        assert "Normal text" in result.markdown_content
-        assert "café" in result.markdown_content
-        
-        # Clean up
-        logger.removeHandler(handler)
+        _assert_all_present(result.markdown_content, needles)
     
-    def test_excel_conversion_logs_encoding_issues(self, tmp_path):
-        """Test that Excel conversion logs encoding issues when detected."""
-        # Create an Excel file
-        excel_path = tmp_path / "test_encoding.xlsx"
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Test Sheet"
-        
-        ws['A1'] = "Name"
-        ws['B1'] = "Value"
-        ws['A2'] = "Normal"
-        ws['B2'] = "Text"
-        ws['A3'] = "Special"
-        ws['B3'] = "café"
-        
-        wb.save(str(excel_path))
-        
-        # Create a logger with string stream
-        log_stream = io.StringIO()
-        logger = logging.getLogger('test_excel_conversion')
-        logger.setLevel(logging.DEBUG)
-        handler = logging.StreamHandler(log_stream)
-        handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-        logger.addHandler(handler)
-        
-        # Create config
-        config = ConversionConfig(
-            input_path=str(excel_path),
-            output_path=None,
-            preview_mode=True
-        )
-        
-        # Create orchestrator with custom logger
-        from src.logger import Logger as CustomLogger
-        custom_logger = CustomLogger(log_level=LogLevel.DEBUG)
-        custom_logger.logger = logger
-        
-        orchestrator = ConversionOrchestrator(config, custom_logger)
-        result = orchestrator.convert(str(excel_path))
-        
-        # Verify conversion succeeded
-        assert result.success
-        assert result.markdown_content is not None
-        
-        # Verify text is in output
-        assert "Normal" in result.markdown_content
-        assert "café" in result.markdown_content
-        
-        # Clean up
-        logger.removeHandler(handler)
-    
-    def test_pdf_conversion_logs_encoding_issues(self, tmp_path):
-        """Test that PDF conversion logs encoding issues when detected."""
-        from reportlab.pdfgen import canvas
-        from reportlab.lib.pagesizes import letter
-        
-        # Create a simple PDF
-        pdf_path = tmp_path / "test_encoding.pdf"
-        c = canvas.Canvas(str(pdf_path), pagesize=letter)
-        c.drawString(100, 750, "Test Document")
-        c.drawString(100, 730, "Normal text content")
-        c.save()
-        
-        # Create a logger with string stream
-        log_stream = io.StringIO()
-        logger = logging.getLogger('test_pdf_conversion')
-        logger.setLevel(logging.DEBUG)
-        handler = logging.StreamHandler(log_stream)
-        handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-        logger.addHandler(handler)
-        
-        # Create config
-        config = ConversionConfig(
-            input_path=str(pdf_path),
-            output_path=None,
-            preview_mode=True
-        )
-        
-        # Create orchestrator with custom logger
-        from src.logger import Logger as CustomLogger
-        custom_logger = CustomLogger(log_level=LogLevel.DEBUG)
-        custom_logger.logger = logger
-        
-        orchestrator = ConversionOrchestrator(config, custom_logger)
-        result = orchestrator.convert(str(pdf_path))
-        
-        # Verify conversion succeeded
-        assert result.success
-        assert result.markdown_content is not None
-        
-        # Clean up
-        logger.removeHandler(handler)
-    
-    def test_encoding_warnings_appear_in_log_file(self, tmp_path):
+    def test_encoding_warnings_appear_in_log_file(self, tmp_path, cafe_sentence_docx):
         """Test that encoding warnings are written to log file."""
-        # Create a Word document
-        doc_path = tmp_path / "test_doc.docx"
-        doc = Document()
-        doc.add_paragraph("Test content with special characters: café")
-        doc.save(str(doc_path))
-        
         # Create config with log file
         log_path = tmp_path / "conversion.log"
         config = ConversionConfig(
-            input_path=str(doc_path),
+            input_path=str(cafe_sentence_docx),
             output_path=None,
             preview_mode=True,
             log_file=str(log_path),
@@ -175,105 +177,32 @@ class TestEncodingLoggingIntegration:
         # Create logger that writes to file
         logger = Logger(log_level=LogLevel.DEBUG, output_path=str(log_path))
         
-        # Convert document
-        orchestrator = ConversionOrchestrator(config, logger)
-        result = orchestrator.convert(str(doc_path))
-        
-        # Verify conversion succeeded
-        assert result.success
-        
-        # Verify log file exists
-        assert log_path.exists()
-        
-        # Read log file
-        log_content = log_path.read_text()
-        
-        # Verify log contains conversion information
-        assert len(log_content) > 0
-    
-    def test_multiple_encoding_issues_all_logged(self, tmp_path):
-        """Test that multiple encoding issues are all logged."""
-        # Create a Word document
-        doc_path = tmp_path / "test_multiple.docx"
-        doc = Document()
-        doc.add_paragraph("First paragraph")
-        doc.add_paragraph("Second paragraph")
-        doc.add_paragraph("Third paragraph")
-        doc.save(str(doc_path))
-        
-        # Create a logger with string stream
-        log_stream = io.StringIO()
-        logger = logging.getLogger('test_multiple_issues')
-        logger.setLevel(logging.DEBUG)
-        handler = logging.StreamHandler(log_stream)
-        handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-        logger.addHandler(handler)
-        
-        # Create config
-        config = ConversionConfig(
-            input_path=str(doc_path),
-            output_path=None,
-            preview_mode=True
+        # Buffer records in memory during conversion and write them to the
+        # file handler in one batch afterwards
+        file_handler = next(
+            h for h in logger.logger.handlers if isinstance(h, logging.FileHandler)
         )
-        
-        # Create orchestrator with custom logger
-        from src.logger import Logger as CustomLogger
-        custom_logger = CustomLogger(log_level=LogLevel.DEBUG)
-        custom_logger.logger = logger
-        
-        orchestrator = ConversionOrchestrator(config, custom_logger)
-        result = orchestrator.convert(str(doc_path))
-        
-        # Verify conversion succeeded
-        assert result.success
-        
-        # Clean up
-        logger.removeHandler(handler)
-    
-    def test_encoding_logging_with_multilingual_content(self, tmp_path):
-        """Test encoding logging with multilingual content."""
-        # Create a Word document with multiple languages
-        doc_path = tmp_path / "test_multilingual.docx"
-        doc = Document()
-        doc.add_paragraph("English text")
-        doc.add_paragraph("日本語テキスト")
-        doc.add_paragraph("中文文本")
-        doc.add_paragraph("한국어 텍스트")
-        doc.add_paragraph("Русский текст")
-        doc.add_paragraph("العربية")
-        doc.save(str(doc_path))
-        
-        # Create a logger with string stream
-        log_stream = io.StringIO()
-        logger = logging.getLogger('test_multilingual')
-        logger.setLevel(logging.DEBUG)
-        handler = logging.StreamHandler(log_stream)
-        handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-        logger.addHandler(handler)
-        
-        # Create config
-        config = ConversionConfig(
-            input_path=str(doc_path),
-            output_path=None,
-            preview_mode=True
+        buffered = logging.handlers.MemoryHandler(
+            capacity=10000, flushLevel=logging.CRITICAL + 1, target=file_handler
         )
+        logger.logger.removeHandler(file_handler)
+        logger.logger.addHandler(buffered)
         
-        # Create orchestrator with custom logger
-        from src.logger import Logger as CustomLogger
-        custom_logger = CustomLogger(log_level=LogLevel.DEBUG)
-        custom_logger.logger = logger
-        
-        orchestrator = ConversionOrchestrator(config, custom_logger)
-        result = orchestrator.convert(str(doc_path))
+        # Convert document
+        try:
+            orchestrator = ConversionOrchestrator(config, logger)
+            result = orchestrator.convert(str(cafe_sentence_docx))
+        finally:
+            # Closing the buffer flushes its records to the file handler
+            logger.close()
+            file_handler.close()
         
         # Verify conversion succeeded
         assert result.success
-        assert result.markdown_content is not None
         
-        # Verify multilingual content is preserved
-        assert "English" in result.markdown_content
-        assert "日本語" in result.markdown_content
-        assert "中文" in result.markdown_content
+        # Verify log file exists
+        assert log_path.exists()
         
-        # Clean up
-        logger.removeHandler(handler)
+        # Verify log contains conversion information; only its size is
+        # needed, so the file is not read or decoded
+        assert log_path.stat().st_size > 0
@@ -16,6 +16,38 @@ from src.encoding_detector import EncodingDetector, EncodingDetectionResult
 from src.logger import Logger, LogLevel
 
 
+# Formatter shared by every capturing handler in this module
+_LOG_FORMATTER = logging.Formatter('%(levelname)s: %(message)s')
+
+
+@pytest.fixture(scope="class")
+def log_capture():
+    """Provide a WARNING-level logger whose formatted output is captured.
+    
+    Built once per test class and shared by all Hypothesis examples; each
+    example empties the stream before running.
+    
+    Yields:
+        Tuple of (logger, stream holding the formatted log output)
+    """
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(_LOG_FORMATTER)
+    # Instantiated directly so no per-example entries pile up in the
+    # logging manager
+    logger = logging.Logger('test_encoding_logging', logging.WARNING)
+    logger.addHandler(handler)
+    yield logger, stream
+    handler.close()
+
+
+@pytest.fixture(scope="class")
+def detector(log_capture):
+    """EncodingDetector reporting to the capturing logger."""
+    logger, _ = log_capture
+    return EncodingDetector(logger=logger)
+
+
 # Strategy for generating text with encoding issues
 def text_with_replacement_chars():
     """Generate text containing replacement characters."""
@@ -86,7 +118,7 @@ class TestEncodingLoggingProperty:
     
     @given(text=text_with_replacement_chars())
     @settings(max_examples=100, deadline=None)
-    def test_property_41_log_replacement_characters(self, text):
+    def test_property_41_log_replacement_characters(self, log_capture, detector, text):
         """
         Feature: document-to-markdown-converter
         Property 41: Encoding issue logging (replacement characters)
@@ -96,17 +128,10 @@ class TestEncodingLoggingProperty:
         
         **Validates: Requirements 9.5**
         """
-        # Create a logger with string stream to capture logs
-        log_stream = io.StringIO()
-        logger = logging.getLogger(f'test_replacement_{id(text)}')
-        logger.setLevel(logging.WARNING)
-        logger.handlers.clear()  # Clear any existing handlers
-        handler = logging.StreamHandler(log_stream)
-        handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-        logger.addHandler(handler)
-        
-        # Create detector with logger
-        detector = EncodingDetector(logger=logger)
+        # Start each example with an empty log
+        _, log_stream = log_capture
+        log_stream.seek(0)
+        log_stream.truncate()
         
         # Validate text encoding
         result = detector.validate_text_encoding(text)
@@ -130,13 +155,10 @@ class TestEncodingLoggingProperty:
         replacement_count = text.count('\ufffd')
         assert str(replacement_count) in log_output, \
             f"Log should include count of replacement characters ({replacement_count})"
-        
-        # Clean up
-        logger.removeHandler(handler)
     
     @given(text=text_with_null_bytes())
     @settings(max_examples=100, deadline=None)
-    def test_property_41_log_null_bytes(self, text):
+    def test_property_41_log_null_bytes(self, log_capture, detector, text):
         """
         Feature: document-to-markdown-converter
         Property 41: Encoding issue logging (null bytes)
@@ -150,17 +172,10 @@ class TestEncodingLoggingProperty:
         if '\x00' not in text:
             return
         
-        # Create a logger with string stream
-        log_stream = io.StringIO()
-        logger = logging.getLogger(f'test_null_{id(text)}')
-        logger.setLevel(logging.WARNING)
-        logger.handlers.clear()
-        handler = logging.StreamHandler(log_stream)
-        handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-        logger.addHandler(handler)
-        
-        # Create detector with logger
-        detector = EncodingDetector(logger=logger)
+        # Start each example with an empty log
+        _, log_stream = log_capture
+        log_stream.seek(0)
+        log_stream.truncate()
         
         # Validate text encoding
         result = detector.validate_text_encoding(text)
@@ -184,13 +199,10 @@ class TestEncodingLoggingProperty:
         null_count = text.count('\x00')
         assert str(null_count) in log_output, \
             f"Log should include count of null bytes ({null_count})"
-        
-        # Clean up
-        logger.removeHandler(handler)
     
     @given(text=text_with_control_chars())
     @settings(max_examples=100, deadline=None)
-    def test_property_41_log_control_characters(self, text):
+    def test_property_41_log_control_characters(self, log_capture, detector, text):
         """
         Feature: document-to-markdown-converter
         Property 41: Encoding issue logging (control characters)
@@ -200,17 +212,10 @@ class TestEncodingLoggingProperty:
         
         **Validates: Requirements 9.5**
         """
-        # Create a logger with string stream
-        log_stream = io.StringIO()
-        logger = logging.getLogger(f'test_control_{id(text)}')
-        logger.setLevel(logging.WARNING)
-        logger.handlers.clear()
-        handler = logging.StreamHandler(log_stream)
-        handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-        logger.addHandler(handler)
-        
-        # Create detector with logger
-        detector = EncodingDetector(logger=logger)
+        # Start each example with an empty log
+        _, log_stream = log_capture
+        log_stream.seek(0)
+        log_stream.truncate()
         
         # Validate text encoding
         result = detector.validate_text_encoding(text)
@@ -240,13 +245,10 @@ class TestEncodingLoggingProperty:
             # Property: Log should include count of control characters
             assert str(control_count) in log_output, \
                 f"Log should include count of control characters ({control_count})"
-        
-        # Clean up
-        logger.removeHandler(handler)
     
     @given(text=text_with_mojibake())
     @settings(max_examples=100, deadline=None)
-    def test_property_41_log_mojibake_patterns(self, text):
+    def test_property_41_log_mojibake_patterns(self, log_capture, detector, text):
         """
         Feature: document-to-markdown-converter
         Property 41: Encoding issue logging (mojibake)
@@ -256,17 +258,10 @@ class TestEncodingLoggingProperty:
         
         **Validates: Requirements 9.5**
         """
-        # Create a logger with string stream
-        log_stream = io.StringIO()
-        logger = logging.getLogger(f'test_mojibake_{id(text)}')
-        logger.setLevel(logging.WARNING)
-        logger.handlers.clear()
-        handler = logging.StreamHandler(log_stream)
-        handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-        logger.addHandler(handler)
-        
-        # Create detector with logger
-        detector = EncodingDetector(logger=logger)
+        # Start each example with an empty log
+        _, log_stream = log_capture
+        log_stream.seek(0)
+        log_stream.truncate()
         
         # Validate text encoding
         result = detector.validate_text_encoding(text)
@@ -285,13 +280,10 @@ class TestEncodingLoggingProperty:
             "Should log a WARNING for mojibake patterns"
         assert 'mojibake' in log_output.lower() or 'encoding' in log_output.lower(), \
             "Log should mention mojibake or encoding issues"
-        
-        # Clean up
-        logger.removeHandler(handler)
     
     @given(text=clean_text_strategy)
     @settings(max_examples=100, deadline=None)
-    def test_property_41_no_warnings_for_clean_text(self, text):
+    def test_property_41_no_warnings_for_clean_text(self, log_capture, detector, text):
         """
         Feature: document-to-markdown-converter
         Property 41: Encoding issue logging (clean text)
@@ -305,17 +297,10 @@ class TestEncodingLoggingProperty:
         if not text.strip():
             return
         
-        # Create a logger with string stream
-        log_stream = io.StringIO()
-        logger = logging.getLogger(f'test_clean_{id(text)}')
-        logger.setLevel(logging.WARNING)
-        logger.handlers.clear()
-        handler = logging.StreamHandler(log_stream)
-        handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-        logger.addHandler(handler)
-        
-        # Create detector with logger
-        detector = EncodingDetector(logger=logger)
+        # Start each example with an empty log
+        _, log_stream = log_capture
+        log_stream.seek(0)
+        log_stream.truncate()
         
         # Validate text encoding
         result = detector.validate_text_encoding(text)
@@ -332,16 +317,13 @@ class TestEncodingLoggingProperty:
         log_output = log_stream.getvalue()
         assert 'WARNING' not in log_output, \
             "Should not log warnings for clean text"
-        
-        # Clean up
-        logger.removeHandler(handler)
     
     @given(
         content=st.binary(min_size=10, max_size=200),
         encoding=st.sampled_from(['utf-8', 'latin-1', 'cp1252'])
     )
     @settings(max_examples=100, deadline=None)
-    def test_property_41_log_decode_failures(self, content, encoding):
+    def test_property_41_log_decode_failures(self, log_capture, detector, content, encoding):
         """
         Feature: document-to-markdown-converter
         Property 41: Encoding issue logging (decode failures)
@@ -351,17 +333,10 @@ class TestEncodingLoggingProperty:
         
         **Validates: Requirements 9.5**
         """
-        # Create a logger with string stream
-        log_stream = io.StringIO()
-        logger = logging.getLogger(f'test_decode_{id(content)}')
-        logger.setLevel(logging.WARNING)
-        logger.handlers.clear()
-        handler = logging.StreamHandler(log_stream)
-        handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-        logger.addHandler(handler)
-        
-        # Create detector with logger
-        detector = EncodingDetector(logger=logger)
+        # Start each example with an empty log
+        _, log_stream = log_capture
+        log_stream.seek(0)
+        log_stream.truncate()
         
         # Try to decode with specified encoding (may fail for binary data)
         text, result = detector.decode_with_fallback(content, encoding=encoding)
@@ -383,9 +358,6 @@ class TestEncodingLoggingProperty:
             log_output = log_stream.getvalue()
             assert 'WARNING' in log_output or 'ERROR' in log_output, \
                 "Should log warnings or errors when encoding issues are detected"
-        
-        # Clean up
-        logger.removeHandler(handler)
     
     @given(
         text=st.one_of(
@@ -395,7 +367,7 @@ class TestEncodingLoggingProperty:
         )
     )
     @settings(max_examples=100, deadline=None)
-    def test_property_41_log_includes_details(self, text):
+    def test_property_41_log_includes_details(self, log_capture, detector, text):
         """
         Feature: document-to-markdown-converter
         Property 41: Encoding issue logging (detailed information)
@@ -405,17 +377,10 @@ class TestEncodingLoggingProperty:
         
         **Validates: Requirements 9.5**
         """
-        # Create a logger with string stream
-        log_stream = io.StringIO()
-        logger = logging.getLogger(f'test_details_{id(text)}')
-        logger.setLevel(logging.WARNING)
-        logger.handlers.clear()
-        handler = logging.StreamHandler(log_stream)
-        handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-        logger.addHandler(handler)
-        
-        # Create detector with logger
-        detector = EncodingDetector(logger=logger)
+        # Start each example with an empty log
+        _, log_stream = log_capture
+        log_stream.seek(0)
+        log_stream.truncate()
         
         # Validate text encoding
         result = detector.validate_text_encoding(text)
@@ -450,15 +415,12 @@ class TestEncodingLoggingProperty:
                     max_reasonable = len(text) * 4
                     assert 0 <= num <= max_reasonable, \
                         f"Counts in log should be reasonable (0 to {max_reasonable}), got {num}"
-        
-        # Clean up
-        logger.removeHandler(handler)
     
     @given(
         text=st.text(min_size=10, max_size=100)
     )
     @settings(max_examples=100, deadline=None)
-    def test_property_41_logging_is_consistent(self, text):
+    def test_property_41_logging_is_consistent(self, log_capture, detector, text):
         """
         Feature: document-to-markdown-converter
         Property 41: Encoding issue logging (consistency)
@@ -468,33 +430,17 @@ class TestEncodingLoggingProperty:
         
         **Validates: Requirements 9.5**
         """
-        # Create a logger with string stream
-        log_stream1 = io.StringIO()
-        logger1 = logging.getLogger(f'test_consistent_1_{id(text)}')
-        logger1.setLevel(logging.WARNING)
-        logger1.handlers.clear()
-        handler1 = logging.StreamHandler(log_stream1)
-        handler1.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-        logger1.addHandler(handler1)
-        
-        # Create detector with first logger
-        detector1 = EncodingDetector(logger=logger1)
-        result1 = detector1.validate_text_encoding(text)
-        log_output1 = log_stream1.getvalue()
-        
-        # Create a second logger with string stream
-        log_stream2 = io.StringIO()
-        logger2 = logging.getLogger(f'test_consistent_2_{id(text)}')
-        logger2.setLevel(logging.WARNING)
-        logger2.handlers.clear()
-        handler2 = logging.StreamHandler(log_stream2)
-        handler2.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-        logger2.addHandler(handler2)
-        
-        # Create detector with second logger
-        detector2 = EncodingDetector(logger=logger2)
-        result2 = detector2.validate_text_encoding(text)
-        log_output2 = log_stream2.getvalue()
+        # Validate twice, capturing each run's log separately
+        _, log_stream = log_capture
+        log_stream.seek(0)
+        log_stream.truncate()
+        result1 = detector.validate_text_encoding(text)
+        log_output1 = log_stream.getvalue()
+        
+        log_stream.seek(0)
+        log_stream.truncate()
+        result2 = detector.validate_text_encoding(text)
+        log_output2 = log_stream.getvalue()
         
         # Property: Results should be identical
         assert result1.has_issues == result2.has_issues, \
@@ -507,10 +453,6 @@ class TestEncodingLoggingProperty:
         has_warnings2 = 'WARNING' in log_output2
         assert has_warnings1 == has_warnings2, \
             "Logging behavior should be consistent across multiple validations"
-        
-        # Clean up
-        logger1.removeHandler(handler1)
-        logger2.removeHandler(handler2)
     
     @given(
         text=st.text(
@@ -526,7 +468,7 @@ class TestEncodingLoggingProperty:
         )
     )
     @settings(max_examples=100, deadline=None)
-    def test_property_41_multilingual_text_logging(self, text):
+    def test_property_41_multilingual_text_logging(self, log_capture, detector, text):
         """
         Feature: document-to-markdown-converter
         Property 41: Encoding issue logging (multilingual)
@@ -540,17 +482,10 @@ class TestEncodingLoggingProperty:
         if not text.strip():
             return
         
-        # Create a logger with string stream
-        log_stream = io.StringIO()
-        logger = logging.getLogger(f'test_multilingual_{id(text)}')
-        logger.setLevel(logging.WARNING)
-        logger.handlers.clear()
-        handler = logging.StreamHandler(log_stream)
-        handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-        logger.addHandler(handler)
-        
-        # Create detector with logger
-        detector = EncodingDetector(logger=logger)
+        # Start each example with an empty log
+        _, log_stream = log_capture
+        log_stream.seek(0)
+        log_stream.truncate()
         
         # Validate text encoding
         result = detector.validate_text_encoding(text)
@@ -576,9 +511,6 @@ class TestEncodingLoggingProperty:
                 log_output = log_stream.getvalue()
                 assert 'WARNING' not in log_output, \
                     "Should not log warnings for valid multilingual text"
-        
-        # Clean up
-        logger.removeHandler(handler)
 
 
 # Run all property tests
@@ -61,3 +61,13 @@ class TestFormatRouter:
         router.get_parser(FileFormat.DOCX)
         router.get_parser(FileFormat.XLSX)
         router.get_parser(FileFormat.PDF)
+    
+    def test_parsers_created_on_first_use(self):
+        """Test that parsers are only instantiated for requested formats."""
+        router = FormatRouter()
+        
+        assert router._parsers == {}
+        
+        router.get_parser(FileFormat.XLSX)
+        
+        assert list(router._parsers) == [FileFormat.XLSX]
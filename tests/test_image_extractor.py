@@ -12,6 +12,20 @@ from src.image_extractor import ImageExtractor
 from src.internal_representation import ImageReference, InternalDocument, DocumentMetadata
 
 
+class StubOCREngine:
+    """OCR engine stub that fails for images whose bytes start with b"bad"."""
+    
+    def __init__(self):
+        self.batches = []
+    
+    def batch_ocr(self, images):
+        self.batches.append(images)
+        return [
+            IOError("unreadable image") if image.startswith(b"bad") else image.decode()
+            for image in images
+        ]
+
+
 class TestImageExtractor:
     """Test suite for ImageExtractor class."""
     
@@ -145,6 +159,25 @@ class TestImageExtractor:
         """Test fallback filename generation."""
         filename = self.extractor._extract_filename("", 5)
         assert filename == "image_005.png"
+    
+    def test_ocr_failures_are_per_image_and_skip_unsaved_images(self, capsys):
+        """Test that one OCR failure keeps other results and unsaved images are not OCRed."""
+        ocr_engine = StubOCREngine()
+        extractor = ImageExtractor(output_dir=self.temp_dir, ocr_engine=ocr_engine)
+        refs = [ImageReference(source_path=f"image{i}.png") for i in range(3)]
+        doc = InternalDocument(images=refs)
+        # A directory in place of the second image makes its save fail
+        (Path(self.temp_dir) / "doc" / "images" / "image_002.png").mkdir(parents=True)
+        
+        extractor.extract_images(
+            doc, "doc.docx", [(refs[0], b"bad"), (refs[1], b"unsaved"), (refs[2], b"text")]
+        )
+        
+        assert ocr_engine.batches == [[b"bad", b"text"]]
+        assert refs[0].ocr_text is None
+        assert refs[1].ocr_text is None
+        assert refs[2].ocr_text == "text"
+        assert "OCR failed for image image_001.png: unreadable image" in capsys.readouterr().out
 
 
 class TestImageReferenceInMarkdown:
@@ -0,0 +1,33 @@
+"""Unit tests for batch input prefetching."""
+
+import os
+
+import pytest
+
+from src.io_backend import prefetch
+
+
+class TestPrefetch:
+    """Test suite for prefetch function."""
+
+    def test_small_batches_are_skipped(self, tmp_path):
+        """Test that batches below the threshold issue no hints."""
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"doc{i}.docx"
+            path.write_bytes(b"data")
+            paths.append(str(path))
+
+        assert prefetch(paths) == 0
+
+    @pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="posix_fadvise not available")
+    def test_hints_readable_files_and_skips_missing(self, tmp_path):
+        """Test that existing files are hinted and missing ones ignored."""
+        paths = []
+        for i in range(4):
+            path = tmp_path / f"doc{i}.docx"
+            path.write_bytes(b"data")
+            paths.append(str(path))
+        paths.append(str(tmp_path / "missing.docx"))
+
+        assert prefetch(paths) == 4
@@ -75,6 +75,21 @@ class TestLogger:
         assert "Error occurred" in log_content
         assert "Test exception" in log_content
     
+    def test_logger_error_with_positional_exception_containing_percent(self, temp_dir):
+        """Test that the exception may be passed positionally and contain '%'."""
+        log_file = temp_dir / "percent.log"
+        logger = Logger(log_level=LogLevel.ERROR, output_path=str(log_file))
+        
+        try:
+            raise ValueError("100% broken")
+        except ValueError as e:
+            logger.error("Error at 50%", e)
+        Logger.close()
+        
+        log_content = log_file.read_text()
+        assert "Error at 50%: 100% broken" in log_content
+        assert "not all arguments converted" not in log_content
+    
     def test_log_conversion_start(self, temp_dir):
         """Test conversion start logging."""
         log_file = temp_dir / "conversion.log"
@@ -112,3 +127,53 @@ class TestLogger:
         assert "Info message" not in log_content
         assert "Warning message" in log_content
         assert "Error message" in log_content
+    
+    def test_loggers_share_underlying_logger(self):
+        """Test that all Logger instances reuse the module-level logger."""
+        first = Logger(log_level=LogLevel.INFO)
+        second = Logger(log_level=LogLevel.ERROR)
+        
+        assert first.logger is second.logger
+        assert len(second.logger.handlers) == 1
+    
+    def test_reconfigure_closes_previous_file_handler(self, temp_dir):
+        """Test that reconfiguring replaces and closes the previous file handler."""
+        first_log = temp_dir / "first.log"
+        second_log = temp_dir / "second.log"
+        Logger(log_level=LogLevel.INFO, output_path=str(first_log))
+        old_handlers = list(Logger.configure(LogLevel.INFO, str(first_log)).handlers)
+        
+        logger = Logger(log_level=LogLevel.INFO, output_path=str(second_log))
+        logger.info("Only in second log")
+        
+        assert len(logger.logger.handlers) == 2
+        assert all(h not in logger.logger.handlers for h in old_handlers)
+        assert "Only in second log" not in first_log.read_text()
+        assert "Only in second log" in second_log.read_text()
+    
+    def test_lazy_arguments_formatted_only_when_emitted(self, temp_dir):
+        """Test that %-style arguments are formatted only for emitted records."""
+        class Exploding:
+            def __str__(self):
+                raise AssertionError("formatted a suppressed record")
+        
+        log_file = temp_dir / "lazy.log"
+        logger = Logger(log_level=LogLevel.INFO, output_path=str(log_file))
+        
+        logger.debug("Suppressed %s", Exploding())
+        logger.info("Serialized %d characters", 42)
+        
+        assert "Serialized 42 characters" in log_file.read_text()
+    
+    def test_close_flushes_and_releases_handlers(self, temp_dir):
+        """Test that close() detaches all handlers and leaves the log on disk."""
+        log_file = temp_dir / "closed.log"
+        logger = Logger(log_level=LogLevel.INFO, output_path=str(log_file))
+        file_handler = logger.logger.handlers[-1]
+        logger.info("Written before close")
+        
+        logger.close()
+        
+        assert logger.logger.handlers == []
+        assert file_handler.stream is None
+        assert "Written before close" in log_file.read_text()
@@ -40,6 +40,13 @@ class TestMarkdownEscaper:
         
         assert "\\\\" in result
     
+    def test_escape_normal_text_backslash_before_special_char(self):
+        """Test that a literal backslash does not suppress the next escape."""
+        text = "a\\*b"
+        result = MarkdownEscaper.escape_text(text, context="normal")
+        
+        assert result == "a\\\\\\*b"
+    
     def test_escape_table_text_pipe(self):
         """Test escaping pipes in table cells."""
         text = "Data | with pipe"
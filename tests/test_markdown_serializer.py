@@ -44,6 +44,15 @@ class TestMarkdownSerializer:
         
         assert result == "## Test Heading"
     
+    def test_serialize_heading_offset_clamps_level(self):
+        """Test that offset heading levels stay within 1-6."""
+        deeper = MarkdownSerializer(heading_offset=2)
+        shallower = MarkdownSerializer(heading_offset=-2)
+        
+        assert deeper.serialize_heading(Heading(level=5, text="H")) == "###### H"
+        assert shallower.serialize_heading(Heading(level=2, text="H")) == "# H"
+        assert shallower.serialize_heading(Heading(level=4, text="H")) == "## H"
+    
     def test_serialize_paragraph_normal(self):
         """Test normal paragraph serialization."""
         serializer = MarkdownSerializer()
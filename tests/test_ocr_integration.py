@@ -25,11 +25,12 @@ class TestOCRIntegration:
         if Path(self.temp_dir).exists():
             shutil.rmtree(self.temp_dir)
     
-    def _create_test_image_bytes(self, text: str = "Test") -> bytes:
+    def _create_test_image_bytes(self, text: str = "Test", scale: int = 1) -> bytes:
         """Create a simple test image with text as bytes.
         
         Args:
             text: Text to render in the image
+            scale: Factor to enlarge the image by, for reliable recognition
         
         Returns:
             Image bytes
@@ -37,6 +38,8 @@ class TestOCRIntegration:
         img = Image.new('RGB', (200, 50), color='white')
         draw = ImageDraw.Draw(img)
         draw.text((10, 15), text, fill='black')
+        if scale > 1:
+            img = img.resize((200 * scale, 50 * scale))
         
         # Save to bytes
         import io
@@ -236,3 +239,31 @@ class TestOCRIntegration:
         
         # Verify original language is restored
         assert ocr_engine.get_language() == "eng"
+    
+    def test_batch_ocr_preserves_order(self):
+        """Test that batch_ocr returns one result per image in input order."""
+        try:
+            from src.ocr_engine import OCREngine
+            ocr_engine = OCREngine(language="eng", max_workers=2)
+        except RuntimeError:
+            pytest.skip("Tesseract not available")
+        
+        images = [self._create_test_image_bytes(text, scale=4) for text in ("ONE", "TWO", "THREE")]
+        images.append(b"not an image")
+        
+        results = ocr_engine.batch_ocr(images)
+        
+        assert len(results) == 4
+        assert isinstance(results[3], Exception)
+        for text, result in zip(("ONE", "TWO", "THREE"), results[:3]):
+            assert text in result.upper()
+    
+    def test_batch_ocr_empty_input(self):
+        """Test that batch_ocr on no images returns an empty list."""
+        try:
+            from src.ocr_engine import OCREngine
+            ocr_engine = OCREngine(language="eng")
+        except RuntimeError:
+            pytest.skip("Tesseract not available")
+        
+        assert ocr_engine.batch_ocr([]) == []
@@ -56,6 +56,16 @@ class TestOutputWriter:
         
         assert output_path.read_text(encoding='utf-8') == content
     
+    def test_write_to_file_keeps_unix_newlines(self, tmp_path):
+        """Test that line endings are written without platform translation."""
+        writer = OutputWriter()
+        output_path = tmp_path / "output.md"
+        content = "# Title\n\n" + "line\n" * 10000
+        
+        writer.write_to_file(content, str(output_path))
+        
+        assert output_path.read_bytes() == content.encode('utf-8')
+    
     def test_write_to_file_raises_on_invalid_path(self):
         """Test that write_to_file raises IOError for invalid paths."""
         writer = OutputWriter()
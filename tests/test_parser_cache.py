@@ -0,0 +1,253 @@
+"""Unit tests for CachingParser."""
+
+import os
+import pickle
+from pathlib import Path
+
+import pytest
+
+from src.config import ConversionConfig
+from src.conversion_orchestrator import ConversionOrchestrator
+from src.file_validator import FileFormat
+from src.format_router import FormatRouter
+from src.internal_representation import (
+    InternalDocument, DocumentMetadata, Section, Heading, Paragraph, ImageReference
+)
+from src.logger import Logger, LogLevel
+from src.parser_cache import (
+    CACHE_CONFIG_FIELDS, CachingParser, DEFAULT_CACHE_DIR, cache_options, clear_memory_cache,
+    default_cache_dir
+)
+from src.parsers import DocumentParser
+
+
+class CountingParser(DocumentParser):
+    """Parser stub that records how often it was invoked."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def parse(self, file_path: str) -> InternalDocument:
+        self.calls += 1
+        text = Path(file_path).read_text(encoding="utf-8")
+        self._image_data = [("image", b"bytes")]
+        return InternalDocument(
+            metadata=DocumentMetadata(source_format="docx"),
+            sections=[Section(heading=Heading(level=1, text=text), content=[Paragraph(text=text)])]
+        )
+
+
+class TestCachingParser:
+    """Test suite for CachingParser class."""
+
+    def test_repeated_parse_uses_memory_cache(self, temp_dir):
+        """Test that parsing the same file twice invokes the parser once."""
+        doc_file = temp_dir / "doc.docx"
+        doc_file.write_text("Hello", encoding="utf-8")
+        inner = CountingParser()
+        parser = CachingParser(inner, cache_dir=str(temp_dir / "cache"))
+
+        first = parser.parse(str(doc_file))
+        second = parser.parse(str(doc_file))
+
+        assert inner.calls == 1
+        assert second.sections[0].heading.text == first.sections[0].heading.text
+
+    def test_changed_content_is_reparsed(self, temp_dir):
+        """Test that modifying the file contents invalidates the cache."""
+        doc_file = temp_dir / "doc.docx"
+        doc_file.write_text("Before", encoding="utf-8")
+        inner = CountingParser()
+        parser = CachingParser(inner, cache_dir=str(temp_dir / "cache"))
+
+        parser.parse(str(doc_file))
+        doc_file.write_text("After", encoding="utf-8")
+        result = parser.parse(str(doc_file))
+
+        assert inner.calls == 2
+        assert result.sections[0].heading.text == "After"
+
+    def test_disk_cache_survives_memory_clear(self, temp_dir):
+        """Test that results are reloaded from disk after the memory layer is cleared."""
+        doc_file = temp_dir / "doc.docx"
+        doc_file.write_text("Persisted", encoding="utf-8")
+        cache_dir = temp_dir / "cache"
+
+        CachingParser(CountingParser(), cache_dir=str(cache_dir)).parse(str(doc_file))
+        clear_memory_cache()
+
+        inner = CountingParser()
+        result = CachingParser(inner, cache_dir=str(cache_dir)).parse(str(doc_file))
+
+        assert inner.calls == 0
+        assert result.sections[0].heading.text == "Persisted"
+        assert list(cache_dir.glob("*.pkl"))
+
+    def test_expired_disk_entry_is_ignored(self, temp_dir):
+        """Test that on-disk entries older than the TTL are treated as misses."""
+        doc_file = temp_dir / "doc.docx"
+        doc_file.write_text("Stale", encoding="utf-8")
+        cache_dir = temp_dir / "cache"
+
+        CachingParser(CountingParser(), cache_dir=str(cache_dir)).parse(str(doc_file))
+        clear_memory_cache()
+
+        inner = CountingParser()
+        CachingParser(inner, cache_dir=str(cache_dir), ttl_seconds=-1).parse(str(doc_file))
+
+        assert inner.calls == 1
+
+    def test_image_data_restored_on_hit(self, temp_dir):
+        """Test that parser image data is available after a cache hit."""
+        doc_file = temp_dir / "doc.docx"
+        doc_file.write_text("Images", encoding="utf-8")
+        cache_dir = temp_dir / "cache"
+
+        CachingParser(CountingParser(), cache_dir=str(cache_dir)).parse(str(doc_file))
+
+        parser = CachingParser(CountingParser(), cache_dir=str(cache_dir))
+        parser.parse(str(doc_file))
+
+        assert parser._image_data == [("image", b"bytes")]
+
+    def test_image_data_reset_on_hit_without_images(self, temp_dir):
+        """Test that a hit for an image-less file clears stale image data."""
+        doc_file = temp_dir / "doc.docx"
+        doc_file.write_text("No images", encoding="utf-8")
+        parser = CachingParser(CountingParser(), cache_dir=str(temp_dir / "cache"))
+        parser._memory_put(parser.cache_key(str(doc_file)), (InternalDocument(), None))
+        parser.parser._image_data = [("stale", b"bytes")]
+
+        parser.parse(str(doc_file))
+
+        assert parser._image_data is None
+
+    def test_hits_do_not_share_mutable_state(self, temp_dir):
+        """Test that in-place updates to a parse result never reach later hits."""
+        doc_file = temp_dir / "doc.docx"
+        doc_file.write_text("Images", encoding="utf-8")
+        parser = CachingParser(CountingParser(), cache_dir=str(temp_dir / "cache"))
+        image = ImageReference(source_path="image1.png")
+        parser._memory_put(
+            parser.cache_key(str(doc_file)),
+            (InternalDocument(images=[image]), [(image, b"bytes")])
+        )
+
+        first = parser.parse(str(doc_file))
+        first.images[0].ocr_text = "OCR from the first run"
+        parser._image_data[0][0].extracted_path = "first/images/image_001.png"
+        second = parser.parse(str(doc_file))
+
+        assert second.images[0].ocr_text is None
+        assert parser._image_data[0][0].extracted_path is None
+        assert image.ocr_text is None and image.extracted_path is None
+
+    def test_miss_result_is_not_the_cached_object(self, temp_dir):
+        """Test that mutating the result of a miss leaves the cached entry intact."""
+        doc_file = temp_dir / "doc.docx"
+        doc_file.write_text("Original", encoding="utf-8")
+        parser = CachingParser(CountingParser(), cache_dir=str(temp_dir / "cache"))
+
+        parser.parse(str(doc_file)).sections[0].heading.text = "Changed"
+
+        assert parser.parse(str(doc_file)).sections[0].heading.text == "Original"
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions only")
+    def test_cache_dir_created_private(self, temp_dir):
+        """Test that the disk cache directory is only accessible to its owner."""
+        cache_dir = temp_dir / "cache"
+        doc_file = temp_dir / "doc.docx"
+        doc_file.write_text("Private", encoding="utf-8")
+
+        CachingParser(CountingParser(), cache_dir=str(cache_dir)).parse(str(doc_file))
+
+        assert cache_dir.stat().st_mode & 0o777 == 0o700
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions only")
+    def test_shared_cache_dir_is_not_trusted(self, temp_dir):
+        """Test that entries in a group or world writable directory are never loaded."""
+        cache_dir = temp_dir / "cache"
+        cache_dir.mkdir()
+        cache_dir.chmod(0o777)
+        doc_file = temp_dir / "doc.docx"
+        doc_file.write_text("Planted", encoding="utf-8")
+        inner = CountingParser()
+        parser = CachingParser(inner, cache_dir=str(cache_dir))
+        planted = (InternalDocument(metadata=DocumentMetadata(title="planted")), None)
+        (cache_dir / f"{parser.cache_key(str(doc_file))}.pkl").write_bytes(pickle.dumps(planted))
+
+        result = parser.parse(str(doc_file))
+
+        assert inner.calls == 1
+        assert result.metadata.title != "planted"
+
+    def test_memory_cache_is_bounded(self, temp_dir):
+        """Test that the in-memory layer evicts least recently used entries."""
+        inner = CountingParser()
+        parser = CachingParser(inner, cache_dir=str(temp_dir / "cache"), memory_size=1)
+        first = temp_dir / "first.docx"
+        second = temp_dir / "second.docx"
+        first.write_text("First", encoding="utf-8")
+        second.write_text("Second", encoding="utf-8")
+
+        parser.parse(str(first))
+        parser.parse(str(second))
+        (temp_dir / "cache").rename(temp_dir / "moved")  # Force disk misses
+        parser.parse(str(first))
+
+        assert inner.calls == 3
+
+    def test_cache_key_depends_only_on_content(self, temp_dir):
+        """Test that identical files share a key and empty files are hashable."""
+        first = temp_dir / "first.docx"
+        second = temp_dir / "second.docx"
+        empty = temp_dir / "empty.docx"
+        first.write_bytes(b"same bytes" * 1000)
+        second.write_bytes(b"same bytes" * 1000)
+        empty.write_bytes(b"")
+        parser = CachingParser(CountingParser(), cache_dir=str(temp_dir / "cache"))
+
+        assert parser.cache_key(str(first)) == parser.cache_key(str(second))
+        assert parser.cache_key(str(empty)) != parser.cache_key(str(first))
+
+    def test_cache_key_depends_on_options(self, temp_dir):
+        """Test that results cached under different options are not reused."""
+        doc_file = temp_dir / "doc.docx"
+        doc_file.write_text("Options", encoding="utf-8")
+        cache_dir = str(temp_dir / "cache")
+        with_ocr = CachingParser(CountingParser(), cache_dir=cache_dir, options={"enable_ocr": True})
+        without_ocr = CachingParser(CountingParser(), cache_dir=cache_dir, options={"enable_ocr": False})
+
+        assert with_ocr.cache_key(str(doc_file)) != without_ocr.cache_key(str(doc_file))
+
+    def test_default_cache_dir_follows_xdg_cache_home(self, temp_dir, monkeypatch):
+        """Test that the user cache directory is preferred when configured."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(temp_dir))
+        assert CachingParser(CountingParser()).cache_dir == temp_dir / "doc2md" / "ast-cache"
+
+        monkeypatch.delenv("XDG_CACHE_HOME")
+        assert default_cache_dir() == DEFAULT_CACHE_DIR
+        assert DEFAULT_CACHE_DIR.is_relative_to(Path.home())
+
+
+class TestParseCacheWiring:
+    """Tests for enabling the parse cache through configuration."""
+
+    def test_router_wraps_parsers_when_enabled(self):
+        """Test that FormatRouter returns caching parsers when requested."""
+        router = FormatRouter(enable_cache=True)
+        assert isinstance(router.get_parser(FileFormat.DOCX), CachingParser)
+
+    def test_router_returns_plain_parsers_by_default(self):
+        """Test that caching is disabled by default."""
+        router = FormatRouter()
+        assert not isinstance(router.get_parser(FileFormat.DOCX), CachingParser)
+
+    def test_orchestrator_honours_config_flag(self):
+        """Test that ConversionOrchestrator enables the cache from configuration."""
+        config = ConversionConfig(input_path="", enable_parse_cache=True)
+        orchestrator = ConversionOrchestrator(config=config, logger=Logger(log_level=LogLevel.ERROR))
+        parser = orchestrator.router.get_parser(FileFormat.XLSX)
+        assert isinstance(parser, CachingParser)
+        assert parser.options == cache_options(config)
+        assert set(parser.options) == set(CACHE_CONFIG_FIELDS)
@@ -53,6 +53,26 @@ class TestPDFParserBasic:
         except ImportError:
             pytest.skip("reportlab not installed, skipping PDF creation test")
     
+    def test_iter_pages_yields_one_section_per_page(self, temp_dir):
+        """Test that pages are streamed as sections in page order."""
+        try:
+            from reportlab.pdfgen import canvas
+            from reportlab.lib.pagesizes import letter
+        except ImportError:
+            pytest.skip("reportlab not installed, skipping page streaming test")
+        
+        pdf_path = temp_dir / "pages.pdf"
+        c = canvas.Canvas(str(pdf_path), pagesize=letter)
+        for page in range(3):
+            c.drawString(100, 700, f"Content of page number {page + 1}.")
+            c.showPage()
+        c.save()
+        
+        pages = PDFParser().iter_pages(str(pdf_path))
+        
+        assert not isinstance(pages, list)
+        assert [section.heading.text for section in pages] == ["Page 1", "Page 2", "Page 3"]
+    
     def test_pdf_parser_metadata_extraction(self, temp_dir):
         """Test that PDF metadata is extracted correctly."""
         try:
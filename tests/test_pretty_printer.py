@@ -112,19 +112,19 @@ class TestPrettyPrinter:
         """Test table row detection."""
         printer = PrettyPrinter()
         
-        assert printer._is_table_row("| Col1 | Col2 |")
-        assert printer._is_table_row("| --- | --- |")
-        assert not printer._is_table_row("Regular text")
-        assert not printer._is_table_row("# Heading")
+        assert printer.is_table_row("| Col1 | Col2 |")
+        assert printer.is_table_row("| --- | --- |")
+        assert not printer.is_table_row("Regular text")
+        assert not printer.is_table_row("# Heading")
     
     def test_parse_table_row(self):
         """Test table row parsing."""
         printer = PrettyPrinter()
         
-        cells = printer._parse_table_row("| Name | Age | City |")
+        cells = printer.parse_table_row("| Name | Age | City |")
         assert cells == ["Name", "Age", "City"]
         
-        cells = printer._parse_table_row("| Alice | 30 | NYC |")
+        cells = printer.parse_table_row("| Alice | 30 | NYC |")
         assert cells == ["Alice", "30", "NYC"]
     
     def test_is_separator_cell(self):
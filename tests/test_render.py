@@ -0,0 +1,142 @@
+"""Unit tests for the single-pass MarkdownRenderer."""
+
+import io
+
+import pytest
+
+from src.config import ConversionConfig
+from src.conversion_orchestrator import ConversionOrchestrator
+from src.internal_representation import (
+    InternalDocument, DocumentMetadata, Section, Heading, Paragraph, Table,
+    DocumentList, ListItem, CodeBlock, Link
+)
+from src.logger import Logger, LogLevel
+from src.markdown_serializer import MarkdownSerializer
+from src.pretty_printer import PrettyPrinter
+from src.render import MarkdownRenderer
+
+
+def render(document, serializer=None):
+    renderer = MarkdownRenderer(serializer or MarkdownSerializer())
+    out = io.StringIO()
+    renderer.render(document, out)
+    return out.getvalue()
+
+
+def legacy(document, serializer=None):
+    serializer = serializer or MarkdownSerializer()
+    return PrettyPrinter().format(serializer.serialize(document))
+
+
+@pytest.fixture
+def mixed_document():
+    return InternalDocument(
+        metadata=DocumentMetadata(title="Report", author="Tester", source_format="docx"),
+        sections=[
+            Section(
+                heading=Heading(level=1, text="Title"),
+                content=[
+                    Paragraph(text="Intro paragraph   "),
+                    Table(headers=["Name", "Qty"], rows=[["Widget A", "100"], ["B", ""], ["Long name"]]),
+                    DocumentList(ordered=False, items=[ListItem(text="one"), ListItem(text="two", level=1)]),
+                    CodeBlock(code="x = 1\ny = 2", language="python"),
+                ]
+            ),
+            Section(
+                heading=None,
+                content=[
+                    Paragraph(text="Orphan paragraph\n\n\n2023. with a number"),
+                    Link(text="site", url="https://example.com/a b"),
+                ]
+            ),
+            Section(
+                heading=Heading(level=2, text="Data"),
+                content=[Table(headers=[], rows=[["a", "b"], ["ccc"]])]
+            ),
+        ]
+    )
+
+
+class TestMarkdownRenderer:
+    """Test suite for MarkdownRenderer class."""
+
+    def test_matches_serializer_and_pretty_printer(self, mixed_document):
+        """Test that single-pass output equals the two-stage pipeline."""
+        assert render(mixed_document) == legacy(mixed_document)
+
+    def test_matches_with_offset_and_metadata(self, mixed_document):
+        """Test parity when heading offset and metadata are enabled."""
+        serializer = MarkdownSerializer(heading_offset=1, include_metadata=True)
+        assert render(mixed_document, serializer) == legacy(mixed_document, serializer)
+
+    def test_empty_document(self):
+        """Test that an empty document renders as a single newline."""
+        document = InternalDocument(metadata=DocumentMetadata(), sections=[])
+        assert render(document) == legacy(document) == "\n"
+
+    def test_table_columns_are_aligned(self):
+        """Test that table rows are padded to common column widths."""
+        document = InternalDocument(sections=[
+            Section(content=[Table(headers=["A", "Longer"], rows=[["value", "x"]])])
+        ])
+
+        assert render(document).splitlines() == [
+            "| A     | Longer |",
+            "| ----- | ------ |",
+            "| value | x      |",
+        ]
+
+    def test_escaped_pipe_stays_in_one_cell(self):
+        """Test that pipes inside cells do not split columns."""
+        document = InternalDocument(sections=[
+            Section(content=[Table(headers=["Expr"], rows=[["a|b"]])])
+        ])
+
+        lines = render(document).splitlines()
+
+        assert lines[2] == "| a\\|b |"
+        assert len(lines[1].split("|")) == 3
+
+    def test_differs_from_legacy_only_in_tables_with_escaped_pipes(self):
+        """Test the documented difference from the two-stage pipeline.
+
+        The legacy pretty printer re-parses serialized rows and splits an
+        escaped pipe into two cells; the renderer keeps the cell intact.
+        Everything outside the affected table is identical.
+        """
+        document = InternalDocument(sections=[
+            Section(heading=Heading(level=1, text="Pipes"), content=[
+                Paragraph(text="Before"),
+                Table(headers=["Expr", "Value"], rows=[["a|b", "1"], ["c", "2"]]),
+                Paragraph(text="After"),
+            ])
+        ])
+
+        new_lines = render(document).splitlines()
+        old_lines = legacy(document).splitlines()
+        differing = [i for i, (new, old) in enumerate(zip(new_lines, old_lines)) if new != old]
+
+        assert len(new_lines) == len(old_lines)
+        assert differing == [6]
+        assert new_lines[6] == "| a\\|b | 1     |"
+        assert old_lines[6] == "| a\\   | b     | 1 |"
+
+
+class TestRendererWiring:
+    """Tests for selecting the renderer in ConversionOrchestrator."""
+
+    @pytest.mark.parametrize("legacy_serializer", [False, True])
+    def test_conversion_output_matches(self, tmp_path, simple_docx_path, legacy_serializer):
+        """Test that both serializer paths produce the same Markdown."""
+        config = ConversionConfig(
+            input_path=str(simple_docx_path),
+            output_path=str(tmp_path / "out.md"),
+            legacy_serializer=legacy_serializer
+        )
+        orchestrator = ConversionOrchestrator(config=config, logger=Logger(log_level=LogLevel.ERROR))
+
+        result = orchestrator.convert(str(simple_docx_path))
+
+        assert result.success
+        assert result.markdown_content == (tmp_path / "out.md").read_text(encoding="utf-8")
+        assert result.markdown_content.startswith("# Word Document\n")
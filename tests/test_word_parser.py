@@ -5,6 +5,8 @@ This module contains unit tests for the WordParser class to verify
 Word document parsing functionality.
 """
 
+import io
+
 import pytest
 from docx import Document
 from docx.shared import Pt, Inches
@@ -19,30 +21,33 @@ from src.internal_representation import (
 )
 
 
+def parse_in_memory(doc):
+    """Save a python-docx Document to memory and parse it with WordParser."""
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    buffer.seek(0)
+    return WordParser().parse_stream(buffer)
+
+
 class TestWordParserBasic:
     """Test basic WordParser functionality."""
     
-    def test_parse_simple_document(self, tmp_path):
+    def test_parse_simple_document(self):
         """Test parsing a simple Word document with text."""
         # Create a simple Word document
         doc = Document()
         doc.add_paragraph("This is a test paragraph.")
         doc.add_paragraph("This is another paragraph.")
         
-        # Save to temporary file
-        file_path = tmp_path / "test.docx"
-        doc.save(str(file_path))
-        
-        # Parse the document
-        parser = WordParser()
-        result = parser.parse(str(file_path))
+        # Parse the document from memory
+        result = parse_in_memory(doc)
         
         # Verify result
         assert isinstance(result, InternalDocument)
         assert len(result.sections) > 0
         assert result.metadata.source_format == "docx"
     
-    def test_parse_document_with_headings(self, tmp_path):
+    def test_parse_document_with_headings(self):
         """Test parsing a document with headings."""
         # Create document with headings
         doc = Document()
@@ -51,13 +56,8 @@ class TestWordParserBasic:
         doc.add_heading("Heading 2", level=2)
         doc.add_paragraph("Content under heading 2")
         
-        # Save to temporary file
-        file_path = tmp_path / "test_headings.docx"
-        doc.save(str(file_path))
-        
-        # Parse the document
-        parser = WordParser()
-        result = parser.parse(str(file_path))
+        # Parse the document from memory
+        result = parse_in_memory(doc)
         
         # Verify headings were extracted
         assert len(result.sections) >= 2
@@ -65,7 +65,7 @@ class TestWordParserBasic:
         assert result.sections[0].heading.level == 1
         assert "Heading 1" in result.sections[0].heading.text
     
-    def test_parse_document_with_table(self, tmp_path):
+    def test_parse_document_with_table(self):
         """Test parsing a document with a table."""
         # Create document with table
         doc = Document()
@@ -84,13 +84,8 @@ class TestWordParserBasic:
             row_cells[1].text = f"Row {i} Col 2"
             row_cells[2].text = f"Row {i} Col 3"
         
-        # Save to temporary file
-        file_path = tmp_path / "test_table.docx"
-        doc.save(str(file_path))
-        
-        # Parse the document
-        parser = WordParser()
-        result = parser.parse(str(file_path))
+        # Parse the document from memory
+        result = parse_in_memory(doc)
         
         # Verify table was extracted
         assert len(result.sections) > 0
@@ -100,7 +95,25 @@ class TestWordParserBasic:
         assert len(tables[0].headers) == 3
         assert len(tables[0].rows) == 2
     
-    def test_parse_document_with_formatting(self, tmp_path):
+    def test_parse_table_with_merged_and_multiline_cells(self):
+        """Test that merged cells repeat their text like python-docx row cells."""
+        doc = Document()
+        table = doc.add_table(rows=3, cols=3)
+        for i, cell in enumerate(table._cells):
+            cell.text = f"c{i}"
+        table.cell(0, 0).merge(table.cell(0, 1))
+        table.cell(1, 2).merge(table.cell(2, 2))
+        table.cell(2, 0).paragraphs[0].add_run().add_tab()
+        table.cell(2, 0).add_paragraph("second")
+        
+        result = parse_in_memory(doc)
+        table_obj = [item for item in result.sections[0].content if isinstance(item, Table)][0]
+        
+        expected = [[cell.text.strip() for cell in row.cells] for row in table.rows]
+        assert [table_obj.headers] + table_obj.rows == expected
+        assert table_obj.rows[1][0] == "c6\t\nsecond"
+    
+    def test_parse_document_with_formatting(self):
         """Test parsing a document with text formatting."""
         # Create document with formatted text
         doc = Document()
@@ -112,13 +125,8 @@ class TestWordParserBasic:
         run2 = para2.add_run("Italic text")
         run2.italic = True
         
-        # Save to temporary file
-        file_path = tmp_path / "test_formatting.docx"
-        doc.save(str(file_path))
-        
-        # Parse the document
-        parser = WordParser()
-        result = parser.parse(str(file_path))
+        # Parse the document from memory
+        result = parse_in_memory(doc)
         
         # Verify formatting was detected
         assert len(result.sections) > 0
@@ -132,23 +140,27 @@ class TestWordParserBasic:
         )
         assert has_formatting
     
-    def test_parse_empty_document(self, tmp_path):
+    def test_parse_empty_document(self):
         """Test parsing an empty Word document."""
         # Create empty document
         doc = Document()
         
-        # Save to temporary file
-        file_path = tmp_path / "test_empty.docx"
-        doc.save(str(file_path))
-        
-        # Parse the document
-        parser = WordParser()
-        result = parser.parse(str(file_path))
+        # Parse the document from memory
+        result = parse_in_memory(doc)
         
         # Verify result
         assert isinstance(result, InternalDocument)
         assert result.metadata.source_format == "docx"
     
+    def test_parse_stream_matches_parse(self, simple_docx_path):
+        """Test that parsing from a stream gives the same result as from a path."""
+        parser = WordParser()
+        
+        with open(simple_docx_path, "rb") as f:
+            from_stream = parser.parse_stream(f)
+        
+        assert from_stream == parser.parse(simple_docx_path)
+    
     def test_parse_nonexistent_file(self):
         """Test parsing a nonexistent file raises an error."""
         parser = WordParser()
@@ -160,7 +172,7 @@ class TestWordParserBasic:
 class TestWordParserMetadata:
     """Test metadata extraction."""
     
-    def test_extract_metadata(self, tmp_path):
+    def test_extract_metadata(self):
         """Test that metadata is extracted correctly."""
         # Create document with metadata
         doc = Document()
@@ -168,13 +180,8 @@ class TestWordParserMetadata:
         doc.core_properties.author = "Test Author"
         doc.add_paragraph("Content")
         
-        # Save to temporary file
-        file_path = tmp_path / "test_metadata.docx"
-        doc.save(str(file_path))
-        
-        # Parse the document
-        parser = WordParser()
-        result = parser.parse(str(file_path))
+        # Parse the document from memory
+        result = parse_in_memory(doc)
         
         # Verify metadata
         assert result.metadata.title == "Test Document"